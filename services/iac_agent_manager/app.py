@@ -326,27 +326,6 @@ async def _initialize_redis_connection() -> redis.Redis:
     return redis_instance
 
 
-def _initialize_minio_client() -> Optional[Minio]:
-    """Initialize MinIO client with configuration.
-
-    Returns:
-        Configured MinIO client instance or None if Minio not available
-    """
-    if Minio is None:
-        logger.warning("MinIO library not available")
-        return None
-
-    minio_instance = Minio(
-        config.minio.endpoint,
-        access_key=config.minio.access_key,
-        secret_key=config.minio.secret_key,
-        region=config.minio.region,
-        secure=config.minio.use_tls,
-    )
-    logger.info("MinIO client initialized", endpoint=config.minio.endpoint)
-    return minio_instance
-
-
 def _initialize_vault_client() -> hvac.Client:
     """Initialize and authenticate Vault client.
 
@@ -397,15 +376,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # Initialize Redis connection with health check
         redis_client = await _initialize_redis_connection()
 
-        # Initialize MinIO client for object storage
-        minio_client = _initialize_minio_client()
-
         # Initialize State Backend for Terraform state operations
         state_backend = StateBackend(config.minio, config)
         logger.info("State backend initialized")
 
+        # Share the backend's MinIO client (and its connection pool) for
+        # backup and bucket operations
+        minio_client = state_backend.client
+
         # Initialize State Locker for distributed locking
         state_locker = StateLocker(redis_client, config.redis)
+        state_locker.start_reaper()
         logger.info("State locker initialized")
 
         # Initialize Vault client for secrets management
@@ -422,6 +403,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     finally:
         # Graceful shutdown with resource cleanup
         logger.info("Shutting down State Management Service")
+        if state_locker:
+            await state_locker.stop_reaper()
         if redis_client:
             await redis_client.close()
 
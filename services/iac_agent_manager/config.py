@@ -26,6 +26,15 @@ class RedisConfig(BaseModel):
         default=None,
         description="Socket keepalive options (automatically configured based on OS)",
     )
+    scan_count: int = Field(
+        default=1000,
+        description="COUNT hint for SCAN when enumerating lock keys",
+        ge=1,
+        le=100000,
+    )
+    lock_reaper_interval: int = Field(
+        default=30, description="Seconds between expired lock sweeps", ge=1
+    )
 
     @classmethod
     def _get_linux_keepalive_options(cls) -> Dict[int, int]:
@@ -102,6 +111,15 @@ class MinIOConfig(BaseModel):
     encryption_enabled: bool = Field(
         default=True, description="Enable server-side encryption"
     )
+    http_pool_size: int = Field(
+        default=32,
+        description="Maximum pooled HTTP connections per MinIO host",
+        ge=1,
+        le=256,
+    )
+    http_timeout_seconds: int = Field(
+        default=300, description="MinIO connect/read timeout in seconds", ge=1
+    )
 
 
 class VaultConfig(BaseModel):
@@ -267,6 +285,8 @@ def load_config() -> ServiceConfig:
         password=os.getenv("REDIS_PASSWORD"),
         ssl=os.getenv("REDIS_SSL", "false").lower() == "true",
         socket_keepalive=os.getenv("REDIS_SOCKET_KEEPALIVE", "true").lower() == "true",
+        scan_count=int(os.getenv("REDIS_SCAN_COUNT", "1000")),
+        lock_reaper_interval=int(os.getenv("REDIS_LOCK_REAPER_INTERVAL", "30")),
         # socket_keepalive_options will be automatically configured by the validator
     )
 
@@ -278,6 +298,8 @@ def load_config() -> ServiceConfig:
         region=os.getenv("MINIO_REGION", "us-east-1"),
         use_tls=os.getenv("MINIO_USE_TLS", "false").lower() == "true",
         bucket_prefix=os.getenv("MINIO_BUCKET_PREFIX", "terraform-state"),
+        http_pool_size=int(os.getenv("MINIO_HTTP_POOL_SIZE", "32")),
+        http_timeout_seconds=int(os.getenv("MINIO_HTTP_TIMEOUT", "300")),
     )
 
     # Vault configuration
@@ -3,13 +3,31 @@ MinIO S3-Compatible State Backend Integration
 Production-ready state storage with versioning, encryption, and backup capabilities
 """
 
-from datetime import datetime
+import asyncio
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 import hashlib
 import io
-import json
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import islice
+import os
+import threading
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from uuid import uuid4
+import zlib
 
+import certifi
 from config import MinIOConfig, ServiceConfig
 from exceptions import (
     BackendError,
@@ -21,7 +39,10 @@ from exceptions import (
     VersionNotFoundError,
 )
 from minio import Minio
+from minio.commonconfig import REPLACE, CopySource
+from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
+from minio.helpers import MAX_MULTIPART_COUNT, ObjectWriteResult
 from models import (
     Environment,
     OperationType,
@@ -30,10 +51,43 @@ from models import (
     StateStatus,
     StateVersion,
 )
+import orjson
 import structlog
+import urllib3
 
 logger = structlog.get_logger(__name__)
 
+# Stored state metadata was validated when written, so it is rebuilt without
+# re-running validation
+_STATE_METADATA_CONSTRUCT = StateMetadata.model_construct
+
+# Read size used when streaming object bodies from MinIO
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Slice size used when feeding large buffers to SHA-256
+CHECKSUM_CHUNK_SIZE = 1 << 20
+
+# States larger than this are verified as independently hashed chunks
+VERIFY_CHUNK_SIZE = 8 << 20
+
+# Concurrent GETs used when fetching version metadata
+METADATA_FETCH_WORKERS = 16
+
+# State bodies are stored gzip-compressed; level 3 balances CPU against ratio
+STATE_COMPRESSION_LEVEL = 3
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+# Maximum number of parsed version metadata documents cached per backend
+VERSION_METADATA_CACHE_SIZE = 4096
+
+# Maximum keys per DeleteObjects request
+DELETE_BATCH_SIZE = 1000
+
+# Bodies above the threshold are uploaded as parallel multipart uploads
+MULTIPART_THRESHOLD = 64 << 20
+MULTIPART_PART_SIZE = 8 << 20
+MULTIPART_PARALLEL_UPLOADS = 6
+
 
 class StateBackend:
     """MinIO S3-compatible backend for Terraform state storage"""
@@ -48,9 +102,41 @@ class StateBackend:
         self.config = config
         self.service_config = service_config
         self._client: Optional[Minio] = None
+        self._known_buckets: Set[str] = set()
+        self._bucket_lock = threading.Lock()
+        # Version metadata is immutable once written, so entries never go stale
+        self._version_metadata_cache: OrderedDict[
+            Tuple[str, str, str], Dict[str, Any]
+        ] = OrderedDict()
+        self._version_metadata_lock = threading.Lock()
 
         self._initialize_client()
 
+    def _build_http_client(self) -> urllib3.PoolManager:
+        """Build the pooled HTTP client shared by all MinIO requests
+
+        The pool is sized for the concurrent metadata fetches, batch deletes
+        and overlapped uploads issued by this backend, so parallel requests
+        reuse connections instead of opening new ones.
+
+        Returns:
+            Configured urllib3 pool manager
+        """
+        timeout = self.config.http_timeout_seconds
+        return urllib3.PoolManager(
+            num_pools=4,
+            maxsize=self.config.http_pool_size,
+            block=False,
+            timeout=urllib3.Timeout(connect=timeout, read=timeout),
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+            retries=urllib3.Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504],
+            ),
+        )
+
     def _initialize_client(self) -> None:
         """Initialize MinIO client"""
         try:
@@ -60,8 +146,13 @@ class StateBackend:
                 secret_key=self.config.secret_key,
                 region=self.config.region,
                 secure=self.config.use_tls,
+                http_client=self._build_http_client(),
+            )
+            logger.info(
+                "MinIO client initialized",
+                endpoint=self.config.endpoint,
+                http_pool_size=self.config.http_pool_size,
             )
-            logger.info("MinIO client initialized", endpoint=self.config.endpoint)
         except Exception as e:
             logger.error("Failed to initialize MinIO client", error=str(e))
             raise MinIOConnectionError(f"Failed to initialize MinIO client: {str(e)}")
@@ -126,16 +217,204 @@ class StateBackend:
             return f"{workspace}/versions/{version_id}/metadata.json"
         return f"{workspace}/metadata.json"
 
-    def _calculate_checksum(self, data: bytes) -> str:
+    def _calculate_checksum(
+        self, data: Union[bytes, memoryview, Iterable[bytes]]
+    ) -> str:
         """Calculate SHA256 checksum
 
+        Buffers are hashed through a memoryview in CHECKSUM_CHUNK_SIZE slices,
+        so no copies are made and each update stays cache-resident.
+
         Args:
-            data: Data to checksum
+            data: Data to checksum, either a buffer or an iterable of chunks
 
         Returns:
             Hex-encoded checksum
         """
-        return hashlib.sha256(data).hexdigest()
+        hasher = hashlib.sha256()
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            view = memoryview(data)
+            for offset in range(0, len(view), CHECKSUM_CHUNK_SIZE):
+                hasher.update(view[offset : offset + CHECKSUM_CHUNK_SIZE])
+        else:
+            for chunk in data:
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def _compress_state(self, state_data: bytes) -> Tuple[bytes, str]:
+        """Gzip-compress state data and checksum it in a single pass
+
+        Args:
+            state_data: Raw state data
+
+        Returns:
+            Tuple of (compressed data, hex-encoded checksum of the raw data)
+        """
+        hasher = hashlib.sha256()
+        compressor = zlib.compressobj(
+            STATE_COMPRESSION_LEVEL, zlib.DEFLATED, GZIP_WBITS
+        )
+        view = memoryview(state_data)
+        parts = []
+        for offset in range(0, len(view), CHECKSUM_CHUNK_SIZE):
+            chunk = view[offset : offset + CHECKSUM_CHUNK_SIZE]
+            hasher.update(chunk)
+            parts.append(compressor.compress(chunk))
+        parts.append(compressor.flush())
+        return b"".join(parts), hasher.hexdigest()
+
+    def _get_upload_options(self, length: int) -> Dict[str, int]:
+        """Get put_object multipart options for a body of the given length
+
+        Args:
+            length: Body length in bytes
+
+        Returns:
+            Keyword arguments for put_object
+        """
+        if length <= MULTIPART_THRESHOLD:
+            return {}
+        # Grow the part size if needed to stay within the S3 part count limit
+        part_size = max(MULTIPART_PART_SIZE, -(-length // MAX_MULTIPART_COUNT))
+        return {
+            "part_size": part_size,
+            "num_parallel_uploads": MULTIPART_PARALLEL_UPLOADS,
+        }
+
+    def _put_compressed_state(
+        self, bucket_name: str, key: str, compressed_data: bytes
+    ) -> ObjectWriteResult:
+        """Upload gzip-compressed state data
+
+        Args:
+            bucket_name: Bucket name
+            key: Object key
+            compressed_data: Gzip-compressed state data
+
+        Returns:
+            Result of the upload, including the object's ETag
+        """
+        # BytesIO shares the bytes object and returns it uncopied when read
+        # whole; MinIO requires read() to return bytes, so a memoryview reader
+        # would force a copy per part instead
+        return self.client.put_object(
+            bucket_name,
+            key,
+            io.BytesIO(compressed_data),
+            length=len(compressed_data),
+            content_type="application/json",
+            metadata={"Content-Encoding": "gzip"},
+            **self._get_upload_options(len(compressed_data)),
+        )
+
+    def _store_state_version(
+        self,
+        bucket_name: str,
+        state_key: str,
+        version_key: str,
+        state_etag: str,
+        compressed_data: bytes,
+    ) -> None:
+        """Store a state version as a server-side copy of the current state
+
+        The copy only succeeds while the current state is still the object
+        with the given ETag. If a concurrent store has replaced it, the
+        version is uploaded from the data instead so it never holds another
+        store's state.
+
+        Args:
+            bucket_name: Bucket name
+            state_key: Current state object key
+            version_key: Version object key
+            state_etag: ETag of the current state written by this store
+            compressed_data: Gzip-compressed state data of this store
+        """
+        try:
+            # Headers are set explicitly so they survive MinIO's switch to a
+            # multipart compose above 5 GiB
+            self.client.copy_object(
+                bucket_name,
+                version_key,
+                CopySource(bucket_name, state_key, match_etag=state_etag),
+                metadata={
+                    "Content-Type": "application/json",
+                    "Content-Encoding": "gzip",
+                },
+                metadata_directive=REPLACE,
+            )
+        except S3Error as e:
+            if e.code != "PreconditionFailed":
+                raise
+            logger.info(
+                "Current state replaced concurrently, uploading version",
+                bucket=bucket_name,
+                version_key=version_key,
+            )
+            self._put_compressed_state(bucket_name, version_key, compressed_data)
+
+    def _checksum_workers(self, chunk_count: int) -> int:
+        """Get worker count for parallel chunk hashing"""
+        return max(1, min(chunk_count, os.cpu_count() or 1))
+
+    def _calculate_chunk_checksums(
+        self, data: bytes, chunk_size: int = VERIFY_CHUNK_SIZE
+    ) -> List[str]:
+        """Calculate SHA256 checksums of fixed-size chunks in parallel
+
+        hashlib releases the GIL while hashing, so chunks are hashed
+        concurrently on a thread pool.
+
+        Args:
+            data: Data to checksum
+            chunk_size: Chunk size in bytes
+
+        Returns:
+            Hex-encoded checksum of each chunk, in order
+        """
+        view = memoryview(data)
+        chunks = [
+            view[offset : offset + chunk_size]
+            for offset in range(0, len(view), chunk_size)
+        ]
+        with ThreadPoolExecutor(
+            max_workers=self._checksum_workers(len(chunks))
+        ) as executor:
+            return list(executor.map(self._calculate_checksum, chunks))
+
+    def _verify_chunk_checksums(
+        self, data: bytes, chunk_hashes: List[str], chunk_size: int
+    ) -> bool:
+        """Verify chunk checksums in parallel, stopping at the first mismatch
+
+        Args:
+            data: Data to verify
+            chunk_hashes: Expected hex-encoded checksum of each chunk
+            chunk_size: Chunk size in bytes
+
+        Returns:
+            True if every chunk matches its expected checksum
+        """
+        view = memoryview(data)
+        offsets = range(0, len(view), chunk_size)
+        if len(offsets) != len(chunk_hashes):
+            return False
+
+        mismatch = threading.Event()
+
+        def verify_chunk(index: int) -> None:
+            if mismatch.is_set():
+                return
+            offset = offsets[index]
+            chunk = view[offset : offset + chunk_size]
+            if self._calculate_checksum(chunk) != chunk_hashes[index]:
+                mismatch.set()
+
+        with ThreadPoolExecutor(
+            max_workers=self._checksum_workers(len(offsets))
+        ) as executor:
+            list(executor.map(verify_chunk, range(len(offsets))))
+
+        return not mismatch.is_set()
 
     def _create_bucket_with_config(self, bucket_name: str) -> None:
         """Create bucket with versioning and encryption configuration"""
@@ -163,10 +442,18 @@ class StateBackend:
         Raises:
             MinIOBucketError: If bucket operations fail
         """
+        # Buckets are never deleted by the backend, so a positive result is final
+        if bucket_name in self._known_buckets:
+            return
+
         try:
-            # Check if bucket exists
-            if not self.client.bucket_exists(bucket_name):
-                self._create_bucket_with_config(bucket_name)
+            with self._bucket_lock:
+                if bucket_name in self._known_buckets:
+                    return
+                # Check if bucket exists
+                if not self.client.bucket_exists(bucket_name):
+                    self._create_bucket_with_config(bucket_name)
+                self._known_buckets.add(bucket_name)
 
         except S3Error as e:
             logger.error(
@@ -194,7 +481,7 @@ class StateBackend:
             StateValidationError: If state format is invalid
         """
         try:
-            state_json = json.loads(state_data.decode("utf-8"))
+            state_json = orjson.loads(state_data)
 
             return StateMetadata(
                 version=state_json.get("version", "unknown"),
@@ -206,7 +493,7 @@ class StateBackend:
                 outputs=state_json.get("outputs", {}),
             )
 
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (orjson.JSONDecodeError, KeyError, TypeError) as e:
             logger.error("Failed to parse state metadata", error=str(e))
             raise StateValidationError(f"Invalid Terraform state format: {str(e)}")
 
@@ -241,52 +528,64 @@ class StateBackend:
         # Ensure bucket exists
         await self._ensure_bucket_exists(bucket_name)
 
-        # Calculate checksum and parse metadata
-        checksum = self._calculate_checksum(state_data)
+        # Parse metadata (the checksum is calculated during upload)
         metadata = self._parse_state_metadata(state_data)
 
+        # Single timestamp shared by the version metadata and StateInfo
+        now = datetime.now(timezone.utc)
+
         # Generate version ID
         version_id = str(uuid4())
         version_key = self._get_version_key(workspace, version_id)
         metadata_key = self._get_metadata_key(workspace, version_id)
 
         try:
-            # Store current state
-            self.client.put_object(
-                bucket_name,
-                state_key,
-                io.BytesIO(state_data),
-                length=len(state_data),
-                content_type="application/json",
+            # Store current state gzip-compressed; the checksum covers the raw
+            # state and is calculated in the same pass as the compression
+            compressed_data, checksum = self._compress_state(state_data)
+            state_result = self._put_compressed_state(
+                bucket_name, state_key, compressed_data
             )
 
-            # Store versioned state
-            self.client.put_object(
-                bucket_name,
-                version_key,
-                io.BytesIO(state_data),
-                length=len(state_data),
-                content_type="application/json",
-            )
-
-            # Store version metadata
+            # Build version metadata
             version_metadata = {
                 "version_id": version_id,
                 "checksum": checksum,
                 "size_bytes": len(state_data),
-                "created_at": datetime.utcnow().isoformat(),
+                "compressed": True,
+                "compressed_size_bytes": len(compressed_data),
+                "created_at": now.isoformat(),
                 "created_by": created_by,
                 "operation_type": operation_type.value,
                 "state_metadata": metadata.dict(),
             }
+            if len(state_data) > VERIFY_CHUNK_SIZE:
+                version_metadata["chunk_size"] = VERIFY_CHUNK_SIZE
+                version_metadata["chunk_hashes"] = self._calculate_chunk_checksums(
+                    state_data
+                )
 
-            metadata_json = json.dumps(version_metadata).encode("utf-8")
-            self.client.put_object(
-                bucket_name,
-                metadata_key,
-                io.BytesIO(metadata_json),
-                length=len(metadata_json),
-                content_type="application/json",
+            metadata_json = orjson.dumps(version_metadata)
+
+            # Store versioned state (server-side copy of the current state) and
+            # version metadata concurrently
+            await asyncio.gather(
+                asyncio.to_thread(
+                    self._store_state_version,
+                    bucket_name,
+                    state_key,
+                    version_key,
+                    state_result.etag,
+                    compressed_data,
+                ),
+                asyncio.to_thread(
+                    self.client.put_object,
+                    bucket_name,
+                    metadata_key,
+                    io.BytesIO(metadata_json),
+                    length=len(metadata_json),
+                    content_type="application/json",
+                ),
             )
 
             # Create StateInfo
@@ -298,8 +597,8 @@ class StateBackend:
                 checksum=checksum,
                 encrypted=self.config.encryption_enabled,
                 metadata=metadata,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                created_at=now,
+                updated_at=now,
                 version_count=await self._get_version_count(
                     backend_id, workspace, environment
                 ),
@@ -359,18 +658,24 @@ class StateBackend:
         backend_id: str,
         workspace: str,
         version_id: Optional[str] = None,
-    ) -> bytes:
+        compute_checksum: bool = True,
+    ) -> Tuple[bytes, Optional[str]]:
         """Fetch state data from MinIO
 
+        The object body is streamed in fixed-size chunks, decompressed on the
+        fly if it was stored gzip-encoded and, unless disabled, hashed as it is
+        read so the checksum does not need a second pass.
+
         Args:
             bucket_name: Bucket name
             state_key: State object key
             backend_id: Backend identifier
             workspace: Workspace name
             version_id: Optional version identifier
+            compute_checksum: Whether to hash the body while streaming
 
         Returns:
-            State data bytes
+            Tuple of (state data bytes, hex-encoded checksum or None)
 
         Raises:
             StateNotFoundError: If state doesn't exist
@@ -378,10 +683,6 @@ class StateBackend:
         """
         try:
             response = self.client.get_object(bucket_name, state_key)
-            state_data: bytes = response.read()
-            response.close()
-            response.release_conn()
-            return state_data
         except S3Error as e:
             if e.code == "NoSuchKey":
                 if version_id:
@@ -390,46 +691,72 @@ class StateBackend:
                     raise StateNotFoundError(backend_id, workspace)
             raise
 
-    def _fetch_and_parse_metadata(
-        self, bucket_name: str, metadata_key: str, state_data: bytes
-    ) -> Tuple[StateMetadata, Dict[str, Any]]:
-        """Fetch and parse metadata from MinIO
+        try:
+            hasher = hashlib.sha256() if compute_checksum else None
+            decompressor = (
+                zlib.decompressobj(GZIP_WBITS)
+                if response.headers.get("content-encoding") == "gzip"
+                else None
+            )
+            buffer = bytearray()
+            for chunk in response.stream(STREAM_CHUNK_SIZE, decode_content=False):
+                if decompressor is not None:
+                    chunk = decompressor.decompress(chunk)
+                if hasher is not None:
+                    hasher.update(chunk)
+                buffer += chunk
+            if decompressor is not None:
+                tail = decompressor.flush()
+                if hasher is not None:
+                    hasher.update(tail)
+                buffer += tail
+            return bytes(buffer), hasher.hexdigest() if hasher is not None else None
+        finally:
+            response.close()
+            response.release_conn()
+
+    def _fetch_metadata_dict(
+        self, bucket_name: str, metadata_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch metadata dictionary from MinIO
 
         Args:
             bucket_name: Bucket name
             metadata_key: Metadata object key
-            state_data: State data for fallback parsing
 
         Returns:
-            Tuple of (StateMetadata, metadata_dict)
+            Metadata dictionary, or None if no metadata object exists
         """
-        metadata_dict = {}
         try:
             response = self.client.get_object(bucket_name, metadata_key)
-            metadata_json = response.read()
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                return None
+            raise
+
+        try:
+            metadata_dict: Dict[str, Any] = orjson.loads(response.read())
+            return metadata_dict
+        finally:
             response.close()
             response.release_conn()
-            metadata_dict = json.loads(metadata_json.decode("utf-8"))
-            if "state_metadata" in metadata_dict:
-                metadata = StateMetadata(**metadata_dict["state_metadata"])
-            else:
-                metadata = self._parse_state_metadata(state_data)
-        except S3Error:
-            # Metadata not found - parse from state data
-            metadata = self._parse_state_metadata(state_data)
-        return metadata, metadata_dict
 
     def _verify_state_checksum(
         self,
         state_data: bytes,
+        streamed_checksum: Optional[str],
         metadata_dict: Dict[str, Any],
         backend_id: str,
         workspace: str,
     ) -> str:
         """Verify state data checksum
 
+        Large states stored with per-chunk checksums are verified chunk by
+        chunk in parallel; otherwise the whole-body checksum is compared.
+
         Args:
             state_data: State data bytes
+            streamed_checksum: Checksum calculated while fetching, if any
             metadata_dict: Metadata dictionary
             backend_id: Backend identifier
             workspace: Workspace name
@@ -440,7 +767,20 @@ class StateBackend:
         Raises:
             StateCorruptedError: If checksum doesn't match
         """
-        calculated_checksum = self._calculate_checksum(state_data)
+        chunk_hashes = metadata_dict.get("chunk_hashes")
+        if chunk_hashes and "checksum" in metadata_dict:
+            stored_checksum: str = metadata_dict["checksum"]
+            chunk_size = metadata_dict.get("chunk_size", VERIFY_CHUNK_SIZE)
+            if not self._verify_chunk_checksums(state_data, chunk_hashes, chunk_size):
+                raise StateCorruptedError(
+                    backend_id,
+                    workspace,
+                    stored_checksum,
+                    self._calculate_checksum(state_data),
+                )
+            return stored_checksum
+
+        calculated_checksum = streamed_checksum or self._calculate_checksum(state_data)
         stored_checksum = metadata_dict.get("checksum", calculated_checksum)
         if calculated_checksum != stored_checksum:
             raise StateCorruptedError(
@@ -472,24 +812,42 @@ class StateBackend:
             BackendError: If retrieval operation fails
         """
         bucket_name = self._get_bucket_name(backend_id, environment)
+        now = datetime.now(timezone.utc)
 
         try:
             # Get keys for state and metadata
             state_key, metadata_key = self._get_state_keys(workspace, version_id)
 
-            # Fetch state data
-            state_data = self._fetch_state_data(
-                bucket_name, state_key, backend_id, workspace, version_id
-            )
-
-            # Fetch and parse metadata
-            metadata, metadata_dict = self._fetch_and_parse_metadata(
-                bucket_name, metadata_key, state_data
-            )
+            # Fetch metadata first so chunk checksums are known up front
+            metadata_dict = self._fetch_metadata_dict(bucket_name, metadata_key) or {}
+
+            # Fetch state data, checksumming it as it streams in unless it
+            # will be verified chunk by chunk
+            try:
+                state_data, streamed_checksum = self._fetch_state_data(
+                    bucket_name,
+                    state_key,
+                    backend_id,
+                    workspace,
+                    version_id,
+                    compute_checksum="chunk_hashes" not in metadata_dict,
+                )
+            except zlib.error as e:
+                raise StateCorruptedError(
+                    backend_id,
+                    workspace,
+                    metadata_dict.get("checksum", "unknown"),
+                    f"undecodable ({str(e)})",
+                )
+            # Only parse the state body when no stored metadata is available
+            if "state_metadata" in metadata_dict:
+                metadata = _STATE_METADATA_CONSTRUCT(**metadata_dict["state_metadata"])
+            else:
+                metadata = self._parse_state_metadata(state_data)
 
             # Verify checksum
             calculated_checksum = self._verify_state_checksum(
-                state_data, metadata_dict, backend_id, workspace
+                state_data, streamed_checksum, metadata_dict, backend_id, workspace
             )
 
             # Create StateInfo
@@ -501,8 +859,8 @@ class StateBackend:
                 checksum=calculated_checksum,
                 encrypted=self.config.encryption_enabled,
                 metadata=metadata,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                created_at=now,
+                updated_at=now,
                 version_count=await self._get_version_count(
                     backend_id, workspace, environment
                 ),
@@ -537,15 +895,36 @@ class StateBackend:
             )
             raise BackendError(f"Unexpected retrieval error: {str(e)}")
 
-    def _extract_version_ids_from_objects(self, objects: Any, workspace: str) -> set:
-        """Extract version IDs from MinIO objects"""
-        version_ids = set()
-        for obj in objects:
-            if obj.object_name.endswith("metadata.json"):
-                # Extract version ID from path
-                version_id = obj.object_name.split("/")[2]
-                version_ids.add(version_id)
-        return version_ids
+    def _iter_version_ids(self, bucket_name: str, workspace: str) -> Iterator[str]:
+        """Iterate version IDs stored for a workspace
+
+        A non-recursive listing returns one common prefix per version
+        directory, so the state and metadata objects are never listed.
+
+        Args:
+            bucket_name: Bucket name
+            workspace: Workspace name
+
+        Yields:
+            Version identifiers in listing order
+        """
+        versions_prefix = f"{workspace}/versions/"
+        for obj in self.client.list_objects(bucket_name, prefix=versions_prefix):
+            if obj.is_dir:
+                yield obj.object_name[len(versions_prefix) :].rstrip("/")
+
+    def _parse_created_at(self, metadata_dict: Dict[str, Any]) -> datetime:
+        """Parse version creation time as a UTC-aware datetime
+
+        Versions written before timestamps carried an offset are naive UTC.
+        """
+        created_at_value = metadata_dict.get("created_at")
+        if not created_at_value:
+            return datetime.now(timezone.utc)
+        created_at = datetime.fromisoformat(created_at_value)
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return created_at
 
     def _create_state_version_from_metadata(
         self, version_id: str, metadata_dict: Dict[str, Any], version_number: int
@@ -557,13 +936,11 @@ class StateBackend:
             size_bytes=metadata_dict.get("size_bytes", 0),
             checksum=metadata_dict.get("checksum", ""),
             metadata=(
-                StateMetadata(**metadata_dict.get("state_metadata", {}))
+                _STATE_METADATA_CONSTRUCT(**metadata_dict["state_metadata"])
                 if "state_metadata" in metadata_dict
                 else None
             ),
-            created_at=datetime.fromisoformat(
-                metadata_dict.get("created_at", datetime.utcnow().isoformat())
-            ),
+            created_at=self._parse_created_at(metadata_dict),
             created_by=metadata_dict.get("created_by", "unknown"),
             operation_type=OperationType(metadata_dict.get("operation_type", "write")),
         )
@@ -571,18 +948,28 @@ class StateBackend:
     def _fetch_version_metadata(
         self, bucket_name: str, version_id: str, workspace: str
     ) -> Optional[Dict[str, Any]]:
-        """Fetch and parse version metadata from MinIO"""
+        """Fetch and parse version metadata from MinIO, using the LRU cache"""
+        cache_key = (bucket_name, workspace, version_id)
+        with self._version_metadata_lock:
+            cached = self._version_metadata_cache.get(cache_key)
+            if cached is not None:
+                self._version_metadata_cache.move_to_end(cache_key)
+                return cached
+
         metadata_key = self._get_metadata_key(workspace, version_id)
         try:
-            response = self.client.get_object(bucket_name, metadata_key)
-            metadata_json = response.read()
-            response.close()
-            response.release_conn()
-            metadata_dict: Dict[str, Any] = json.loads(metadata_json.decode("utf-8"))
-            return metadata_dict
+            metadata_dict = self._fetch_metadata_dict(bucket_name, metadata_key)
         except S3Error:
+            return None
+        if metadata_dict is None:
             return None  # Skip versions without metadata
 
+        with self._version_metadata_lock:
+            self._version_metadata_cache[cache_key] = metadata_dict
+            if len(self._version_metadata_cache) > VERSION_METADATA_CACHE_SIZE:
+                self._version_metadata_cache.popitem(last=False)
+        return metadata_dict
+
     async def list_state_versions(
         self,
         backend_id: str,
@@ -605,30 +992,49 @@ class StateBackend:
             BackendError: If listing operation fails
         """
         bucket_name = self._get_bucket_name(backend_id, environment)
-        versions_prefix = f"{workspace}/versions/"
 
         try:
             versions: List[StateVersion] = []
-            objects = self.client.list_objects(
-                bucket_name, prefix=versions_prefix, recursive=True
-            )
-
-            version_ids = self._extract_version_ids_from_objects(objects, workspace)
-
-            # Get metadata for each version
-            for version_id in sorted(version_ids):
-                metadata_dict = self._fetch_version_metadata(
-                    bucket_name, version_id, workspace
-                )
-                if metadata_dict:
-                    version = self._create_state_version_from_metadata(
-                        version_id, metadata_dict, len(versions) + 1
-                    )
-                    versions.append(version)
-
-                    if len(versions) >= limit:
+            version_ids = self._iter_version_ids(bucket_name, workspace)
+
+            # Fetch metadata for each version concurrently. The listing is
+            # already in key order, so it is consumed lazily through a bounded
+            # window of in-flight fetches instead of being materialized and
+            # sorted; results are taken in submission order so version
+            # numbering stays deterministic
+            executor = ThreadPoolExecutor(max_workers=METADATA_FETCH_WORKERS)
+            pending: Deque[Tuple[str, Future[Optional[Dict[str, Any]]]]] = deque()
+            try:
+                while len(versions) < limit:
+                    while len(pending) < METADATA_FETCH_WORKERS:
+                        version_id = next(version_ids, None)
+                        if version_id is None:
+                            break
+                        pending.append(
+                            (
+                                version_id,
+                                executor.submit(
+                                    self._fetch_version_metadata,
+                                    bucket_name,
+                                    version_id,
+                                    workspace,
+                                ),
+                            )
+                        )
+                    if not pending:
                         break
 
+                    version_id, future = pending.popleft()
+                    metadata_dict = future.result()
+                    if metadata_dict:
+                        version = self._create_state_version_from_metadata(
+                            version_id, metadata_dict, len(versions) + 1
+                        )
+                        versions.append(version)
+            finally:
+                # Drop fetches still queued once the limit has been reached
+                executor.shutdown(wait=False, cancel_futures=True)
+
             logger.info(
                 "State versions listed successfully",
                 backend_id=backend_id,
@@ -657,24 +1063,43 @@ class StateBackend:
 
     def _collect_objects_for_deletion(
         self, bucket_name: str, workspace_prefix: str
-    ) -> List[str]:
-        """Collect all objects in workspace for deletion"""
-        objects_to_delete = []
+    ) -> Iterator[str]:
+        """Lazily yield all object names in workspace for deletion"""
         objects = self.client.list_objects(
             bucket_name, prefix=workspace_prefix, recursive=True
         )
         for obj in objects:
-            objects_to_delete.append(obj.object_name)
-        return objects_to_delete
+            yield obj.object_name
 
     def _delete_objects_from_minio(
         self, bucket_name: str, objects_to_delete: List[str]
-    ) -> None:
-        """Delete objects from MinIO storage"""
-        if objects_to_delete:
-            # MinIO batch delete would be implemented here
-            for obj_name in objects_to_delete:
-                self.client.remove_object(bucket_name, obj_name)
+    ) -> List[str]:
+        """Delete objects from MinIO storage using batched DeleteObjects requests
+
+        Args:
+            bucket_name: Bucket name
+            objects_to_delete: Object names to delete
+
+        Returns:
+            Names of objects that failed to delete
+        """
+        if not objects_to_delete:
+            return []
+
+        # remove_objects is lazy - errors must be consumed for deletion to run
+        errors = self.client.remove_objects(
+            bucket_name, (DeleteObject(name) for name in objects_to_delete)
+        )
+        failed = []
+        for error in errors:
+            logger.warning(
+                "Failed to delete object",
+                bucket=bucket_name,
+                object_name=error.name,
+                error=error.message,
+            )
+            failed.append(error.name)
+        return failed
 
     async def delete_state(
         self,
@@ -699,21 +1124,35 @@ class StateBackend:
         workspace_prefix = f"{workspace}/"
 
         try:
-            objects_to_delete = self._collect_objects_for_deletion(
+            # Stream the listing into DeleteObjects batches so the full set
+            # of object names is never held in memory
+            object_names = self._collect_objects_for_deletion(
                 bucket_name, workspace_prefix
             )
-            self._delete_objects_from_minio(bucket_name, objects_to_delete)
+            deleted_count = 0
+            failed_count = 0
+            while batch := list(islice(object_names, DELETE_BATCH_SIZE)):
+                failed_count += len(self._delete_objects_from_minio(bucket_name, batch))
+                deleted_count += len(batch)
+
+            if failed_count:
+                raise BackendError(
+                    f"Failed to delete {failed_count} of "
+                    f"{deleted_count} state objects"
+                )
 
-            if objects_to_delete:
+            if deleted_count:
                 logger.info(
                     "State deleted successfully",
                     backend_id=backend_id,
                     workspace=workspace,
-                    objects_deleted=len(objects_to_delete),
+                    objects_deleted=deleted_count,
                 )
 
-            return len(objects_to_delete)
+            return deleted_count
 
+        except BackendError:
+            raise
         except S3Error as e:
             logger.error(
                 "Failed to delete state",
@@ -739,6 +1178,9 @@ class StateBackend:
     ) -> int:
         """Get version count for workspace
 
+        Counts version directories from a single listing without fetching
+        any version metadata.
+
         Args:
             backend_id: Backend identifier
             workspace: Workspace name
@@ -747,11 +1189,9 @@ class StateBackend:
         Returns:
             Number of versions
         """
+        bucket_name = self._get_bucket_name(backend_id, environment)
         try:
-            versions = await self.list_state_versions(
-                backend_id, workspace, limit=1000, environment=environment
-            )
-            return len(versions)
+            return sum(1 for _ in self._iter_version_ids(bucket_name, workspace))
         except Exception:
             return 0
 
@@ -791,17 +1231,25 @@ class StateBackend:
             bucket_name = self._get_bucket_name(backend_id, environment)
             versions_to_delete = versions[:-keep_count]
 
-            deleted_count = 0
-            for version in versions_to_delete:
-                version_key = self._get_version_key(workspace, version.version_id)
-                metadata_key = self._get_metadata_key(workspace, version.version_id)
-
-                try:
-                    self.client.remove_object(bucket_name, version_key)
-                    self.client.remove_object(bucket_name, metadata_key)
-                    deleted_count += 1
-                except S3Error:
-                    continue  # Skip failed deletions
+            version_keys = {
+                version.version_id: (
+                    self._get_version_key(workspace, version.version_id),
+                    self._get_metadata_key(workspace, version.version_id),
+                )
+                for version in versions_to_delete
+            }
+            failed = set(
+                self._delete_objects_from_minio(
+                    bucket_name,
+                    [key for keys in version_keys.values() for key in keys],
+                )
+            )
+            # Versions with a failed deletion are skipped from the count
+            deleted_count = sum(
+                1
+                for keys in version_keys.values()
+                if not any(key in failed for key in keys)
+            )
 
             logger.info(
                 "Version cleanup completed",
@@ -3,10 +3,13 @@ Redis-Based Distributed State Locking
 Production-ready distributed locking coordination for Terraform state management
 """
 
-from datetime import datetime, timedelta
-import json
-from typing import Any, Dict, List, Optional, Tuple
-from uuid import uuid4
+import asyncio
+from datetime import datetime
+from functools import lru_cache
+from os import urandom
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from config import RedisConfig
 from exceptions import (
@@ -16,11 +19,123 @@ from exceptions import (
     StateLockError,
 )
 from models import LockInfo, LockStatus
+import orjson
 import redis.asyncio as redis
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Number of locks fetched per pipelined round-trip when listing locks
+LIST_LOCKS_BATCH_SIZE = 500
+
+# Number of (backend, workspace) key names cached per locker
+LOCK_KEY_CACHE_SIZE = 4096
+
+# Backoff between attempts when waiting for a held lock (seconds)
+LOCK_WAIT_BACKOFF_BASE = 0.01
+LOCK_WAIT_BACKOFF_CAP = 1.0
+LOCK_WAIT_JITTER = 0.05
+
+# Each lock is a single hash holding the lock ID and the serialized lock info
+LOCK_ID_FIELD = "id"
+LOCK_INFO_FIELD = "info"
+
+# Locks used to be two string keys (lock ID and lock info) under
+# "terraform:lock:". Until no instance runs that layout, new locks also hold
+# the legacy lock ID key so older instances see them as taken, and legacy locks
+# held by older instances are honoured here until they are released or expire
+
+# Atomically acquire the lock: if it is already held under either layout,
+# return the holder's lock info (empty string if none was stored); otherwise
+# create the lock and return OK
+LUA_ACQUIRE = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('HGET', KEYS[1], 'info') or ''
+end
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return redis.call('GET', KEYS[3]) or ''
+end
+redis.call('HSET', KEYS[1], 'id', ARGV[1], 'info', ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('SET', KEYS[2], ARGV[1], 'EX', ARGV[2])
+return 'OK'
+"""
+
+# Atomically delete the lock only if it is still held by the given lock ID and
+# notify any waiters on the release channel
+LUA_RELEASE = """
+local released = 0
+if redis.call('HGET', KEYS[1], 'id') == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    released = 1
+end
+if redis.call('GET', KEYS[2]) == ARGV[1] then
+    redis.call('DEL', KEYS[2], KEYS[3])
+    released = 1
+end
+if released == 1 then
+    redis.call('PUBLISH', ARGV[2], ARGV[1])
+end
+return released
+"""
+
+# Atomically delete the lock regardless of owner, notify waiters on the release
+# channel and return the previous lock ID and info for auditing
+LUA_FORCE_UNLOCK = """
+local previous = redis.call('HMGET', KEYS[1], 'id', 'info')
+if not previous[1] then
+    previous = redis.call('MGET', KEYS[2], KEYS[3])
+end
+redis.call('DEL', KEYS[1], KEYS[2], KEYS[3])
+redis.call('PUBLISH', ARGV[1], ARGV[2])
+return previous
+"""
+
+# Atomically extend the lock only if it is still held by the given lock ID,
+# recording the new expiry in the stored lock info. Legacy lock info keeps its
+# original payload and is only given the new TTL
+LUA_EXTEND = """
+if redis.call('HGET', KEYS[1], 'id') == ARGV[1] then
+    local info = redis.call('HGET', KEYS[1], 'info')
+    if info then
+        local data = cjson.decode(info)
+        data['expires_at'] = tonumber(ARGV[3])
+        redis.call('HSET', KEYS[1], 'info', cjson.encode(data))
+    end
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+elseif redis.call('GET', KEYS[2]) == ARGV[1] then
+    redis.call('PEXPIRE', KEYS[3], ARGV[2])
+else
+    return 0
+end
+if redis.call('GET', KEYS[2]) == ARGV[1] then
+    redis.call('PEXPIRE', KEYS[2], ARGV[2])
+end
+return 1
+"""
+
+# Unlink each lock in the first half of KEYS only if it is still held by the
+# matching lock ID in ARGV, so a lock re-acquired since it was found expired is
+# left alone, along with its legacy lock ID key in the second half of KEYS.
+# UNLINK frees memory on a background thread instead of Redis' main thread
+LUA_REAP = """
+local expired = {}
+local reaped = 0
+for i, lock_id in ipairs(ARGV) do
+    if redis.call('HGET', KEYS[i], 'id') == lock_id then
+        expired[#expired + 1] = KEYS[i]
+        reaped = reaped + 1
+        if redis.call('GET', KEYS[#ARGV + i]) == lock_id then
+            expired[#expired + 1] = KEYS[#ARGV + i]
+        end
+    end
+end
+if reaped > 0 then
+    redis.call('UNLINK', unpack(expired))
+end
+return reaped
+"""
+
 
 class StateLocker:
     """Distributed state locking using Redis coordination"""
@@ -34,45 +149,82 @@ class StateLocker:
         """
         self.redis_client = redis_client
         self.config = config
-        self._lock_prefix = "terraform:lock:"
-        self._lock_info_prefix = "terraform:lock:info:"
-
-    def _get_lock_key(self, backend_id: str, workspace: str) -> str:
-        """Generate Redis lock key
+        # Hash locks live under their own prefix so legacy string locks are
+        # never read as hashes (WRONGTYPE)
+        self._lock_prefix = "terraform:locks:"
+        self._lock_prefix_len = len(self._lock_prefix)
+        self._legacy_lock_prefix = "terraform:lock:"
+        self._legacy_lock_prefix_len = len(self._legacy_lock_prefix)
+        self._legacy_lock_info_prefix = "terraform:lock:info:"
+        self._release_prefix = "terraform:lock:released:"
+        self._keys = lru_cache(maxsize=LOCK_KEY_CACHE_SIZE)(self._format_keys)
+        self._legacy_keys = lru_cache(maxsize=LOCK_KEY_CACHE_SIZE)(
+            self._format_legacy_keys
+        )
+
+        # Replies are str or bytes depending on how the client was created;
+        # normalize once at the boundary rather than per comparison
+        self._decode_responses = redis_client.connection_pool.connection_kwargs.get(
+            "decode_responses", False
+        )
+        self._acquired_reply = "OK" if self._decode_responses else b"OK"
+        # Registered scripts cache their SHA and reload on NOSCRIPT
+        self._acquire_script = redis_client.register_script(LUA_ACQUIRE)
+        self._release_script = redis_client.register_script(LUA_RELEASE)
+        self._extend_script = redis_client.register_script(LUA_EXTEND)
+        self._force_unlock_script = redis_client.register_script(LUA_FORCE_UNLOCK)
+        self._reap_script = redis_client.register_script(LUA_REAP)
+        self._reaper_task: Optional[asyncio.Task] = None
+        self._list_locks_task: Optional[asyncio.Future] = None
+
+    def _as_str(self, value: Optional[Union[str, bytes]]) -> Optional[str]:
+        """Return a Redis reply as str regardless of decode_responses"""
+        if value is None or self._decode_responses:
+            return value
+        return value.decode()
+
+    def _format_keys(self, backend_id: str, workspace: str) -> Tuple[str, str]:
+        """Generate Redis lock key and release channel
+
+        Called through the per-instance ``_keys`` cache.
 
         Args:
             backend_id: Backend identifier
             workspace: Workspace name
 
         Returns:
-            Redis lock key
+            Tuple of Redis lock key and lock release pub/sub channel
         """
-        return f"{self._lock_prefix}{backend_id}:{workspace}"
+        suffix = f"{backend_id}:{workspace}"
+        return f"{self._lock_prefix}{suffix}", f"{self._release_prefix}{suffix}"
+
+    def _format_legacy_keys(self, backend_id: str, workspace: str) -> Tuple[str, str]:
+        """Generate the Redis keys of the legacy string lock layout
 
-    def _get_lock_info_key(self, backend_id: str, workspace: str) -> str:
-        """Generate Redis lock info key
+        Called through the per-instance ``_legacy_keys`` cache.
 
         Args:
             backend_id: Backend identifier
             workspace: Workspace name
 
         Returns:
-            Redis lock info key
+            Tuple of legacy lock ID key and legacy lock info key
         """
-        return f"{self._lock_info_prefix}{backend_id}:{workspace}"
-
-    async def _check_existing_lock(
-        self, backend_id: str, workspace: str, lock_key: str
-    ) -> None:
-        """Check if lock already exists and is valid"""
-        existing_lock = await self.redis_client.get(lock_key)
-        if existing_lock:
-            # Verify lock hasn't expired
-            existing_info = await self.get_lock_info(backend_id, workspace)
-            if existing_info is not None:
-                raise StateLockedError(
-                    backend_id, workspace, lock_info=existing_info.dict()
-                )
+        suffix = f"{backend_id}:{workspace}"
+        return (
+            f"{self._legacy_lock_prefix}{suffix}",
+            f"{self._legacy_lock_info_prefix}{suffix}",
+        )
+
+    @staticmethod
+    def _encode_lock_payload(payload: Dict[str, Any]) -> bytes:
+        """Serialize lock info for storage in Redis"""
+        return orjson.dumps(payload, default=str)
+
+    @staticmethod
+    def _decode_lock_payload(data: Union[str, bytes]) -> Dict[str, Any]:
+        """Deserialize lock info stored in Redis"""
+        return orjson.loads(data)
 
     def _prepare_lock_data(
         self,
@@ -80,48 +232,21 @@ class StateLocker:
         backend_id: str,
         workspace: str,
         timeout: int,
-        expires_at: datetime,
+        acquired_at: int,
     ) -> Dict[str, Any]:
-        """Prepare lock data dictionary"""
+        """Prepare lock data dictionary
+
+        Acquisition and expiry times are stored as epoch seconds.
+        """
         return {
             "lock_id": lock_id,
             "backend_id": backend_id,
             "workspace": workspace,
-            "acquired_at": datetime.utcnow().isoformat(),
-            "expires_at": expires_at.isoformat(),
+            "acquired_at": acquired_at,
+            "expires_at": acquired_at + timeout,
             "timeout": timeout,
         }
 
-    async def _execute_lock_acquisition(
-        self,
-        lock_key: str,
-        lock_info_key: str,
-        lock_id: str,
-        lock_info: LockInfo,
-        lock_data: Dict[str, Any],
-        timeout: int,
-    ) -> None:
-        """Execute atomic lock acquisition"""
-        async with self.redis_client.pipeline(transaction=True) as pipe:
-            # Set lock with expiration
-            await pipe.set(lock_key, lock_id, ex=timeout, nx=True)
-
-            # Store lock info
-            await pipe.set(
-                lock_info_key, json.dumps({**lock_info.dict(), **lock_data}), ex=timeout
-            )
-
-            result = await pipe.execute()
-
-            if not result[0]:  # SET NX failed
-                raise StateLockedError(
-                    lock_data["backend_id"],
-                    lock_data["workspace"],
-                    lock_info={
-                        "error": "Lock acquisition failed - state already locked"
-                    },
-                )
-
     async def acquire_lock(
         self, backend_id: str, workspace: str, lock_info: LockInfo, timeout: int = 1800
     ) -> Dict[str, Any]:
@@ -141,29 +266,35 @@ class StateLocker:
             StateLockError: If lock acquisition fails
             RedisConnectionError: If Redis operation fails
         """
-        lock_key = self._get_lock_key(backend_id, workspace)
-        lock_info_key = self._get_lock_info_key(backend_id, workspace)
+        lock_key, _ = self._keys(backend_id, workspace)
+        legacy_keys = self._legacy_keys(backend_id, workspace)
 
         try:
-            await self._check_existing_lock(backend_id, workspace, lock_key)
-
             # Generate unique lock ID
-            lock_id = str(uuid4())
+            lock_id = urandom(16).hex()
             lock_info.id = lock_id
 
-            # Calculate expiration time
-            expires_at = datetime.utcnow() + timedelta(seconds=timeout)
-
             # Prepare lock data
+            acquired_at = int(time.time())
             lock_data = self._prepare_lock_data(
-                lock_id, backend_id, workspace, timeout, expires_at
+                lock_id, backend_id, workspace, timeout, acquired_at
             )
+            payload_data = lock_info.model_dump()
+            payload_data.update(lock_data)
+            payload = self._encode_lock_payload(payload_data)
 
-            # Execute atomic lock acquisition
-            await self._execute_lock_acquisition(
-                lock_key, lock_info_key, lock_id, lock_info, lock_data, timeout
+            # Check and acquire atomically in a single round-trip
+            result = await self._acquire_script(
+                keys=[lock_key, *legacy_keys], args=[lock_id, timeout, payload]
             )
+            if result != self._acquired_reply:
+                raise StateLockedError(
+                    backend_id,
+                    workspace,
+                    lock_info=self._decode_lock_payload(result) if result else {},
+                )
 
+            expires_at = datetime.utcfromtimestamp(lock_data["expires_at"])
             logger.info(
                 "Lock acquired successfully",
                 backend_id=backend_id,
@@ -176,7 +307,7 @@ class StateLocker:
                 "lock_id": lock_id,
                 "backend_id": backend_id,
                 "workspace": workspace,
-                "acquired_at": datetime.utcnow(),
+                "acquired_at": datetime.utcfromtimestamp(acquired_at),
                 "expires_at": expires_at,
                 "timeout": timeout,
                 "success": True,
@@ -191,6 +322,67 @@ class StateLocker:
             logger.error("Unexpected error during lock acquisition", error=str(e))
             raise StateLockError(f"Unexpected lock error: {str(e)}")
 
+    async def acquire_lock_blocking(
+        self,
+        backend_id: str,
+        workspace: str,
+        lock_info: LockInfo,
+        timeout: int = 1800,
+        wait_timeout: float = 30.0,
+    ) -> Dict[str, Any]:
+        """Acquire distributed lock, waiting for the current holder if needed
+
+        Retries with capped exponential backoff and jitter, and wakes early
+        when the holder releases the lock.
+
+        Args:
+            backend_id: Backend identifier
+            workspace: Workspace name
+            lock_info: Lock information
+            timeout: Lock timeout in seconds
+            wait_timeout: Maximum seconds to wait for the lock
+
+        Returns:
+            Lock acquisition result
+
+        Raises:
+            StateLockedError: If the lock is still held after wait_timeout
+            StateLockError: If lock acquisition fails
+            RedisConnectionError: If Redis operation fails
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait_timeout
+        _, channel = self._keys(backend_id, workspace)
+        pubsub = self.redis_client.pubsub()
+
+        try:
+            # Subscribe before the first attempt so a release is never missed
+            await pubsub.subscribe(channel)
+            attempt = 0
+            while True:
+                try:
+                    return await self.acquire_lock(
+                        backend_id, workspace, lock_info, timeout
+                    )
+                except StateLockedError:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        raise
+
+                backoff = min(
+                    LOCK_WAIT_BACKOFF_CAP, LOCK_WAIT_BACKOFF_BASE * 2**attempt
+                ) + random.uniform(0, LOCK_WAIT_JITTER)
+                attempt += 1
+                await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=min(backoff, remaining)
+                )
+
+        except redis.RedisError as e:
+            logger.error("Redis error while waiting for lock", error=str(e))
+            raise RedisConnectionError(f"Redis error while waiting for lock: {str(e)}")
+        finally:
+            await pubsub.aclose()
+
     async def release_lock(
         self, backend_id: str, workspace: str, lock_id: str
     ) -> Dict[str, Any]:
@@ -209,26 +401,25 @@ class StateLocker:
             StateLockError: If lock release fails
             RedisConnectionError: If Redis operation fails
         """
-        lock_key = self._get_lock_key(backend_id, workspace)
-        lock_info_key = self._get_lock_info_key(backend_id, workspace)
+        lock_key, release_channel = self._keys(backend_id, workspace)
+        legacy_keys = self._legacy_keys(backend_id, workspace)
 
         try:
-            # Verify lock exists and belongs to this lock_id
-            current_lock_id = await self.redis_client.get(lock_key)
-            if not current_lock_id:
-                raise LockNotFoundError(backend_id, workspace, lock_id)
-
-            if current_lock_id != lock_id:
+            # Verify ownership and release atomically in a single round-trip
+            released = await self._release_script(
+                keys=[lock_key, *legacy_keys], args=[lock_id, release_channel]
+            )
+            if not released:
+                current_lock_id = await self.redis_client.hget(
+                    lock_key, LOCK_ID_FIELD
+                ) or await self.redis_client.get(legacy_keys[0])
+                if not current_lock_id:
+                    raise LockNotFoundError(backend_id, workspace, lock_id)
                 raise StateLockError(
-                    f"Lock ID mismatch: expected {lock_id}, found {current_lock_id}"
+                    f"Lock ID mismatch: expected {lock_id}, "
+                    f"found {self._as_str(current_lock_id)}"
                 )
 
-            # Atomic lock release
-            async with self.redis_client.pipeline(transaction=True) as pipe:
-                await pipe.delete(lock_key)
-                await pipe.delete(lock_info_key)
-                await pipe.execute()
-
             logger.info(
                 "Lock released successfully",
                 backend_id=backend_id,
@@ -253,6 +444,48 @@ class StateLocker:
             logger.error("Unexpected error during lock release", error=str(e))
             raise StateLockError(f"Unexpected unlock error: {str(e)}")
 
+    def _is_lock_expired(self, lock_data: Dict[str, Any]) -> bool:
+        """Check whether stored lock info is past its expiry time"""
+        expires_at = lock_data.get("expires_at")
+        if expires_at is None:
+            return False
+        if isinstance(expires_at, str):
+            # Lock info written before expiry was stored as epoch seconds
+            return datetime.utcnow() > datetime.fromisoformat(expires_at)
+        return time.time() > expires_at
+
+    def _build_lock_info(
+        self,
+        backend_id: str,
+        workspace: str,
+        lock_id: Union[str, bytes],
+        lock_data: Optional[Dict[str, Any]],
+    ) -> LockInfo:
+        """Build lock information from the raw values stored in Redis"""
+        lock_id = self._as_str(lock_id)
+        if not lock_data:
+            # Lock exists but no info - treat as locked
+            return LockInfo(
+                id=lock_id,
+                operation="unknown",
+                info="Lock exists but no details available",
+                who="unknown",
+                version="unknown",
+                path=f"{backend_id}/{workspace}",
+            )
+
+        return LockInfo(
+            id=lock_data.get("id", lock_id),
+            operation=lock_data.get("operation", "unknown"),
+            info=lock_data.get("info", "No info available"),
+            who=lock_data.get("who", "unknown"),
+            version=lock_data.get("version", "unknown"),
+            created=datetime.fromisoformat(
+                lock_data.get("created", datetime.utcnow().isoformat())
+            ),
+            path=lock_data.get("path", f"{backend_id}/{workspace}"),
+        )
+
     async def get_lock_info(
         self, backend_id: str, workspace: str
     ) -> Optional[LockInfo]:
@@ -268,50 +501,35 @@ class StateLocker:
         Raises:
             RedisConnectionError: If Redis operation fails
         """
-        lock_key = self._get_lock_key(backend_id, workspace)
-        lock_info_key = self._get_lock_info_key(backend_id, workspace)
+        lock_key, _ = self._keys(backend_id, workspace)
 
         try:
-            # Check if lock exists
-            lock_id = await self.redis_client.get(lock_key)
+            # Read both layouts in one round-trip
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                await pipe.hmget(lock_key, LOCK_ID_FIELD, LOCK_INFO_FIELD)
+                await pipe.mget(*self._legacy_keys(backend_id, workspace))
+                (lock_id, lock_info_data), legacy = await pipe.execute()
+
+            is_legacy = not lock_id
+            if is_legacy:
+                lock_id, lock_info_data = legacy
             if not lock_id:
                 return None
 
-            # Get lock info
-            lock_info_data = await self.redis_client.get(lock_info_key)
-            if not lock_info_data:
-                # Lock exists but no info - treat as locked
-                return LockInfo(
-                    id=lock_id,
-                    operation="unknown",
-                    info="Lock exists but no details available",
-                    who="unknown",
-                    version="unknown",
-                    path=f"{backend_id}/{workspace}",
-                )
-
-            # Parse lock info
-            lock_data = json.loads(lock_info_data)
-
-            # Check if lock has expired
-            if "expires_at" in lock_data:
-                expires_at = datetime.fromisoformat(lock_data["expires_at"])
-                if datetime.utcnow() > expires_at:
-                    # Lock has expired - clean it up
-                    await self.force_unlock(backend_id, workspace, "Lock expired")
-                    return None
-
-            return LockInfo(
-                id=lock_data.get("id", lock_id),
-                operation=lock_data.get("operation", "unknown"),
-                info=lock_data.get("info", "No info available"),
-                who=lock_data.get("who", "unknown"),
-                version=lock_data.get("version", "unknown"),
-                created=datetime.fromisoformat(
-                    lock_data.get("created", datetime.utcnow().isoformat())
-                ),
-                path=lock_data.get("path", f"{backend_id}/{workspace}"),
+            lock_data = (
+                self._decode_lock_payload(lock_info_data) if lock_info_data else None
             )
+            # Legacy lock info is not updated on extension, so legacy locks are
+            # held until their keys expire
+            if (
+                not is_legacy
+                and lock_data is not None
+                and self._is_lock_expired(lock_data)
+            ):
+                # Expired locks are removed by the background reaper
+                return None
+
+            return self._build_lock_info(backend_id, workspace, lock_id, lock_data)
 
         except redis.RedisError as e:
             logger.error("Redis error getting lock info", error=str(e))
@@ -336,18 +554,25 @@ class StateLocker:
         Raises:
             RedisConnectionError: If Redis operation fails
         """
-        lock_key = self._get_lock_key(backend_id, workspace)
-        lock_info_key = self._get_lock_info_key(backend_id, workspace)
+        lock_key, release_channel = self._keys(backend_id, workspace)
+        legacy_keys = self._legacy_keys(backend_id, workspace)
 
         try:
-            # Get current lock info for audit
-            current_info = await self.get_lock_info(backend_id, workspace)
+            # Remove the lock and capture its previous state in one round-trip
+            lock_id, lock_info_data = await self._force_unlock_script(
+                keys=[lock_key, *legacy_keys], args=[release_channel, force_reason]
+            )
 
-            # Force remove lock
-            async with self.redis_client.pipeline(transaction=True) as pipe:
-                await pipe.delete(lock_key)
-                await pipe.delete(lock_info_key)
-                await pipe.execute()
+            previous_lock = None
+            if lock_id:
+                lock_data = (
+                    self._decode_lock_payload(lock_info_data)
+                    if lock_info_data
+                    else None
+                )
+                previous_lock = self._build_lock_info(
+                    backend_id, workspace, lock_id, lock_data
+                ).model_dump()
 
             # Log force unlock for audit
             logger.warning(
@@ -355,7 +580,7 @@ class StateLocker:
                 backend_id=backend_id,
                 workspace=workspace,
                 force_reason=force_reason,
-                previous_lock=current_info.dict() if current_info else None,
+                previous_lock=previous_lock,
             )
 
             return {
@@ -363,7 +588,7 @@ class StateLocker:
                 "workspace": workspace,
                 "force_reason": force_reason,
                 "forced_at": datetime.utcnow(),
-                "previous_lock": current_info.dict() if current_info else None,
+                "previous_lock": previous_lock,
                 "success": True,
             }
 
@@ -394,12 +619,15 @@ class StateLocker:
                 return LockStatus.UNLOCKED
 
             # Check if lock has expired
-            lock_key = self._get_lock_key(backend_id, workspace)
+            lock_key, _ = self._keys(backend_id, workspace)
             ttl = await self.redis_client.ttl(lock_key)
+            if ttl == -2:
+                # No hash lock, so the lock is held under the legacy layout
+                legacy_lock_key, _ = self._legacy_keys(backend_id, workspace)
+                ttl = await self.redis_client.ttl(legacy_lock_key)
 
             if ttl <= 0:
-                # Lock has expired
-                await self.force_unlock(backend_id, workspace, "Lock expired")
+                # Lock has expired - the background reaper will remove it
                 return LockStatus.EXPIRED
 
             return LockStatus.LOCKED
@@ -430,22 +658,21 @@ class StateLocker:
             StateLockError: If lock extension fails
             RedisConnectionError: If Redis operation fails
         """
-        lock_key = self._get_lock_key(backend_id, workspace)
-        lock_info_key = self._get_lock_info_key(backend_id, workspace)
+        lock_key, _ = self._keys(backend_id, workspace)
+        legacy_keys = self._legacy_keys(backend_id, workspace)
 
         try:
-            # Verify lock exists and belongs to this lock_id
-            current_lock_id = await self.redis_client.get(lock_key)
-            if not current_lock_id or current_lock_id != lock_id:
-                raise LockNotFoundError(backend_id, workspace, lock_id)
+            expires_at = int(time.time()) + extend_seconds
 
-            # Extend lock expiration
-            new_expires_at = datetime.utcnow() + timedelta(seconds=extend_seconds)
+            # Verify ownership and extend atomically in a single round-trip
+            extended = await self._extend_script(
+                keys=[lock_key, *legacy_keys],
+                args=[lock_id, extend_seconds * 1000, expires_at],
+            )
+            if not extended:
+                raise LockNotFoundError(backend_id, workspace, lock_id)
 
-            async with self.redis_client.pipeline(transaction=True) as pipe:
-                await pipe.expire(lock_key, extend_seconds)
-                await pipe.expire(lock_info_key, extend_seconds)
-                await pipe.execute()
+            new_expires_at = datetime.utcfromtimestamp(expires_at)
 
             logger.info(
                 "Lock extended successfully",
@@ -474,42 +701,71 @@ class StateLocker:
             logger.error("Unexpected error during lock extension", error=str(e))
             raise StateLockError(f"Unexpected lock extension error: {str(e)}")
 
-    async def _get_all_lock_keys(self) -> List[str]:
-        """Get all lock keys from Redis"""
-        lock_pattern = f"{self._lock_prefix}*"
+    async def _get_all_lock_keys(self) -> Tuple[List[str], List[str]]:
+        """Get all lock keys from Redis
+
+        Both layouts share the "terraform:lock" prefix, so a single scan finds
+        them.
+
+        Returns:
+            Tuple of lock keys and legacy lock ID keys
+        """
         lock_keys = []
-        async for key in self.redis_client.scan_iter(match=lock_pattern):
-            lock_keys.append(key)
-        return lock_keys
+        legacy_lock_keys = []
+        async for key in self.redis_client.scan_iter(
+            match="terraform:lock*", count=self.config.scan_count
+        ):
+            key = self._as_str(key)
+            if key.startswith(self._lock_prefix):
+                lock_keys.append(key)
+            elif key.startswith(self._legacy_lock_prefix) and not key.startswith(
+                self._legacy_lock_info_prefix
+            ):
+                legacy_lock_keys.append(key)
+        return lock_keys, legacy_lock_keys
 
     def _extract_backend_workspace_from_key(
-        self, lock_key: str
+        self, lock_key: str, prefix_len: Optional[int] = None
     ) -> Optional[Tuple[str, str]]:
         """Extract backend_id and workspace from lock key"""
-        try:
-            key_parts = lock_key.replace(self._lock_prefix, "").split(":")
-            if len(key_parts) >= 2:
-                backend_id = key_parts[0]
-                workspace = ":".join(key_parts[1:])
-                return backend_id, workspace
-        except Exception as e:
-            logger.warning(
-                "Skipping invalid lock entry", error=str(e), key=str(lock_key)
-            )
-        return None
+        if prefix_len is None:
+            prefix_len = self._lock_prefix_len
+        body = lock_key[prefix_len:]
+        sep = body.find(":")
+        if sep == -1:
+            logger.warning("Skipping invalid lock entry", key=lock_key)
+            return None
+        # Workspace names may themselves contain colons
+        return body[:sep], body[sep + 1 :]
 
-    async def _create_lock_dict(
-        self, backend_id: str, workspace: str
+    def _create_lock_dict(
+        self,
+        backend_id: str,
+        workspace: str,
+        lock_id: Optional[Union[str, bytes]],
+        lock_info_data: Optional[Union[str, bytes]],
+        is_legacy: bool = False,
     ) -> Optional[Dict[str, Any]]:
-        """Create lock dictionary for monitoring"""
+        """Create lock dictionary for monitoring from pipelined lock values"""
+        if not lock_id:
+            return None
         try:
-            lock_info = await self.get_lock_info(backend_id, workspace)
-            if lock_info:
-                return {
-                    "backend_id": backend_id,
-                    "workspace": workspace,
-                    "lock_info": lock_info.dict(),
-                }
+            lock_data = (
+                self._decode_lock_payload(lock_info_data) if lock_info_data else None
+            )
+            if (
+                not is_legacy
+                and lock_data is not None
+                and self._is_lock_expired(lock_data)
+            ):
+                return None
+
+            lock_info = self._build_lock_info(backend_id, workspace, lock_id, lock_data)
+            return {
+                "backend_id": backend_id,
+                "workspace": workspace,
+                "lock_info": lock_info.model_dump(),
+            }
         except Exception as e:
             logger.warning(
                 "Failed to get lock info",
@@ -522,21 +778,62 @@ class StateLocker:
     async def list_all_locks(self) -> List[Dict[str, Any]]:
         """List all active locks (for monitoring/debugging)
 
+        Lock and lock info values are fetched with pipelined HMGETs so listing
+        costs one round-trip per batch rather than one per lock. Locks still
+        held under the legacy layout are included. Concurrent callers share a
+        single in-flight listing.
+
         Returns:
             List of all active locks
 
         Raises:
             RedisConnectionError: If Redis operation fails
         """
+        if self._list_locks_task is None or self._list_locks_task.done():
+            self._list_locks_task = asyncio.ensure_future(self._fetch_all_locks())
+        # Shield so one cancelled caller does not cancel the shared listing
+        return list(await asyncio.shield(self._list_locks_task))
+
+    async def _fetch_all_locks(self) -> List[Dict[str, Any]]:
+        """Scan and fetch all active locks from Redis"""
         try:
-            lock_keys = await self._get_all_lock_keys()
-            locks = []
+            lock_keys, legacy_lock_keys = await self._get_all_lock_keys()
+            if not lock_keys and not legacy_lock_keys:
+                return []
 
+            entries = []
             for lock_key in lock_keys:
                 backend_workspace = self._extract_backend_workspace_from_key(lock_key)
                 if backend_workspace:
-                    backend_id, workspace = backend_workspace
-                    lock_dict = await self._create_lock_dict(backend_id, workspace)
+                    entries.append((lock_key, backend_workspace, False))
+
+            # New locks also hold the legacy lock ID key; list those only once
+            held = {backend_workspace for _, backend_workspace, _ in entries}
+            for lock_key in legacy_lock_keys:
+                backend_workspace = self._extract_backend_workspace_from_key(
+                    lock_key, self._legacy_lock_prefix_len
+                )
+                if backend_workspace and backend_workspace not in held:
+                    entries.append((lock_key, backend_workspace, True))
+
+            locks = []
+            for start in range(0, len(entries), LIST_LOCKS_BATCH_SIZE):
+                batch = entries[start : start + LIST_LOCKS_BATCH_SIZE]
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for lock_key, backend_workspace, is_legacy in batch:
+                        if is_legacy:
+                            await pipe.mget(*self._legacy_keys(*backend_workspace))
+                        else:
+                            await pipe.hmget(lock_key, LOCK_ID_FIELD, LOCK_INFO_FIELD)
+                    results = await pipe.execute()
+
+                for (_, (backend_id, workspace), is_legacy), (
+                    lock_id,
+                    lock_info_data,
+                ) in zip(batch, results):
+                    lock_dict = self._create_lock_dict(
+                        backend_id, workspace, lock_id, lock_info_data, is_legacy
+                    )
                     if lock_dict:
                         locks.append(lock_dict)
 
@@ -548,3 +845,100 @@ class StateLocker:
         except Exception as e:
             logger.error("Unexpected error listing locks", error=str(e))
             return []
+
+    def _is_reapable(
+        self,
+        ttl: int,
+        lock_id: Optional[Union[str, bytes]],
+        lock_info_data: Optional[Union[str, bytes]],
+    ) -> bool:
+        """Check whether a lock found by the reaper should be removed"""
+        if not lock_id:
+            return False
+        if ttl == -1:
+            # Lock has no TTL and would never expire on its own
+            return True
+        if not lock_info_data:
+            return False
+        try:
+            return self._is_lock_expired(self._decode_lock_payload(lock_info_data))
+        except ValueError:
+            return False
+
+    async def reap_expired_locks(self) -> int:
+        """Remove expired locks that are still present in Redis
+
+        Returns:
+            Number of locks removed
+
+        Raises:
+            RedisConnectionError: If Redis operation fails
+        """
+        try:
+            # Legacy locks were always written with a TTL and expire on their own
+            lock_keys, _ = await self._get_all_lock_keys()
+            reaped = 0
+
+            for start in range(0, len(lock_keys), LIST_LOCKS_BATCH_SIZE):
+                batch = lock_keys[start : start + LIST_LOCKS_BATCH_SIZE]
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for lock_key in batch:
+                        await pipe.ttl(lock_key)
+                        await pipe.hmget(lock_key, LOCK_ID_FIELD, LOCK_INFO_FIELD)
+                    results = await pipe.execute()
+
+                expired_keys = []
+                expired_ids = []
+                for lock_key, ttl, (lock_id, lock_info_data) in zip(
+                    batch, results[::2], results[1::2]
+                ):
+                    if self._is_reapable(ttl, lock_id, lock_info_data):
+                        expired_keys.append(lock_key)
+                        expired_ids.append(lock_id)
+
+                if expired_keys:
+                    legacy_lock_keys = [
+                        self._legacy_lock_prefix + key[self._lock_prefix_len :]
+                        for key in expired_keys
+                    ]
+                    reaped += await self._reap_script(
+                        keys=expired_keys + legacy_lock_keys, args=expired_ids
+                    )
+
+            if reaped:
+                logger.info("Expired locks reaped", count=reaped)
+            return reaped
+
+        except redis.RedisError as e:
+            logger.error("Redis error reaping expired locks", error=str(e))
+            raise RedisConnectionError(f"Redis error reaping expired locks: {str(e)}")
+
+    async def _reaper_loop(self, interval: int) -> None:
+        """Periodically remove expired locks until cancelled"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reap_expired_locks()
+            except Exception as e:
+                logger.error("Lock reaper iteration failed", error=str(e))
+
+    def start_reaper(self) -> None:
+        """Start the background task that removes expired locks"""
+        if self._reaper_task is None or self._reaper_task.done():
+            self._reaper_task = asyncio.create_task(
+                self._reaper_loop(self.config.lock_reaper_interval)
+            )
+            logger.info(
+                "Lock reaper started", interval=self.config.lock_reaper_interval
+            )
+
+    async def stop_reaper(self) -> None:
+        """Stop the background lock reaper task"""
+        task, self._reaper_task = self._reaper_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
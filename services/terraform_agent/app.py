@@ -3,33 +3,63 @@ Enhanced Terraform Executor Service
 Production-ready REST API for comprehensive Terraform automation with async job execution
 """
 
+import asyncio
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-import json
+from functools import lru_cache
+from itertools import islice
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import os
-import subprocess  # nosec B404
+import queue
 import time
-from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Optional
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 from uuid import UUID, uuid4
 
-from celery import Celery
+from cachetools import TTLCache
+from celery import Celery, Signature, group
 from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
-from prometheus_client import Counter, Gauge, Histogram, generate_latest
+from fastapi.responses import ORJSONResponse, Response
+import msgpack
+import orjson
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from pydantic import BaseModel, ValidationError
 import redis.asyncio as redis
 from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+from redis.utils import HIREDIS_AVAILABLE
+from starlette.types import Receive, Scope, Send
 import structlog
 import uvicorn
 
 from services.terraform_agent.models import (
-    ErrorResponse,
+    BaseRequest,
     HealthResponse,
     JobInfo,
     JobListResponse,
+    JobLogsResponse,
     JobResponse,
     JobStatus,
     JobStatusResponse,
@@ -38,6 +68,7 @@ from services.terraform_agent.models import (
     StateLockResponse,
     StateResponse,
     TerraformApplyRequest,
+    TerraformBatchRequest,
     TerraformDestroyRequest,
     TerraformImportRequest,
     TerraformOperationType,
@@ -52,6 +83,12 @@ from services.terraform_agent.models import (
     WorkspaceUpdateRequest,
 )
 
+try:
+    from services.terraform_agent import tasks
+except ImportError:
+    # Handle running from the service directory, e.g. `uvicorn app:app`
+    import tasks  # type: ignore[no-redef]
+
 # Configure structured logging
 structlog.configure(
     processors=[
@@ -83,90 +120,260 @@ OPERATION_COUNT = Counter(
     "terraform_agent_operations_total", "Total operations", ["operation", "status"]
 )
 
+# Bound REQUEST_COUNT label children, keyed by (method, route template)
+_request_count_children: Dict[Tuple[str, str], Any] = {}
+
+# Rendered /metrics payload and the monotonic time it was rendered at
+METRICS_CACHE_TTL_SECONDS = 1.0
+metrics_cache: Tuple[float, bytes] = (float("-inf"), b"")
+
+# Atomically read and delete a state lock, optionally only if the stored
+# lock_id matches ARGV[1]. Returns nil when no lock exists, otherwise
+# {deleted, payload} where deleted is 0 on a lock_id mismatch. Payloads
+# starting with "{" are JSON locks written before the switch to MessagePack.
+LUA_UNLOCK_STATE = """
+local payload = redis.call('GET', KEYS[1])
+if not payload then
+    return nil
+end
+if ARGV[1] ~= '' then
+    local lock
+    if string.byte(payload, 1) == 123 then
+        lock = cjson.decode(payload)
+    else
+        lock = cmsgpack.unpack(payload)
+    end
+    if lock['lock_id'] ~= ARGV[1] then
+        return {0, payload}
+    end
+end
+redis.call('DEL', KEYS[1])
+return {1, payload}
+"""
+
+
+class OperationSpec(NamedTuple):
+    """Request model and Celery task backing a Terraform operation"""
+
+    request_model: Type[BaseRequest]
+    task: Any
+    task_kwargs: Callable[[Any], Dict[str, Any]]
+
+
+# Variable count from which task messages are zstd-compressed
+TASK_COMPRESSION_MIN_VARIABLES = 10
+
+# Seconds a task may run beyond its Terraform command timeouts
+TASK_TIME_LIMIT_GRACE = 60
+
+# Operation-specific task arguments; job_id, workspace_name and timeout are
+# added by job_signature
+OPERATIONS: Dict[TerraformOperationType, OperationSpec] = {
+    TerraformOperationType.PLAN: OperationSpec(
+        TerraformPlanRequest,
+        tasks.execute_terraform_plan,
+        lambda request: {
+            "destroy": request.destroy,
+            "target_resources": request.target_resources,
+            "variables": request.variables_payload,
+            "refresh": request.refresh,
+        },
+    ),
+    TerraformOperationType.APPLY: OperationSpec(
+        TerraformApplyRequest,
+        tasks.execute_terraform_apply,
+        lambda request: {
+            "plan_id": str(request.plan_id) if request.plan_id else None,
+            "auto_approve": request.auto_approve,
+            "target_resources": request.target_resources,
+            "variables": request.variables_payload,
+        },
+    ),
+    TerraformOperationType.DESTROY: OperationSpec(
+        TerraformDestroyRequest,
+        tasks.execute_terraform_destroy,
+        lambda request: {
+            "auto_approve": request.auto_approve,
+            "target_resources": request.target_resources,
+            "variables": request.variables_payload,
+        },
+    ),
+    TerraformOperationType.IMPORT: OperationSpec(
+        TerraformImportRequest,
+        tasks.execute_terraform_import,
+        lambda request: {
+            "address": request.address,
+            "resource_id": request.id,
+            "variables": request.variables_payload,
+        },
+    ),
+    TerraformOperationType.REFRESH: OperationSpec(
+        TerraformRefreshRequest,
+        tasks.execute_terraform_refresh,
+        lambda request: {"variables": request.variables_payload},
+    ),
+    TerraformOperationType.VALIDATE: OperationSpec(
+        TerraformValidateRequest,
+        tasks.execute_terraform_validate,
+        lambda request: {},
+    ),
+}
+
+# Workspaces live in Redis; each process keeps a short-lived local cache that
+# other instances invalidate through the channel below
+WORKSPACE_KEY_PREFIX = "workspace:"
+WORKSPACE_INDEX_KEY = "terraform:workspaces"
+WORKSPACE_INVALIDATE_CHANNEL = "workspace:invalidate"
+WORKSPACE_TTL_SECONDS = 86400 * 30  # 30 days
+WORKSPACE_CACHE_SIZE = 1024
+WORKSPACE_CACHE_TTL_SECONDS = 60
+
+# Create a workspace hash with TTL ARGV[1] from the field/value pairs in
+# ARGV[3..] and add its name (ARGV[2]) to the index (KEYS[2]); returns the new
+# workspace count, or 0 without writing if the workspace already exists. A value
+# left in the old single-blob format is not a workspace and is replaced
+LUA_CREATE_WORKSPACE = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    if redis.call('TYPE', KEYS[1]).ok == 'hash' then
+        return 0
+    end
+    redis.call('DEL', KEYS[1])
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 3))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+redis.call('SADD', KEYS[2], ARGV[2])
+return redis.call('SCARD', KEYS[2])
+"""
+
+# Update fields of an existing workspace hash and refresh its TTL (ARGV[1]);
+# returns 0 without writing if the workspace no longer exists
+LUA_UPDATE_WORKSPACE = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
 # Global state
-redis_client: Optional[Redis[str]] = None
+redis_client: Optional[Redis] = None
+unlock_state_script: Optional[AsyncScript] = None
+create_workspace_script: Optional[AsyncScript] = None
+update_workspace_script: Optional[AsyncScript] = None
 celery_app: Optional[Celery] = None
 service_start_time = time.time()
+instance_id = uuid4().hex  # Identifies this process on the invalidation channel
+terraform_version = "unknown"  # Detected once at startup
+
+# Local workspace cache (Redis is the source of truth)
+workspaces: TTLCache = TTLCache(
+    maxsize=WORKSPACE_CACHE_SIZE, ttl=WORKSPACE_CACHE_TTL_SECONDS
+)
+
+
+@dataclass(slots=True)
+class JobRecord:
+    """Slotted in-memory job bookkeeping, with fields declared in JobInfo order"""
+
+    id: UUID
+    operation: TerraformOperationType
+    workspace_name: str
+    status: JobStatus
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    duration_seconds: Optional[float] = None
+    progress: int = 0
+    logs: List[str] = field(default_factory=list)
+    error_message: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+
+    def to_info(self) -> JobInfo:
+        """Build the API representation of this job
+
+        The record is built by the server itself, so validation is skipped.
+        """
+        return JobInfo.model_construct(
+            **{name: getattr(self, name) for name in self.__slots__}
+        )
+
+
+# Log lines kept per job in job list responses; the full log is served by
+# /api/v1/jobs/{job_id}/logs
+JOB_LIST_LOG_TAIL = 50
 
 # In-memory storage (should be replaced with persistent storage in production)
-workspaces: Dict[str, WorkspaceInfo] = {}
-jobs: Dict[UUID, JobInfo] = {}
+jobs: Dict[UUID, JobRecord] = {}
+
+# Secondary job indexes used by list_jobs (dicts used as insertion-ordered sets)
+jobs_by_workspace: Dict[str, Dict[UUID, None]] = {}
+jobs_by_operation: Dict[TerraformOperationType, Dict[UUID, None]] = {}
+jobs_by_status: Dict[JobStatus, Dict[UUID, None]] = {}
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan management"""
-    global redis_client, celery_app
+    global redis_client, celery_app, terraform_version
+    global unlock_state_script, create_workspace_script, update_workspace_script
 
+    log_listener = start_log_queue()
     logger.info("Starting Enhanced Terraform Executor Service...")
 
+    redis_pool: Optional[redis.ConnectionPool] = None
+    invalidation_task: Optional[asyncio.Task[None]] = None
+
     try:
         # Initialize Redis connection with authentication
-        redis_password = os.getenv("REDIS_PASSWORD")
-        redis_host = os.getenv("REDIS_HOST", "redis")
-
-        # Handle Redis port with fallback for service env vars
-        redis_port_str = os.getenv("REDIS_PORT", "6379")
-        try:
-            # Extract just the port number if it's a full URL
-            if ":" in redis_port_str and "tcp://" in redis_port_str:
-                redis_port = int(redis_port_str.split(":")[-1])
-            else:
-                redis_port = int(redis_port_str)
-        except ValueError:
-            logger.warning(
-                f"Invalid REDIS_PORT value: {redis_port_str}, using default 6379"
-            )
-            redis_port = 6379
-
-        redis_db = int(os.getenv("REDIS_DB", "0"))
-
-        if redis_password:
-            redis_url = (
-                f"redis://:{redis_password}@{redis_host}:{redis_port}/{redis_db}"
-            )
-        else:
-            redis_url = f"redis://{redis_host}:{redis_port}/{redis_db}"
-
-        redis_client = redis.from_url(redis_url, decode_responses=True)
+        redis_url = tasks.redis_url_from_env()
+
+        # Size the pool explicitly so concurrent lock/workspace handlers do
+        # not queue behind a small default pool; once it is exhausted,
+        # handlers wait briefly for a free connection instead of failing
+        redis_pool_max = int(os.getenv("REDIS_POOL_MAX", "64"))
+        redis_pool_timeout = float(os.getenv("REDIS_POOL_TIMEOUT", "0.5"))
+        redis_pool = redis.BlockingConnectionPool.from_url(
+            redis_url,
+            max_connections=redis_pool_max,
+            timeout=redis_pool_timeout,
+            socket_keepalive=True,
+            socket_timeout=5,
+            health_check_interval=30,
+            decode_responses=False,
+        )
+        redis_client = redis.Redis(connection_pool=redis_pool)
         await redis_client.ping()
         logger.info(
             "Connected to Redis",
-            redis_host=redis_host,
-            redis_port=redis_port,
-            redis_db=redis_db,
-        )
-
-        # Initialize Celery
-        broker_url = os.getenv("CELERY_BROKER_URL", redis_url)
-        celery_app = Celery(
-            "terraform_agent",
-            broker=broker_url,
-            backend=broker_url,
-            include=["terraform_agent.tasks"],
+            redis_host=redis_pool.connection_kwargs.get("host"),
+            redis_port=redis_pool.connection_kwargs.get("port"),
+            redis_db=redis_pool.connection_kwargs.get("db"),
+            pool_max_connections=redis_pool_max,
+            pool_timeout=redis_pool_timeout,
+            hiredis_parser=HIREDIS_AVAILABLE,
         )
+        if not HIREDIS_AVAILABLE:
+            logger.warning(
+                "hiredis not installed, falling back to the pure-Python RESP parser"
+            )
+        unlock_state_script = redis_client.register_script(LUA_UNLOCK_STATE)
+        create_workspace_script = redis_client.register_script(LUA_CREATE_WORKSPACE)
+        update_workspace_script = redis_client.register_script(LUA_UPDATE_WORKSPACE)
 
-        # Configure Celery
-        celery_app.conf.update(
-            task_serializer="json",
-            accept_content=["json"],
-            result_serializer="json",
-            timezone="UTC",
-            enable_utc=True,
-            task_routes={
-                "terraform_agent.tasks.*": {"queue": "terraform"},
-            },
-            worker_concurrency=int(os.getenv("CELERY_WORKER_CONCURRENCY", "4")),
-            task_soft_time_limit=int(
-                os.getenv("CELERY_SOFT_TIME_LIMIT", "1800")
-            ),  # 30 minutes
-            task_time_limit=int(os.getenv("CELERY_TIME_LIMIT", "3600")),  # 60 minutes
+        WORKSPACE_COUNT.set(await redis_client.scard(WORKSPACE_INDEX_KEY))
+        invalidation_task = asyncio.create_task(
+            workspace_invalidation_listener(redis_client)
         )
 
-        logger.info("Celery configured", broker=broker_url)
+        # The Celery app the tasks are registered on is configured in the
+        # tasks module, which the worker loads as well
+        celery_app = tasks.celery_app
+        logger.info("Celery configured", broker=celery_app.conf.broker_url)
 
-        # Verify Terraform installation
-        terraform_version = get_terraform_version()
+        # Verify Terraform installation; the version is fixed for the process
+        # lifetime so it is cached rather than re-detected per request
+        terraform_version = await get_terraform_version()
         logger.info("Terraform version detected", version=terraform_version)
 
         yield
@@ -176,9 +383,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         raise
     finally:
         # Cleanup
+        if invalidation_task is not None:
+            invalidation_task.cancel()
+            try:
+                await invalidation_task
+            except asyncio.CancelledError:
+                pass
         if redis_client is not None:
             await redis_client.close()
+        if redis_pool is not None:
+            await redis_pool.disconnect()
         logger.info("Enhanced Terraform Executor Service stopped")
+        if log_listener is not None:
+            stop_log_queue(log_listener)
 
 
 app = FastAPI(
@@ -187,21 +404,40 @@ app = FastAPI(
     version="2.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
+
+class MetricsExemptGZipMiddleware(GZipMiddleware):
+    """GZip middleware that leaves the Prometheus scrape endpoint uncompressed"""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
 # Add middleware
-app.add_middleware(GZipMiddleware, minimum_size=1000)
-app.add_middleware(
-    TrustedHostMiddleware, allowed_hosts=["*"]
-)  # Configure appropriately for production
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(MetricsExemptGZipMiddleware, minimum_size=1000)
+
+# Host validation only runs when TRUSTED_HOSTS restricts hosts; a wildcard
+# would accept every request anyway
+trusted_hosts = [
+    host.strip() for host in os.getenv("TRUSTED_HOSTS", "*").split(",") if host.strip()
+]
+if trusted_hosts and trusted_hosts != ["*"]:
+    app.add_middleware(TrustedHostMiddleware, allowed_hosts=trusted_hosts)
+
+if os.getenv("CORS_ENABLED", "true").lower() == "true":
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # Configure appropriately for production
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 
 # Middleware for request metrics
@@ -210,18 +446,25 @@ async def metrics_middleware(
     request: Request, call_next: Callable[[Request], Awaitable[Any]]
 ) -> Any:
     """Middleware to collect request metrics"""
-    time.time()
-
-    with REQUEST_DURATION.time():
-        response = await call_next(request)
-
-    REQUEST_COUNT.labels(method=request.method, endpoint=request.url.path).inc()
+    start = time.monotonic()
+    response = await call_next(request)
+    REQUEST_DURATION.observe(time.monotonic() - start)
+
+    # Label by route template rather than raw path to bound label cardinality
+    route = request.scope.get("route")
+    endpoint = route.path if route is not None else "unmatched"
+    key = (request.method, endpoint)
+    counter = _request_count_children.get(key)
+    if counter is None:
+        counter = REQUEST_COUNT.labels(method=request.method, endpoint=endpoint)
+        _request_count_children[key] = counter
+    counter.inc()
 
     return response
 
 
 # Dependency functions
-async def get_redis() -> Redis[str]:
+async def get_redis() -> Redis:
     """Get Redis client"""
     if not redis_client:
         raise HTTPException(
@@ -241,57 +484,411 @@ async def get_celery() -> Celery:
     return celery_app
 
 
-def get_terraform_version() -> str:
+def encode_workspace(
+    workspace: WorkspaceInfo, fields: Optional[Set[str]] = None
+) -> Dict[str, bytes]:
+    """Serialize workspace fields as MessagePack values of a Redis hash
+
+    Args:
+        workspace: Workspace to serialize
+        fields: Field names to include; all fields when omitted
+
+    Returns:
+        Mapping of field name to encoded value
+    """
+    data = workspace.model_dump(mode="json", include=fields)
+    return {name: msgpack.packb(value) for name, value in data.items()}
+
+
+def decode_workspace(data: Dict[bytes, bytes]) -> WorkspaceInfo:
+    """Deserialize a workspace hash written by encode_workspace"""
+    return WorkspaceInfo.model_validate(
+        {name.decode(): msgpack.unpackb(value) for name, value in data.items()}
+    )
+
+
+def decode_lock(payload: bytes) -> Dict[str, Any]:
+    """Deserialize a state lock, accepting JSON locks from older releases"""
+    if payload[:1] == b"{":
+        return orjson.loads(payload)
+    return msgpack.unpackb(payload)
+
+
+async def load_workspace(redis_conn: Redis, name: str) -> Optional[WorkspaceInfo]:
+    """Read a workspace through the local cache, falling back to Redis"""
+    workspace = workspaces.get(name)
+    if workspace is None:
+        try:
+            data = await redis_conn.hgetall(f"{WORKSPACE_KEY_PREFIX}{name}")
+        except redis.ResponseError:
+            # A value left in the old single-blob format; the next full write
+            # replaces it with a hash
+            logger.warning("Ignoring non-hash workspace record", workspace=name)
+            return None
+        if not data:
+            return None
+        workspace = decode_workspace(data)
+        workspaces[name] = workspace
+    return workspace
+
+
+async def require_workspace(redis_conn: Redis, name: str) -> WorkspaceInfo:
+    """Load a workspace or raise 404 if it does not exist"""
+    workspace = await load_workspace(redis_conn, name)
+    if workspace is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Workspace '{name}' not found",
+        )
+    return workspace
+
+
+async def insert_workspace(redis_conn: Redis, workspace: WorkspaceInfo) -> bool:
+    """Persist a new workspace unless one with the same name already exists
+
+    Args:
+        redis_conn: Redis client
+        workspace: Workspace to create
+
+    Returns:
+        False if the workspace already exists and nothing was written
+    """
+    if create_workspace_script is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Redis connection not available",
+        )
+
+    args: List[Any] = [WORKSPACE_TTL_SECONDS, workspace.name]
+    for name, value in encode_workspace(workspace).items():
+        args.extend((name, value))
+
+    async with redis_conn.pipeline(transaction=False) as pipe:
+        await create_workspace_script(
+            keys=[f"{WORKSPACE_KEY_PREFIX}{workspace.name}", WORKSPACE_INDEX_KEY],
+            args=args,
+            client=pipe,
+        )
+        pipe.publish(WORKSPACE_INVALIDATE_CHANNEL, f"{instance_id}:{workspace.name}")
+        total, _ = await pipe.execute()
+
+    if not total:
+        return False
+    workspaces[workspace.name] = workspace
+    WORKSPACE_COUNT.set(total)
+    return True
+
+
+async def update_workspace_fields(
+    redis_conn: Redis, workspace: WorkspaceInfo, fields: Set[str]
+) -> bool:
+    """Write only the changed fields of an existing workspace
+
+    Args:
+        redis_conn: Redis client
+        workspace: Workspace with its new state
+        fields: Names of the fields that changed
+
+    Returns:
+        False if the workspace was deleted concurrently and nothing was written
+    """
+    if update_workspace_script is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Redis connection not available",
+        )
+
+    args: List[Any] = [WORKSPACE_TTL_SECONDS]
+    for name, value in encode_workspace(workspace, fields).items():
+        args.extend((name, value))
+
+    async with redis_conn.pipeline(transaction=False) as pipe:
+        await update_workspace_script(
+            keys=[f"{WORKSPACE_KEY_PREFIX}{workspace.name}"], args=args, client=pipe
+        )
+        pipe.publish(WORKSPACE_INVALIDATE_CHANNEL, f"{instance_id}:{workspace.name}")
+        updated, _ = await pipe.execute()
+
+    if not updated:
+        workspaces.pop(workspace.name, None)
+        return False
+    workspaces[workspace.name] = workspace
+    return True
+
+
+async def remove_workspace(redis_conn: Redis, name: str) -> None:
+    """Delete a workspace and invalidate other instances' cached copies"""
+    async with redis_conn.pipeline(transaction=True) as pipe:
+        pipe.delete(f"{WORKSPACE_KEY_PREFIX}{name}")
+        pipe.srem(WORKSPACE_INDEX_KEY, name)
+        pipe.publish(WORKSPACE_INVALIDATE_CHANNEL, f"{instance_id}:{name}")
+        pipe.scard(WORKSPACE_INDEX_KEY)
+        *_, total = await pipe.execute()
+
+    workspaces.pop(name, None)
+    WORKSPACE_COUNT.set(total)
+
+
+async def workspace_invalidation_listener(redis_conn: Redis) -> None:
+    """Evict locally cached workspaces that other instances have changed"""
+    while True:
+        pubsub = redis_conn.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(WORKSPACE_INVALIDATE_CHANNEL)
+            # Messages may have been missed while unsubscribed
+            workspaces.clear()
+            async for message in pubsub.listen():
+                origin, _, name = message["data"].decode().partition(":")
+                if origin != instance_id:
+                    workspaces.pop(name, None)
+        except redis.RedisError as e:
+            logger.warning("Workspace invalidation listener failed", error=str(e))
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.aclose()
+
+
+def start_log_queue() -> Optional[QueueListener]:
+    """Move the root log handlers behind a queue drained by a background thread
+
+    Records are still rendered by structlog on the calling thread, but the
+    handlers' formatting and stream I/O no longer run on the event loop.
+
+    Returns:
+        The started listener, or None if the root logger has no handlers
+    """
+    root = logging.getLogger()
+    if not root.handlers:
+        return None
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
+def stop_log_queue(listener: QueueListener) -> None:
+    """Flush queued records and hand the handlers back to the root logger"""
+    listener.stop()
+    logging.getLogger().handlers = list(listener.handlers)
+
+
+def add_job(job: JobRecord) -> None:
+    """Register a new job in the job store and its secondary indexes"""
+    jobs[job.id] = job
+    jobs_by_workspace.setdefault(job.workspace_name, {})[job.id] = None
+    jobs_by_operation.setdefault(job.operation, {})[job.id] = None
+    jobs_by_status.setdefault(job.status, {})[job.id] = None
+
+
+def set_job_status(job: JobRecord, new_status: JobStatus) -> None:
+    """Transition a job to a new status, keeping the status index in sync"""
+    jobs_by_status.get(job.status, {}).pop(job.id, None)
+    job.status = new_status
+    jobs_by_status.setdefault(new_status, {})[job.id] = None
+
+
+def job_time_limit(timeout: Optional[int]) -> Optional[int]:
+    """Hard time limit for a job with the given Terraform command timeout
+
+    Init and the operation itself each get the timeout; the limit backs that up
+    for a task stuck outside the CLI. It is a hard limit because the gevent pool
+    ignores soft limits, and it never exceeds the worker-wide limit the broker's
+    visibility timeout is sized for.
+    """
+    if not timeout:
+        return None
+    return min(
+        2 * timeout + TASK_TIME_LIMIT_GRACE, tasks.celery_app.conf.task_time_limit
+    )
+
+
+def job_signature(
+    operation: TerraformOperationType, request: Any, job_id: UUID
+) -> Signature:
+    """Build the Celery signature that runs an operation request as a job"""
+    spec = OPERATIONS[operation]
+    task_kwargs = spec.task_kwargs(request)
+    signature = spec.task.s(
+        job_id=str(job_id),
+        workspace_name=request.workspace_name,
+        timeout=request.timeout,
+        **task_kwargs,
+    )
+    time_limit = job_time_limit(request.timeout)
+    if time_limit:
+        signature.set(time_limit=time_limit)
+    # Compression only pays off once the variable set is sizeable; small
+    # messages come out larger after zstd framing
+    if len(task_kwargs.get("variables", ())) >= TASK_COMPRESSION_MIN_VARIABLES:
+        signature.set(compression="zstd")
+    return signature
+
+
+def register_job(
+    operation: TerraformOperationType, job_id: UUID, workspace_name: str
+) -> JobRecord:
+    """Record a job whose Celery task has been accepted by the broker"""
+    job = JobRecord(
+        id=job_id,
+        operation=operation,
+        workspace_name=workspace_name,
+        status=JobStatus.QUEUED,
+        created_at=datetime.utcnow(),
+    )
+    add_job(job)
+    ACTIVE_JOBS.inc()
+    OPERATION_COUNT.labels(operation=operation.value, status="submitted").inc()
+
+    logger.info(
+        f"Terraform {operation.value} job submitted",
+        job_id=str(job_id),
+        workspace=workspace_name,
+    )
+    return job
+
+
+def submit_job(operation: TerraformOperationType, request: Any) -> JobResponse:
+    """Dispatch a Terraform operation request and register its job
+
+    The job is recorded once, already QUEUED, after the broker has accepted
+    the task, so a failed dispatch leaves no orphaned job behind.
+    """
+    job_id = uuid4()
+    job_signature(operation, request, job_id).delay()
+    job = register_job(operation, job_id, request.workspace_name)
+
+    return JobResponse.model_construct(
+        success=True,
+        message=(
+            f"Terraform {operation.value} job submitted for workspace "
+            f"'{request.workspace_name}'"
+        ),
+        job=job.to_info(),
+        correlation_id=request.correlation_id,
+    )
+
+
+async def get_terraform_version() -> str:
     """Get Terraform version with proper error handling."""
     try:
-        # Security: Using shell=False and explicit command list for safety
-        result = subprocess.run(  # nosec B603 B607
-            ["terraform", "version", "-json"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            shell=False,
+        # Security: exec (no shell) with an explicit argument list for safety
+        proc = await asyncio.create_subprocess_exec(  # nosec B603 B607
+            "terraform",
+            "version",
+            "-json",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        if result.returncode == 0:
-            version_data = json.loads(result.stdout)
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        if proc.returncode == 0:
+            version_data = orjson.loads(stdout)
             version = version_data.get("terraform_version")
             return str(version) if version else "unknown"
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError) as e:
+    except (asyncio.TimeoutError, orjson.JSONDecodeError, FileNotFoundError) as e:
         logger.warning("Failed to get Terraform version", error=str(e))
     except Exception as e:
         logger.error("Unexpected error getting Terraform version", error=str(e))
     return "unknown"
 
 
+def json_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize a response model straight to JSON bytes
+
+    Endpoints declare their schema through ``responses`` rather than
+    ``response_model``, so FastAPI neither re-validates the returned model nor
+    walks it with jsonable_encoder; pydantic-core writes the JSON in one pass.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def job_list_response(
+    message: str,
+    records: List[JobRecord],
+    total: int,
+    status_code: int = status.HTTP_200_OK,
+    correlation_id: Optional[str] = None,
+) -> ORJSONResponse:
+    """Build a JobListResponse-shaped body straight from job records
+
+    JobRecord declares its fields in JobInfo order, and orjson encodes the
+    slotted dataclasses natively, so no JobInfo models are built per job.
+    Logs longer than JOB_LIST_LOG_TAIL lines are cut to their tail.
+    """
+    records = [
+        (
+            record
+            if len(record.logs) <= JOB_LIST_LOG_TAIL
+            else replace(record, logs=record.logs[-JOB_LIST_LOG_TAIL:])
+        )
+        for record in records
+    ]
+    return ORJSONResponse(
+        status_code=status_code,
+        content={
+            "success": True,
+            "message": message,
+            "timestamp": datetime.utcnow(),
+            "correlation_id": correlation_id,
+            "jobs": records,
+            "total": total,
+        },
+    )
+
+
 # API Endpoints
 
 
-@app.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+@app.get("/health", responses={200: {"model": HealthResponse}})
+async def health_check() -> Response:
     """Enhanced health check endpoint"""
     uptime = time.time() - service_start_time
     active_jobs_count = len([j for j in jobs.values() if j.status == JobStatus.RUNNING])
+    total_workspaces = (
+        await redis_client.scard(WORKSPACE_INDEX_KEY) if redis_client else 0
+    )
 
-    return HealthResponse(
-        success=True,
-        message="Service is healthy",
-        service="terraform-executor",
-        version="2.0.0",
-        terraform_version=get_terraform_version(),
-        uptime_seconds=uptime,
-        active_jobs=active_jobs_count,
-        total_workspaces=len(workspaces),
-        system_info={
-            "redis_connected": redis_client is not None,
-            "celery_available": celery_app is not None,
-        },
+    return json_response(
+        HealthResponse.model_construct(
+            success=True,
+            message="Service is healthy",
+            service="terraform-executor",
+            version="2.0.0",
+            terraform_version=terraform_version,
+            uptime_seconds=uptime,
+            active_jobs=active_jobs_count,
+            total_workspaces=total_workspaces,
+            system_info={
+                "redis_connected": redis_client is not None,
+                "celery_available": celery_app is not None,
+            },
+        )
     )
 
 
 @app.get("/metrics")
-async def get_metrics() -> bytes:
+async def get_metrics() -> Response:
     """Prometheus metrics endpoint"""
-    return generate_latest()
+    global metrics_cache
+
+    # Scrapes arriving within the TTL share one rendering of the registry
+    now = time.monotonic()
+    rendered_at, payload = metrics_cache
+    if now - rendered_at >= METRICS_CACHE_TTL_SECONDS:
+        payload = generate_latest()
+        metrics_cache = (now, payload)
+
+    # Passed as a header so Starlette does not append a second charset
+    return Response(content=payload, headers={"Content-Type": CONTENT_TYPE_LATEST})
 
 
 # Workspace Management Endpoints
@@ -299,151 +896,170 @@ async def get_metrics() -> bytes:
 
 @app.post(
     "/api/v1/workspaces",
-    response_model=WorkspaceResponse,
     status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": WorkspaceResponse}},
 )
 async def create_workspace(
     request: WorkspaceCreateRequest,
     background_tasks: BackgroundTasks,
-    redis_conn: Redis[str] = Depends(get_redis),
-) -> WorkspaceResponse:
+    redis_conn: Redis = Depends(get_redis),
+) -> Response:
     """Create a new Terraform workspace"""
-    if request.name in workspaces:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Workspace '{request.name}' already exists",
-        )
-
     workspace_id = uuid4()
+    now = datetime.utcnow()
     workspace = WorkspaceInfo(
         id=workspace_id,
         name=request.name,
         description=request.description,
         status=WorkspaceStatus.ACTIVE,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=now,
+        updated_at=now,
         git_repository=request.git_repository,
         variables_count=len(request.variables),
     )
 
-    workspaces[request.name] = workspace
-    WORKSPACE_COUNT.set(len(workspaces))
-
-    # Store workspace data in Redis for persistence
-    await redis_conn.set(
-        f"workspace:{request.name}", workspace.model_dump_json(), ex=86400 * 30
-    )  # 30 days TTL
+    # Checked and written atomically, so concurrent creates of the same name
+    # cannot both succeed
+    if not await insert_workspace(redis_conn, workspace):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Workspace '{request.name}' already exists",
+        )
 
     logger.info(
         "Workspace created", workspace_name=request.name, workspace_id=str(workspace_id)
     )
 
-    return WorkspaceResponse(
-        success=True,
-        message=f"Workspace '{request.name}' created successfully",
-        workspace=workspace,
-        correlation_id=request.correlation_id,
+    return json_response(
+        WorkspaceResponse.model_construct(
+            success=True,
+            message=f"Workspace '{request.name}' created successfully",
+            workspace=workspace,
+            correlation_id=request.correlation_id,
+        ),
+        status.HTTP_201_CREATED,
     )
 
 
-@app.get("/api/v1/workspaces", response_model=WorkspaceListResponse)
-async def list_workspaces() -> WorkspaceListResponse:
+@app.get("/api/v1/workspaces", responses={200: {"model": WorkspaceListResponse}})
+async def list_workspaces(
+    redis_conn: Redis = Depends(get_redis),
+) -> Response:
     """List all workspaces"""
-    workspace_list = list(workspaces.values())
-
-    return WorkspaceListResponse(
-        success=True,
-        message=f"Retrieved {len(workspace_list)} workspaces",
-        workspaces=workspace_list,
-        total=len(workspace_list),
+    names = sorted(
+        name.decode() for name in await redis_conn.smembers(WORKSPACE_INDEX_KEY)
+    )
+    workspace_list = []
+    expired = []
+    if names:
+        async with redis_conn.pipeline(transaction=False) as pipe:
+            for name in names:
+                pipe.hgetall(f"{WORKSPACE_KEY_PREFIX}{name}")
+            records = await pipe.execute()
+        for name, data in zip(names, records):
+            if not data:
+                expired.append(name)
+                continue
+            workspace = decode_workspace(data)
+            workspaces[name] = workspace
+            workspace_list.append(workspace)
+
+    # Drop index entries whose workspace key has expired
+    if expired:
+        await redis_conn.srem(WORKSPACE_INDEX_KEY, *expired)
+
+    return json_response(
+        WorkspaceListResponse.model_construct(
+            success=True,
+            message=f"Retrieved {len(workspace_list)} workspaces",
+            workspaces=workspace_list,
+            total=len(workspace_list),
+        )
     )
 
 
-@app.get("/api/v1/workspaces/{workspace_name}", response_model=WorkspaceResponse)
-async def get_workspace(workspace_name: str) -> WorkspaceResponse:
+@app.get(
+    "/api/v1/workspaces/{workspace_name}", responses={200: {"model": WorkspaceResponse}}
+)
+async def get_workspace(
+    workspace_name: str, redis_conn: Redis = Depends(get_redis)
+) -> Response:
     """Get workspace details"""
-    if workspace_name not in workspaces:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workspace '{workspace_name}' not found",
-        )
-
-    workspace = workspaces[workspace_name]
+    workspace = await require_workspace(redis_conn, workspace_name)
 
-    return WorkspaceResponse(
-        success=True,
-        message=f"Workspace '{workspace_name}' retrieved successfully",
-        workspace=workspace,
+    return json_response(
+        WorkspaceResponse.model_construct(
+            success=True,
+            message=f"Workspace '{workspace_name}' retrieved successfully",
+            workspace=workspace,
+        )
     )
 
 
-@app.put("/api/v1/workspaces/{workspace_name}", response_model=WorkspaceResponse)
+@app.put(
+    "/api/v1/workspaces/{workspace_name}", responses={200: {"model": WorkspaceResponse}}
+)
 async def update_workspace(
     workspace_name: str,
     request: WorkspaceUpdateRequest,
-    redis_conn: Redis[str] = Depends(get_redis),
-) -> WorkspaceResponse:
+    redis_conn: Redis = Depends(get_redis),
+) -> Response:
     """Update workspace configuration"""
-    if workspace_name not in workspaces:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workspace '{workspace_name}' not found",
-        )
+    # Copy so the cached instance is only replaced once Redis accepts the write
+    workspace = (await require_workspace(redis_conn, workspace_name)).model_copy()
 
-    workspace = workspaces[workspace_name]
-
-    # Update fields if provided
+    # Update fields if provided, tracking which hash fields need rewriting
+    changed = {"updated_at"}
     if request.description is not None:
         workspace.description = request.description
+        changed.add("description")
     if request.git_repository is not None:
         workspace.git_repository = request.git_repository
+        changed.add("git_repository")
     if request.variables is not None:
         workspace.variables_count = len(request.variables)
+        changed.add("variables_count")
     if request.auto_apply is not None:
         # Store auto_apply setting (would need to extend WorkspaceInfo model)
         pass
 
     workspace.updated_at = datetime.utcnow()
-    workspaces[workspace_name] = workspace
-
-    # Update in Redis
-    await redis_conn.set(
-        f"workspace:{workspace_name}", workspace.model_dump_json(), ex=86400 * 30
-    )
+    if not await update_workspace_fields(redis_conn, workspace, changed):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Workspace '{workspace_name}' not found",
+        )
 
     logger.info("Workspace updated", workspace_name=workspace_name)
 
-    return WorkspaceResponse(
-        success=True,
-        message=f"Workspace '{workspace_name}' updated successfully",
-        workspace=workspace,
-        correlation_id=request.correlation_id,
+    return json_response(
+        WorkspaceResponse.model_construct(
+            success=True,
+            message=f"Workspace '{workspace_name}' updated successfully",
+            workspace=workspace,
+            correlation_id=request.correlation_id,
+        )
     )
 
 
-@app.delete("/api/v1/workspaces/{workspace_name}", response_model=WorkspaceResponse)
+@app.delete(
+    "/api/v1/workspaces/{workspace_name}", responses={200: {"model": WorkspaceResponse}}
+)
 async def delete_workspace(
-    workspace_name: str, redis_conn: Redis[str] = Depends(get_redis)
-) -> WorkspaceResponse:
+    workspace_name: str, redis_conn: Redis = Depends(get_redis)
+) -> Response:
     """Delete a workspace"""
-    if workspace_name not in workspaces:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workspace '{workspace_name}' not found",
-        )
-
-    workspace = workspaces.pop(workspace_name)
-    WORKSPACE_COUNT.set(len(workspaces))
-
-    # Remove from Redis
-    await redis_conn.delete(f"workspace:{workspace_name}")
+    workspace = await require_workspace(redis_conn, workspace_name)
+    await remove_workspace(redis_conn, workspace_name)
 
     logger.info("Workspace deleted", workspace_name=workspace_name)
 
-    return WorkspaceResponse(
-        success=True,
-        message=f"Workspace '{workspace_name}' deleted successfully",
-        workspace=workspace,
+    return json_response(
+        WorkspaceResponse.model_construct(
+            success=True,
+            message=f"Workspace '{workspace_name}' deleted successfully",
+            workspace=workspace,
+        )
     )
 
 
@@ -452,348 +1068,172 @@ async def delete_workspace(
 
 @app.post(
     "/api/v1/terraform/plan",
-    response_model=JobResponse,
     status_code=status.HTTP_202_ACCEPTED,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobResponse}},
 )
 async def terraform_plan(
-    request: TerraformPlanRequest, celery: Celery = Depends(get_celery)
-) -> JobResponse:
+    request: TerraformPlanRequest,
+    celery: Celery = Depends(get_celery),
+    redis_conn: Redis = Depends(get_redis),
+) -> Response:
     """Execute terraform plan asynchronously"""
-    if request.workspace_name not in workspaces:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workspace '{request.workspace_name}' not found",
-        )
+    await require_workspace(redis_conn, request.workspace_name)
 
-    job_id = uuid4()
-    job = JobInfo(
-        id=job_id,
-        operation=TerraformOperationType.PLAN,
-        workspace_name=request.workspace_name,
-        status=JobStatus.SUBMITTED,
-        created_at=datetime.utcnow(),
-    )
-
-    jobs[job_id] = job
-    ACTIVE_JOBS.inc()
-    OPERATION_COUNT.labels(operation="plan", status="submitted").inc()
-
-    # Submit Celery task
-    from tasks import execute_terraform_plan
-
-    _task = execute_terraform_plan.delay(  # noqa: F841
-        job_id=str(job_id),
-        workspace_name=request.workspace_name,
-        destroy=request.destroy,
-        target_resources=request.target_resources,
-        variables=[var.model_dump() for var in request.variables],
-        refresh=request.refresh,
-        timeout=request.timeout,
-    )
-
-    job.status = JobStatus.QUEUED
-    jobs[job_id] = job
-
-    logger.info(
-        "Terraform plan job submitted",
-        job_id=str(job_id),
-        workspace=request.workspace_name,
-    )
-
-    return JobResponse(
-        success=True,
-        message=f"Terraform plan job submitted for workspace '{request.workspace_name}'",
-        job=job,
-        correlation_id=request.correlation_id,
+    return json_response(
+        submit_job(TerraformOperationType.PLAN, request), status.HTTP_202_ACCEPTED
     )
 
 
 @app.post(
     "/api/v1/terraform/apply",
-    response_model=JobResponse,
     status_code=status.HTTP_202_ACCEPTED,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobResponse}},
 )
 async def terraform_apply(
-    request: TerraformApplyRequest, celery: Celery = Depends(get_celery)
-) -> JobResponse:
+    request: TerraformApplyRequest,
+    celery: Celery = Depends(get_celery),
+    redis_conn: Redis = Depends(get_redis),
+) -> Response:
     """Execute terraform apply asynchronously"""
-    if request.workspace_name not in workspaces:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workspace '{request.workspace_name}' not found",
-        )
+    await require_workspace(redis_conn, request.workspace_name)
 
-    job_id = uuid4()
-    job = JobInfo(
-        id=job_id,
-        operation=TerraformOperationType.APPLY,
-        workspace_name=request.workspace_name,
-        status=JobStatus.SUBMITTED,
-        created_at=datetime.utcnow(),
-    )
-
-    jobs[job_id] = job
-    ACTIVE_JOBS.inc()
-    OPERATION_COUNT.labels(operation="apply", status="submitted").inc()
-
-    # Submit Celery task
-    from tasks import execute_terraform_apply
-
-    _task = execute_terraform_apply.delay(  # noqa: F841
-        job_id=str(job_id),
-        workspace_name=request.workspace_name,
-        plan_id=str(request.plan_id) if request.plan_id else None,
-        auto_approve=request.auto_approve,
-        target_resources=request.target_resources,
-        variables=[var.model_dump() for var in request.variables],
-        timeout=request.timeout,
-    )
-
-    job.status = JobStatus.QUEUED
-    jobs[job_id] = job
-
-    logger.info(
-        "Terraform apply job submitted",
-        job_id=str(job_id),
-        workspace=request.workspace_name,
-    )
-
-    return JobResponse(
-        success=True,
-        message=f"Terraform apply job submitted for workspace '{request.workspace_name}'",
-        job=job,
-        correlation_id=request.correlation_id,
+    return json_response(
+        submit_job(TerraformOperationType.APPLY, request), status.HTTP_202_ACCEPTED
     )
 
 
 @app.post(
     "/api/v1/terraform/destroy",
-    response_model=JobResponse,
     status_code=status.HTTP_202_ACCEPTED,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobResponse}},
 )
 async def terraform_destroy(
-    request: TerraformDestroyRequest, celery: Celery = Depends(get_celery)
-) -> JobResponse:
+    request: TerraformDestroyRequest,
+    celery: Celery = Depends(get_celery),
+    redis_conn: Redis = Depends(get_redis),
+) -> Response:
     """Execute terraform destroy asynchronously"""
-    if request.workspace_name not in workspaces:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workspace '{request.workspace_name}' not found",
-        )
+    await require_workspace(redis_conn, request.workspace_name)
 
-    job_id = uuid4()
-    job = JobInfo(
-        id=job_id,
-        operation=TerraformOperationType.DESTROY,
-        workspace_name=request.workspace_name,
-        status=JobStatus.SUBMITTED,
-        created_at=datetime.utcnow(),
-    )
-
-    jobs[job_id] = job
-    ACTIVE_JOBS.inc()
-    OPERATION_COUNT.labels(operation="destroy", status="submitted").inc()
-
-    # Submit Celery task
-    from tasks import execute_terraform_destroy
-
-    _task = execute_terraform_destroy.delay(  # noqa: F841
-        job_id=str(job_id),
-        workspace_name=request.workspace_name,
-        auto_approve=request.auto_approve,
-        target_resources=request.target_resources,
-        variables=[var.model_dump() for var in request.variables],
-        timeout=request.timeout,
-    )
-
-    job.status = JobStatus.QUEUED
-    jobs[job_id] = job
-
-    logger.info(
-        "Terraform destroy job submitted",
-        job_id=str(job_id),
-        workspace=request.workspace_name,
-    )
-
-    return JobResponse(
-        success=True,
-        message=f"Terraform destroy job submitted for workspace '{request.workspace_name}'",
-        job=job,
-        correlation_id=request.correlation_id,
+    return json_response(
+        submit_job(TerraformOperationType.DESTROY, request), status.HTTP_202_ACCEPTED
     )
 
 
 @app.post(
     "/api/v1/terraform/import",
-    response_model=JobResponse,
     status_code=status.HTTP_202_ACCEPTED,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobResponse}},
 )
 async def terraform_import(
-    request: TerraformImportRequest, celery: Celery = Depends(get_celery)
-) -> JobResponse:
+    request: TerraformImportRequest,
+    celery: Celery = Depends(get_celery),
+    redis_conn: Redis = Depends(get_redis),
+) -> Response:
     """Import existing infrastructure into Terraform state"""
-    if request.workspace_name not in workspaces:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workspace '{request.workspace_name}' not found",
-        )
-
-    job_id = uuid4()
-    job = JobInfo(
-        id=job_id,
-        operation=TerraformOperationType.IMPORT,
-        workspace_name=request.workspace_name,
-        status=JobStatus.SUBMITTED,
-        created_at=datetime.utcnow(),
-    )
-
-    jobs[job_id] = job
-    ACTIVE_JOBS.inc()
-    OPERATION_COUNT.labels(operation="import", status="submitted").inc()
-
-    # Submit Celery task
-    from tasks import execute_terraform_import
-
-    _task = execute_terraform_import.delay(  # noqa: F841
-        job_id=str(job_id),
-        workspace_name=request.workspace_name,
-        address=request.address,
-        resource_id=request.id,
-        variables=[var.model_dump() for var in request.variables],
-        timeout=request.timeout,
-    )
-
-    job.status = JobStatus.QUEUED
-    jobs[job_id] = job
-
-    logger.info(
-        "Terraform import job submitted",
-        job_id=str(job_id),
-        workspace=request.workspace_name,
-    )
+    await require_workspace(redis_conn, request.workspace_name)
 
-    return JobResponse(
-        success=True,
-        message=f"Terraform import job submitted for workspace '{request.workspace_name}'",
-        job=job,
-        correlation_id=request.correlation_id,
+    return json_response(
+        submit_job(TerraformOperationType.IMPORT, request), status.HTTP_202_ACCEPTED
     )
 
 
 @app.post(
     "/api/v1/terraform/refresh",
-    response_model=JobResponse,
     status_code=status.HTTP_202_ACCEPTED,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobResponse}},
 )
 async def terraform_refresh(
-    request: TerraformRefreshRequest, celery: Celery = Depends(get_celery)
-) -> JobResponse:
+    request: TerraformRefreshRequest,
+    celery: Celery = Depends(get_celery),
+    redis_conn: Redis = Depends(get_redis),
+) -> Response:
     """Refresh Terraform state"""
-    if request.workspace_name not in workspaces:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workspace '{request.workspace_name}' not found",
-        )
-
-    job_id = uuid4()
-    job = JobInfo(
-        id=job_id,
-        operation=TerraformOperationType.REFRESH,
-        workspace_name=request.workspace_name,
-        status=JobStatus.SUBMITTED,
-        created_at=datetime.utcnow(),
-    )
-
-    jobs[job_id] = job
-    ACTIVE_JOBS.inc()
-    OPERATION_COUNT.labels(operation="refresh", status="submitted").inc()
-
-    # Submit Celery task
-    from tasks import execute_terraform_refresh
-
-    _task = execute_terraform_refresh.delay(  # noqa: F841
-        job_id=str(job_id),
-        workspace_name=request.workspace_name,
-        variables=[var.model_dump() for var in request.variables],
-        timeout=request.timeout,
-    )
-
-    job.status = JobStatus.QUEUED
-    jobs[job_id] = job
+    await require_workspace(redis_conn, request.workspace_name)
 
-    logger.info(
-        "Terraform refresh job submitted",
-        job_id=str(job_id),
-        workspace=request.workspace_name,
-    )
-
-    return JobResponse(
-        success=True,
-        message=f"Terraform refresh job submitted for workspace '{request.workspace_name}'",
-        job=job,
-        correlation_id=request.correlation_id,
+    return json_response(
+        submit_job(TerraformOperationType.REFRESH, request), status.HTTP_202_ACCEPTED
     )
 
 
 @app.post(
     "/api/v1/terraform/validate",
-    response_model=JobResponse,
     status_code=status.HTTP_202_ACCEPTED,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobResponse}},
 )
 async def terraform_validate(
-    request: TerraformValidateRequest, celery: Celery = Depends(get_celery)
-) -> JobResponse:
+    request: TerraformValidateRequest,
+    celery: Celery = Depends(get_celery),
+    redis_conn: Redis = Depends(get_redis),
+) -> Response:
     """Validate Terraform configuration"""
-    if request.workspace_name not in workspaces:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workspace '{request.workspace_name}' not found",
-        )
+    await require_workspace(redis_conn, request.workspace_name)
 
-    job_id = uuid4()
-    job = JobInfo(
-        id=job_id,
-        operation=TerraformOperationType.VALIDATE,
-        workspace_name=request.workspace_name,
-        status=JobStatus.SUBMITTED,
-        created_at=datetime.utcnow(),
-    )
-
-    jobs[job_id] = job
-    ACTIVE_JOBS.inc()
-    OPERATION_COUNT.labels(operation="validate", status="submitted").inc()
-
-    # Submit Celery task
-    from tasks import execute_terraform_validate
-
-    _task = execute_terraform_validate.delay(  # noqa: F841
-        job_id=str(job_id),
-        workspace_name=request.workspace_name,
-        timeout=request.timeout,
+    return json_response(
+        submit_job(TerraformOperationType.VALIDATE, request), status.HTTP_202_ACCEPTED
     )
 
-    job.status = JobStatus.QUEUED
-    jobs[job_id] = job
 
-    logger.info(
-        "Terraform validate job submitted",
-        job_id=str(job_id),
-        workspace=request.workspace_name,
-    )
-
-    return JobResponse(
-        success=True,
-        message=f"Terraform validate job submitted for workspace '{request.workspace_name}'",
-        job=job,
-        correlation_id=request.correlation_id,
+@app.post(
+    "/api/v1/terraform/batch",
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobListResponse}},
+)
+async def terraform_batch(
+    request: TerraformBatchRequest,
+    celery: Celery = Depends(get_celery),
+    redis_conn: Redis = Depends(get_redis),
+) -> Response:
+    """Submit several Terraform operations in a single Celery group"""
+    submissions = []
+    for index, item in enumerate(request.operations):
+        spec = OPERATIONS.get(item.operation)
+        if spec is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Operation {index}: '{item.operation.value}' is not supported",
+            )
+        try:
+            operation_request = spec.request_model.model_validate(item.parameters)
+        except ValidationError as e:
+            error = e.errors()[0]
+            location = ".".join(str(part) for part in error["loc"])
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Operation {index}: {location}: {error['msg']}",
+            )
+        submissions.append((item.operation, operation_request, uuid4()))
+
+    for workspace_name in dict.fromkeys(
+        operation_request.workspace_name for _, operation_request, _ in submissions
+    ):
+        await require_workspace(redis_conn, workspace_name)
+
+    # One group dispatch publishes every task over a single producer
+    group(
+        job_signature(operation, operation_request, job_id)
+        for operation, operation_request, job_id in submissions
+    ).apply_async()
+
+    submitted = [
+        register_job(operation, job_id, operation_request.workspace_name)
+        for operation, operation_request, job_id in submissions
+    ]
+
+    return job_list_response(
+        f"Submitted {len(submitted)} Terraform jobs",
+        submitted,
+        len(submitted),
+        status.HTTP_202_ACCEPTED,
+        request.correlation_id,
     )
 
 
 # Job Management Endpoints
 
 
-@app.get("/api/v1/jobs/{job_id}", response_model=JobStatusResponse)
-async def get_job_status(job_id: UUID) -> JobStatusResponse:
+@app.get("/api/v1/jobs/{job_id}", responses={200: {"model": JobStatusResponse}})
+async def get_job_status(job_id: UUID) -> Response:
     """Get job status and details"""
     if job_id not in jobs:
         raise HTTPException(
@@ -802,49 +1242,89 @@ async def get_job_status(job_id: UUID) -> JobStatusResponse:
 
     job = jobs[job_id]
 
-    return JobStatusResponse(
-        success=True, message=f"Job '{job_id}' status retrieved", job=job
+    return json_response(
+        JobStatusResponse.model_construct(
+            success=True,
+            message=f"Job '{job_id}' status retrieved",
+            job=job.to_info(),
+        )
+    )
+
+
+@app.get("/api/v1/jobs/{job_id}/logs", responses={200: {"model": JobLogsResponse}})
+async def get_job_logs(job_id: UUID, offset: int = 0) -> Response:
+    """Get a job's log lines, starting at ``offset``"""
+    if job_id not in jobs:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Job '{job_id}' not found"
+        )
+
+    logs = jobs[job_id].logs
+    offset = max(offset, 0)
+
+    return json_response(
+        JobLogsResponse.model_construct(
+            success=True,
+            message=f"Job '{job_id}' logs retrieved",
+            job_id=job_id,
+            logs=logs[offset:],
+            offset=offset,
+            total=len(logs),
+        )
     )
 
 
-@app.get("/api/v1/jobs", response_model=JobListResponse)
+@app.get("/api/v1/jobs", responses={200: {"model": JobListResponse}})
 async def list_jobs(
     workspace_name: Optional[str] = None,
     operation: Optional[TerraformOperationType] = None,
     status: Optional[JobStatus] = None,
     limit: int = 100,
     offset: int = 0,
-) -> JobListResponse:
+) -> Response:
     """List jobs with optional filtering"""
-    filtered_jobs = list(jobs.values())
-
-    # Apply filters
+    # Gather the index for each requested filter, noting whether it is kept in
+    # creation order (the status index is reordered on every transition)
+    indexes = []
     if workspace_name:
-        filtered_jobs = [j for j in filtered_jobs if j.workspace_name == workspace_name]
+        indexes.append((jobs_by_workspace.get(workspace_name, {}), True))
     if operation:
-        filtered_jobs = [j for j in filtered_jobs if j.operation == operation]
+        indexes.append((jobs_by_operation.get(operation, {}), True))
     if status:
-        filtered_jobs = [j for j in filtered_jobs if j.status == status]
-
-    # Sort by creation time (newest first)
-    filtered_jobs.sort(key=lambda x: x.created_at, reverse=True)
-
-    # Apply pagination
-    total = len(filtered_jobs)
-    paginated_jobs = filtered_jobs[offset : offset + limit]
-
-    return JobListResponse(
-        success=True,
-        message=f"Retrieved {len(paginated_jobs)} of {total} jobs",
-        jobs=paginated_jobs,
-        total=total,
+        indexes.append((jobs_by_status.get(status, {}), False))
+
+    if indexes:
+        # Walk the smallest index and probe the others by membership
+        indexes.sort(key=lambda entry: len(entry[0]))
+        smallest, creation_ordered = indexes[0]
+        others = [index for index, _ in indexes[1:]]
+        filtered_jobs = [
+            jobs[job_id]
+            for job_id in smallest
+            if all(job_id in index for index in others)
+        ]
+
+        # Newest first; only the status index needs an actual sort
+        if creation_ordered:
+            filtered_jobs.reverse()
+        else:
+            filtered_jobs.sort(key=lambda x: x.created_at, reverse=True)
+
+        # Apply pagination
+        total = len(filtered_jobs)
+        paginated_jobs = filtered_jobs[offset : offset + limit]
+    else:
+        # Jobs are stored in creation order, so newest first is reverse order
+        total = len(jobs)
+        paginated_jobs = list(islice(reversed(jobs.values()), offset, offset + limit))
+
+    return job_list_response(
+        f"Retrieved {len(paginated_jobs)} of {total} jobs", paginated_jobs, total
     )
 
 
-@app.delete("/api/v1/jobs/{job_id}", response_model=JobStatusResponse)
-async def cancel_job(
-    job_id: UUID, celery: Celery = Depends(get_celery)
-) -> JobStatusResponse:
+@app.delete("/api/v1/jobs/{job_id}", responses={200: {"model": JobStatusResponse}})
+async def cancel_job(job_id: UUID, celery: Celery = Depends(get_celery)) -> Response:
     """Cancel a running or queued job"""
     if job_id not in jobs:
         raise HTTPException(
@@ -862,39 +1342,43 @@ async def cancel_job(
     # Revoke Celery task
     celery.control.revoke(str(job_id), terminate=True)
 
-    job.status = JobStatus.CANCELLED
+    set_job_status(job, JobStatus.CANCELLED)
     job.completed_at = datetime.utcnow()
     if job.started_at:
         job.duration_seconds = (job.completed_at - job.started_at).total_seconds()
 
-    jobs[job_id] = job
     ACTIVE_JOBS.dec()
     OPERATION_COUNT.labels(operation=job.operation.value, status="cancelled").inc()
 
     logger.info("Job cancelled", job_id=str(job_id))
 
-    return JobStatusResponse(
-        success=True, message=f"Job '{job_id}' cancelled successfully", job=job
+    return json_response(
+        JobStatusResponse.model_construct(
+            success=True,
+            message=f"Job '{job_id}' cancelled successfully",
+            job=job.to_info(),
+        )
     )
 
 
 # State Management Endpoints
 
 
-@app.get("/api/v1/terraform/state/{workspace_name}", response_model=StateResponse)
-async def get_state(workspace_name: str) -> StateResponse:
+@app.get(
+    "/api/v1/terraform/state/{workspace_name}",
+    responses={200: {"model": StateResponse}},
+)
+async def get_state(
+    workspace_name: str, redis_conn: Redis = Depends(get_redis)
+) -> Response:
     """Get current Terraform state information"""
-    if workspace_name not in workspaces:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workspace '{workspace_name}' not found",
-        )
+    await require_workspace(redis_conn, workspace_name)
 
     # This would integrate with actual state backend (MinIO/S3)
     # For now, returning mock data
-    state_info = StateInfo(
+    state_info = StateInfo.model_construct(
         version=4,
-        terraform_version=get_terraform_version(),
+        terraform_version=terraform_version,
         serial=1,
         lineage="mock-lineage-12345",
         resources_count=0,
@@ -903,51 +1387,54 @@ async def get_state(workspace_name: str) -> StateResponse:
         size_bytes=0,
     )
 
-    return StateResponse(
-        success=True,
-        message=f"State retrieved for workspace '{workspace_name}'",
-        state=state_info,
+    return json_response(
+        StateResponse.model_construct(
+            success=True,
+            message=f"State retrieved for workspace '{workspace_name}'",
+            state=state_info,
+        )
     )
 
 
 @app.post(
-    "/api/v1/terraform/state/{workspace_name}/lock", response_model=StateLockResponse
+    "/api/v1/terraform/state/{workspace_name}/lock",
+    responses={200: {"model": StateLockResponse}},
 )
 async def lock_state(
     workspace_name: str,
     request: StateLockRequest,
-    redis_conn: Redis[str] = Depends(get_redis),
-) -> StateLockResponse:
+    redis_conn: Redis = Depends(get_redis),
+) -> Response:
     """Lock Terraform state for operations"""
-    if workspace_name not in workspaces:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workspace '{workspace_name}' not found",
-        )
+    await require_workspace(redis_conn, workspace_name)
 
     lock_key = f"terraform:state:lock:{workspace_name}"
 
-    # Check if already locked
-    existing_lock = await redis_conn.get(lock_key)
-    if existing_lock:
-        lock_data = json.loads(existing_lock)
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"State is already locked by {lock_data['locked_by']} since {lock_data['locked_at']}",
-        )
-
-    # Acquire lock
     lock_id = str(uuid4())
+    locked_at = datetime.utcnow()
     lock_data = {
         "lock_id": lock_id,
         "workspace_name": workspace_name,
         "operation": request.operation.value,
         "locked_by": "terraform-executor",
-        "locked_at": datetime.utcnow().isoformat(),
+        "locked_at": locked_at.isoformat(),
         "info": request.info or "",
     }
 
-    await redis_conn.set(lock_key, json.dumps(lock_data), ex=3600)  # 1 hour TTL
+    # Acquire lock atomically (1 hour TTL); SET NX only succeeds if unlocked
+    acquired = await redis_conn.set(
+        lock_key, msgpack.packb(lock_data), ex=3600, nx=True
+    )
+    if not acquired:
+        existing_lock = await redis_conn.get(lock_key)
+        detail = "State is already locked"
+        if existing_lock:
+            existing_data = decode_lock(existing_lock)
+            detail = (
+                f"State is already locked by {existing_data['locked_by']} "
+                f"since {existing_data['locked_at']}"
+            )
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
 
     logger.info(
         "State locked",
@@ -956,84 +1443,124 @@ async def lock_state(
         operation=request.operation.value,
     )
 
-    return StateLockResponse(
-        success=True,
-        message=f"State locked for workspace '{workspace_name}'",
-        lock_id=lock_id,
-        locked_by="terraform-executor",
-        locked_at=datetime.utcnow(),
-        correlation_id=request.correlation_id,
+    return json_response(
+        StateLockResponse.model_construct(
+            success=True,
+            message=f"State locked for workspace '{workspace_name}'",
+            lock_id=lock_id,
+            locked_by="terraform-executor",
+            locked_at=locked_at,
+            correlation_id=request.correlation_id,
+        )
     )
 
 
 @app.delete(
-    "/api/v1/terraform/state/{workspace_name}/lock", response_model=StateLockResponse
+    "/api/v1/terraform/state/{workspace_name}/lock",
+    responses={200: {"model": StateLockResponse}},
 )
 async def unlock_state(
-    workspace_name: str, redis_conn: Redis[str] = Depends(get_redis)
-) -> StateLockResponse:
-    """Unlock Terraform state"""
-    if workspace_name not in workspaces:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workspace '{workspace_name}' not found",
-        )
+    workspace_name: str,
+    lock_id: Optional[str] = None,
+    redis_conn: Redis = Depends(get_redis),
+) -> ORJSONResponse:
+    """Unlock Terraform state
+
+    When ``lock_id`` is given the lock is only released if it is still held
+    under that ID; otherwise any existing lock is released.
+    """
+    await require_workspace(redis_conn, workspace_name)
 
     lock_key = f"terraform:state:lock:{workspace_name}"
 
-    # Get existing lock
-    existing_lock = await redis_conn.get(lock_key)
-    if not existing_lock:
+    # Compare-and-delete the lock server-side in a single round-trip
+    if unlock_state_script is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Redis connection not available",
+        )
+    result = await unlock_state_script(
+        keys=[lock_key], args=[lock_id or ""], client=redis_conn
+    )
+
+    if not result:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No lock found for workspace '{workspace_name}'",
         )
 
-    lock_data = json.loads(existing_lock)
+    deleted, existing_lock = result
+    lock_data = decode_lock(existing_lock)
 
-    # Remove lock
-    await redis_conn.delete(lock_key)
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"State is locked by another process: {lock_data['lock_id']}",
+        )
 
     logger.info(
         "State unlocked", workspace=workspace_name, lock_id=lock_data["lock_id"]
     )
 
-    return StateLockResponse(
-        success=True,
-        message=f"State unlocked for workspace '{workspace_name}'",
-        lock_id=lock_data["lock_id"],
-        locked_by=lock_data["locked_by"],
-        locked_at=datetime.fromisoformat(lock_data["locked_at"].replace("Z", "+00:00")),
+    # Built as a StateLockResponse-shaped dict; locked_at is already stored
+    # as an ISO timestamp and is passed through unparsed
+    return ORJSONResponse(
+        content={
+            "success": True,
+            "message": f"State unlocked for workspace '{workspace_name}'",
+            "timestamp": datetime.utcnow(),
+            "correlation_id": None,
+            "lock_id": lock_data["lock_id"],
+            "locked_by": lock_data["locked_by"],
+            "locked_at": lock_data["locked_at"],
+        }
     )
 
 
 # Error handlers
+# ErrorResponse bodies pre-rendered as JSON bytes with slots for the variable
+# parts (message, timestamp, status code)
+HTTP_ERROR_TEMPLATE = (
+    b'{"success":false,"message":%b,"timestamp":%b,"correlation_id":null,'
+    b'"error_code":"HTTP_%d","error_details":null,"stack_trace":null}'
+)
+
+
+@lru_cache(maxsize=64)
+def internal_error_template(exc_type: Type[BaseException]) -> bytes:
+    """Pre-render the 500 body for an exception class, leaving a timestamp slot"""
+    return (
+        b'{"success":false,"message":"Internal server error","timestamp":%b,'
+        b'"correlation_id":null,"error_code":"INTERNAL_ERROR","error_details":'
+        + orjson.dumps({"type": exc_type.__name__})
+        + b',"stack_trace":null}'
+    )
+
+
 @app.exception_handler(HTTPException)
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> Response:
     """Handle HTTP exceptions"""
-    return JSONResponse(
+    return Response(
+        content=HTTP_ERROR_TEMPLATE
+        % (
+            orjson.dumps(exc.detail),
+            orjson.dumps(datetime.utcnow()),
+            exc.status_code,
+        ),
         status_code=exc.status_code,
-        content=ErrorResponse(
-            success=False,
-            message=exc.detail,
-            error_code=f"HTTP_{exc.status_code}",
-        ).model_dump(),
+        media_type="application/json",
     )
 
 
 @app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle general exceptions"""
     logger.error("Unhandled exception", error=str(exc), path=request.url.path)
 
-    return JSONResponse(
+    return Response(
+        content=internal_error_template(type(exc)) % orjson.dumps(datetime.utcnow()),
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=ErrorResponse(
-            success=False,
-            message="Internal server error",
-            error_code="INTERNAL_ERROR",
-            error_details={"type": type(exc).__name__},
-        ).model_dump(),
+        media_type="application/json",
     )
 
 
@@ -1043,10 +1570,20 @@ if __name__ == "__main__":
     # In production, use firewall rules and security groups to restrict access
     host = os.getenv("UVICORN_HOST", "0.0.0.0")  # nosec B104
     port = int(os.getenv("UVICORN_PORT", "8080"))
+    # Per-request access log lines are formatted on the event loop; off unless
+    # explicitly enabled
+    access_log = os.getenv("UVICORN_ACCESS_LOG", "false").lower() == "true"
 
     # Configure logging
     logging.basicConfig(level=logging.INFO)
 
     uvicorn.run(
-        "app:app", host=host, port=port, reload=False, log_level="info", access_log=True
+        "app:app",
+        host=host,
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        reload=False,
+        log_level="info",
+        access_log=access_log,
     )
@@ -5,10 +5,10 @@ Enhanced data models for comprehensive IaC automation
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 
 class TerraformOperationType(str, Enum):
@@ -63,7 +63,13 @@ class BaseRequest(BaseModel):
 
 
 class BaseResponse(BaseModel):
-    """Base response model with common fields"""
+    """Base response model with common fields
+
+    Responses are built by the server and never modified afterwards, so they
+    are frozen.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     success: bool = Field(..., description="Operation success status")
     message: str = Field(..., description="Response message")
@@ -102,9 +108,8 @@ class TerraformVariable(BaseModel):
     """Terraform variable definition"""
 
     name: str = Field(..., description="Variable name")
-    value: Union[str, int, float, bool, Dict[str, Any], List[Any]] = Field(
-        ..., description="Variable value"
-    )
+    # Any JSON value; a Union of the JSON types would be tried member by member
+    value: Any = Field(..., description="Variable value")
     type: Optional[str] = Field(None, description="Variable type")
     description: Optional[str] = Field(None, description="Variable description")
     sensitive: bool = Field(default=False, description="Whether variable is sensitive")
@@ -138,12 +143,6 @@ class WorkspaceUpdateRequest(BaseRequest):
     auto_apply: Optional[bool] = Field(None, description="Enable auto-apply for plans")
 
 
-class WorkspaceResponse(BaseResponse):
-    """Workspace information response"""
-
-    workspace: "WorkspaceInfo" = Field(..., description="Workspace information")
-
-
 class WorkspaceInfo(BaseModel):
     """Workspace information"""
 
@@ -167,6 +166,12 @@ class WorkspaceInfo(BaseModel):
     )
 
 
+class WorkspaceResponse(BaseResponse):
+    """Workspace information response"""
+
+    workspace: WorkspaceInfo = Field(..., description="Workspace information")
+
+
 class WorkspaceListResponse(BaseResponse):
     """List of workspaces response"""
 
@@ -175,7 +180,31 @@ class WorkspaceListResponse(BaseResponse):
 
 
 # Terraform Operation Models
-class TerraformPlanRequest(BaseRequest):
+class TerraformVariablesRequest(BaseRequest):
+    """Base request for operations that accept additional Terraform variables"""
+
+    variables: List[TerraformVariable] = Field(
+        default_factory=list, description="Additional variables"
+    )
+    variables_map: Dict[str, Any] = Field(
+        default_factory=dict,
+        description=(
+            "Additional variables as a name-to-value mapping, for callers that "
+            "need no per-variable metadata; applied after 'variables'"
+        ),
+    )
+
+    @property
+    def variables_payload(self) -> List[Dict[str, Any]]:
+        """Variables as plain dicts, dumped in a single serializer pass"""
+        payload = self.model_dump(include={"variables"})["variables"]
+        payload.extend(
+            {"name": name, "value": value} for name, value in self.variables_map.items()
+        )
+        return payload
+
+
+class TerraformPlanRequest(TerraformVariablesRequest):
     """Request to execute terraform plan"""
 
     workspace_name: str = Field(..., description="Workspace name")
@@ -183,13 +212,10 @@ class TerraformPlanRequest(BaseRequest):
     target_resources: List[str] = Field(
         default_factory=list, description="Target specific resources"
     )
-    variables: List[TerraformVariable] = Field(
-        default_factory=list, description="Additional variables"
-    )
     refresh: bool = Field(default=True, description="Refresh state before planning")
 
 
-class TerraformApplyRequest(BaseRequest):
+class TerraformApplyRequest(TerraformVariablesRequest):
     """Request to execute terraform apply"""
 
     workspace_name: str = Field(..., description="Workspace name")
@@ -200,42 +226,30 @@ class TerraformApplyRequest(BaseRequest):
     target_resources: List[str] = Field(
         default_factory=list, description="Target specific resources"
     )
-    variables: List[TerraformVariable] = Field(
-        default_factory=list, description="Additional variables"
-    )
 
 
-class TerraformDestroyRequest(BaseRequest):
+class TerraformDestroyRequest(TerraformVariablesRequest):
     """Request to execute terraform destroy"""
 
     workspace_name: str = Field(..., description="Workspace name")
     target_resources: List[str] = Field(
         default_factory=list, description="Target specific resources"
     )
-    variables: List[TerraformVariable] = Field(
-        default_factory=list, description="Additional variables"
-    )
     auto_approve: bool = Field(default=False, description="Auto-approve the destroy")
 
 
-class TerraformImportRequest(BaseRequest):
+class TerraformImportRequest(TerraformVariablesRequest):
     """Request to import existing infrastructure"""
 
     workspace_name: str = Field(..., description="Workspace name")
     address: str = Field(..., description="Terraform resource address")
     id: str = Field(..., description="Resource ID to import")
-    variables: List[TerraformVariable] = Field(
-        default_factory=list, description="Additional variables"
-    )
 
 
-class TerraformRefreshRequest(BaseRequest):
+class TerraformRefreshRequest(TerraformVariablesRequest):
     """Request to refresh terraform state"""
 
     workspace_name: str = Field(..., description="Workspace name")
-    variables: List[TerraformVariable] = Field(
-        default_factory=list, description="Additional variables"
-    )
 
 
 class TerraformValidateRequest(BaseRequest):
@@ -244,13 +258,24 @@ class TerraformValidateRequest(BaseRequest):
     workspace_name: str = Field(..., description="Workspace name")
 
 
-# Job Models
-class JobResponse(BaseResponse):
-    """Job submission response"""
+class TerraformBatchItem(BaseModel):
+    """Single operation within a batch submission"""
+
+    operation: TerraformOperationType = Field(..., description="Operation type")
+    parameters: Dict[str, Any] = Field(
+        ..., description="Request body for the operation's endpoint"
+    )
+
+
+class TerraformBatchRequest(BaseRequest):
+    """Request to submit several terraform operations at once"""
 
-    job: "JobInfo" = Field(..., description="Job information")
+    operations: List[TerraformBatchItem] = Field(
+        ..., min_length=1, max_length=100, description="Operations to submit"
+    )
 
 
+# Job Models
 class JobInfo(BaseModel):
     """Job execution information"""
 
@@ -282,6 +307,12 @@ class JobInfo(BaseModel):
     )
 
 
+class JobResponse(BaseResponse):
+    """Job submission response"""
+
+    job: JobInfo = Field(..., description="Job information")
+
+
 class JobStatusResponse(BaseResponse):
     """Job status response"""
 
@@ -291,10 +322,25 @@ class JobStatusResponse(BaseResponse):
 class JobListResponse(BaseResponse):
     """Job list response"""
 
-    jobs: List[JobInfo] = Field(..., description="List of jobs")
+    jobs: List[JobInfo] = Field(
+        ...,
+        description=(
+            "List of jobs; each job's logs are cut to the most recent lines, "
+            "see /api/v1/jobs/{job_id}/logs for the full log"
+        ),
+    )
     total: int = Field(..., description="Total job count")
 
 
+class JobLogsResponse(BaseResponse):
+    """Job logs response"""
+
+    job_id: UUID = Field(..., description="Job ID")
+    logs: List[str] = Field(..., description="Log lines from the requested offset")
+    offset: int = Field(..., description="Index of the first returned line")
+    total: int = Field(..., description="Total log line count")
+
+
 # State Management Models
 class StateInfo(BaseModel):
     """Terraform state information"""
@@ -361,8 +407,3 @@ class ErrorResponse(BaseResponse):
     stack_trace: Optional[str] = Field(
         default=None, description="Stack trace for debugging"
     )
-
-
-# Update forward references
-WorkspaceResponse.model_rebuild()
-JobResponse.model_rebuild()
@@ -6,12 +6,14 @@ while maintaining backward compatibility with existing code.
 """
 
 import asyncio
+from collections import OrderedDict
 from datetime import datetime
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 from uuid import uuid4
 
-from celery import Celery
+from celery import Celery, Signature, group, states
+from celery.backends.redis import RedisBackend
 
 from services.plugin_system.core import (
     Plugin,
@@ -22,6 +24,7 @@ from services.plugin_system.core import (
 from services.plugin_system.events import PluginEvent
 
 # Import existing terraform executor components
+from services.terraform_agent.app import OPERATIONS, job_time_limit
 from services.terraform_agent.app import app as terraform_app
 from services.terraform_agent.models import (
     JobInfo,
@@ -33,14 +36,35 @@ from services.terraform_agent.models import (
     WorkspaceInfo,
     WorkspaceStatus,
 )
-from services.terraform_agent.tasks import (
-    execute_terraform_apply,
-    execute_terraform_destroy,
-    execute_terraform_plan,
-)
 
 logger = logging.getLogger(__name__)
 
+OperationRequest = Union[
+    TerraformPlanRequest, TerraformApplyRequest, TerraformDestroyRequest
+]
+
+# Seconds between full sweeps of active jobs while watching result channels,
+# catching results published while no subscription was active
+RESULT_SWEEP_INTERVAL = 60.0
+
+# Finished jobs kept in the execution history
+HISTORY_LIMIT = 100
+
+# Registered names of the Celery tasks run for each operation; the service and
+# its workers import the tasks module as ``tasks``
+TASK_NAMES: Dict[TerraformOperationType, str] = {
+    TerraformOperationType.PLAN: "tasks.execute_terraform_plan",
+    TerraformOperationType.APPLY: "tasks.execute_terraform_apply",
+    TerraformOperationType.DESTROY: "tasks.execute_terraform_destroy",
+}
+
+# Operation submitted for each request type accepted by execute_batch
+REQUEST_OPERATIONS: Dict[type, TerraformOperationType] = {
+    TerraformPlanRequest: TerraformOperationType.PLAN,
+    TerraformApplyRequest: TerraformOperationType.APPLY,
+    TerraformDestroyRequest: TerraformOperationType.DESTROY,
+}
+
 
 class TerraformExecutorPlugin(Plugin):
     """Terraform Executor as a plugin."""
@@ -73,15 +97,22 @@ class TerraformExecutorPlugin(Plugin):
         )
         super().__init__(metadata)
 
+        # Log prefix; messages use %-style arguments so they are only
+        # formatted when a handler emits them
+        self._lp = f"[{metadata.id}]"
+
         # Plugin components
         self.app_instance = None
         self.redis_client: Optional[Any] = None
+        # Client for the Redis result backend, which may be another server
+        self.result_client: Optional[Any] = None
         self.celery_app: Optional[Any] = None
 
         # Plugin state
         self._active_jobs: Dict[str, JobInfo] = {}
         self._workspaces: Dict[str, WorkspaceInfo] = {}
-        self._execution_history: List[Dict[str, Any]] = []
+        # Finished jobs keyed by job ID, oldest first
+        self._execution_history: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self._metrics_data = {
             "plans_executed": 0,
             "applies_executed": 0,
@@ -93,103 +124,105 @@ class TerraformExecutorPlugin(Plugin):
 
     async def _on_initialize(self) -> None:
         """Initialize the plugin components."""
-        logger.debug(f"[{self.metadata.id}] Starting plugin initialization")
+        logger.debug("%s Starting plugin initialization", self._lp)
 
         try:
             # Initialize Redis connection
             redis_url = self.config.get("redis_url", "redis://localhost:6379/0")
-            logger.debug(
-                f"[{self.metadata.id}] Initializing Redis connection to {redis_url}"
-            )
+            logger.debug("%s Initializing Redis connection to %s", self._lp, redis_url)
             self.redis_client = await self._init_redis(redis_url)
 
             # Initialize Celery
             broker_url = self.config.get("broker_url", redis_url)
             backend_url = self.config.get("backend_url", redis_url)
-            logger.debug(
-                f"[{self.metadata.id}] Initializing Celery with broker: {broker_url}"
-            )
+            logger.debug("%s Initializing Celery with broker: %s", self._lp, broker_url)
 
             self.celery_app = Celery(
                 "terraform_agent",
                 broker=broker_url,
                 backend=backend_url,
             )
+            self.celery_app.conf.update(
+                # Same formats as the service's Celery app in tasks.py, so
+                # published jobs are accepted and stored results decode
+                task_serializer="msgpack",
+                accept_content=["msgpack", "json"],
+                result_serializer="msgpack",
+                result_accept_content=["msgpack", "json"],
+                # Bound broker and result backend connections under bursts
+                broker_pool_limit=self.config.get("broker_pool_limit", 10),
+                redis_max_connections=self.config.get("redis_max_connections", 32),
+            )
+            self.result_client = await self._init_result_client(redis_url, backend_url)
 
             # Store app reference
             self.app_instance = terraform_app
-            logger.debug(f"[{self.metadata.id}] Terraform app instance stored")
+            logger.debug("%s Terraform app instance stored", self._lp)
 
             logger.info(
-                f"[{self.metadata.id}] Terraform Executor plugin initialized successfully"
+                "%s Terraform Executor plugin initialized successfully", self._lp
             )
 
         except Exception as e:
             logger.error(
-                f"[{self.metadata.id}] Failed to initialize plugin: {e}", exc_info=True
+                "%s Failed to initialize plugin: %s", self._lp, e, exc_info=True
             )
             raise
 
     async def _on_start(self) -> None:
         """Start the plugin services."""
-        logger.debug(f"[{self.metadata.id}] Starting plugin services")
+        logger.debug("%s Starting plugin services", self._lp)
 
         try:
             # Register event handlers
-            logger.debug(f"[{self.metadata.id}] Registering event handlers")
+            logger.debug("%s Registering event handlers", self._lp)
             await self._register_event_handlers()
 
             # Start monitoring
-            logger.debug(f"[{self.metadata.id}] Starting job monitoring task")
+            logger.debug("%s Starting job monitoring task", self._lp)
             asyncio.create_task(self._monitor_jobs())
 
-            logger.info(
-                f"[{self.metadata.id}] Terraform Executor plugin started successfully"
-            )
+            logger.info("%s Terraform Executor plugin started successfully", self._lp)
 
         except Exception as e:
-            logger.error(
-                f"[{self.metadata.id}] Failed to start plugin: {e}", exc_info=True
-            )
+            logger.error("%s Failed to start plugin: %s", self._lp, e, exc_info=True)
             raise
 
     async def _on_stop(self) -> None:
         """Stop the plugin services."""
-        logger.debug(f"[{self.metadata.id}] Stopping plugin services")
+        logger.debug("%s Stopping plugin services", self._lp)
 
         try:
             # Cancel active jobs
             active_jobs = list(self._active_jobs.keys())
             if active_jobs:
-                logger.debug(
-                    f"[{self.metadata.id}] Cancelling {len(active_jobs)} active jobs"
-                )
+                logger.debug("%s Cancelling %s active jobs", self._lp, len(active_jobs))
                 for job_id in active_jobs:
                     await self._cancel_job(job_id)
 
-            # Close Redis connection
+            # Close Redis connections
+            if self.result_client and self.result_client is not self.redis_client:
+                logger.debug("%s Closing result backend connection", self._lp)
+                await self._close_redis(self.result_client)
+            self.result_client = None
             if self.redis_client:
-                logger.debug(f"[{self.metadata.id}] Closing Redis connection")
-                await self.redis_client.close()
+                logger.debug("%s Closing Redis connection", self._lp)
+                await self._close_redis(self.redis_client)
                 self.redis_client = None
 
-            logger.info(
-                f"[{self.metadata.id}] Terraform Executor plugin stopped successfully"
-            )
+            logger.info("%s Terraform Executor plugin stopped successfully", self._lp)
 
         except Exception as e:
-            logger.error(
-                f"[{self.metadata.id}] Error during plugin stop: {e}", exc_info=True
-            )
+            logger.error("%s Error during plugin stop: %s", self._lp, e, exc_info=True)
             raise
 
     async def _on_destroy(self) -> None:
         """Clean up plugin resources."""
-        logger.debug(f"[{self.metadata.id}] Destroying plugin resources")
+        logger.debug("%s Destroying plugin resources", self._lp)
 
         try:
             # Clear state
-            logger.debug(f"[{self.metadata.id}] Clearing plugin state")
+            logger.debug("%s Clearing plugin state", self._lp)
             self._active_jobs.clear()
             self._workspaces.clear()
             self._execution_history.clear()
@@ -198,69 +231,79 @@ class TerraformExecutorPlugin(Plugin):
             self.app_instance = None
             self.celery_app = None
 
-            logger.info(
-                f"[{self.metadata.id}] Terraform Executor plugin destroyed successfully"
-            )
+            logger.info("%s Terraform Executor plugin destroyed successfully", self._lp)
 
         except Exception as e:
             logger.error(
-                f"[{self.metadata.id}] Error during plugin destruction: {e}",
+                "%s Error during plugin destruction: %s",
+                self._lp,
+                e,
                 exc_info=True,
             )
             raise
 
     async def _save_custom_state(self) -> Dict[str, Any]:
         """Save plugin-specific state."""
-        logger.debug(f"[{self.metadata.id}] Saving custom plugin state")
+        logger.debug("%s Saving custom plugin state", self._lp)
 
         try:
             state = {
                 "active_jobs": {
-                    k: v.dict() if hasattr(v, "dict") else v
-                    for k, v in self._active_jobs.items()
-                },
-                "workspaces": {
-                    k: v.dict() if hasattr(v, "dict") else v
-                    for k, v in self._workspaces.items()
+                    k: v.model_dump() for k, v in self._active_jobs.items()
                 },
-                "execution_history": self._execution_history[-100:],  # Keep last 100
+                "workspaces": {k: v.model_dump() for k, v in self._workspaces.items()},
+                "execution_history": list(self._execution_history.values()),
                 "metrics": self._metrics_data,
                 "timestamp": datetime.utcnow().isoformat(),
             }
 
             logger.debug(
-                f"[{self.metadata.id}] Saved state with {len(state['active_jobs'])} active jobs, "
-                f"{len(state['workspaces'])} workspaces, {len(state['execution_history'])} history entries"
+                "%s Saved state with %s active jobs, %s workspaces, %s history entries",
+                self._lp,
+                len(state["active_jobs"]),
+                len(state["workspaces"]),
+                len(state["execution_history"]),
             )
 
             return state
 
         except Exception as e:
-            logger.error(
-                f"[{self.metadata.id}] Error saving custom state: {e}", exc_info=True
-            )
+            logger.error("%s Error saving custom state: %s", self._lp, e, exc_info=True)
             raise
 
     async def _restore_custom_state(self, state: Dict[str, Any]) -> None:
         """Restore plugin-specific state."""
-        logger.debug(f"[{self.metadata.id}] Restoring custom plugin state")
+        logger.debug("%s Restoring custom plugin state", self._lp)
 
         try:
-            self._active_jobs = state.get("active_jobs", {})
-            self._workspaces = state.get("workspaces", {})
-            self._execution_history = state.get("execution_history", [])
+            # Saved as dicts; rebuilt so the maps only ever hold models
+            self._active_jobs = {
+                k: JobInfo.model_validate(v)
+                for k, v in state.get("active_jobs", {}).items()
+            }
+            self._workspaces = {
+                k: WorkspaceInfo.model_validate(v)
+                for k, v in state.get("workspaces", {}).items()
+            }
+            self._execution_history = OrderedDict(
+                (str(entry.get("id")), entry)
+                for entry in state.get("execution_history", [])[-HISTORY_LIMIT:]
+            )
             self._metrics_data = state.get("metrics", self._metrics_data)
 
             timestamp = state.get("timestamp", "unknown")
             logger.debug(
-                f"[{self.metadata.id}] Restored state from {timestamp} with "
-                f"{len(self._active_jobs)} active jobs, {len(self._workspaces)} workspaces, "
-                f"{len(self._execution_history)} history entries"
+                "%s Restored state from %s with %s active jobs, %s workspaces, %s history entries",
+                self._lp,
+                timestamp,
+                len(self._active_jobs),
+                len(self._workspaces),
+                len(self._execution_history),
             )
 
         except Exception as e:
             logger.error(
-                f"[{self.metadata.id}] Error restoring custom state: {e}", exc_info=True
+                "%s Error restoring custom state: %s", self._lp, e, exc_info=True
             )
             raise
 
@@ -269,101 +312,91 @@ class TerraformExecutorPlugin(Plugin):
         required = ["redis_url"]
         for key in required:
             if key not in self.config:
-                logger.error(
-                    f"[{self.metadata.id}] Missing required configuration: {key}"
-                )
+                logger.error("%s Missing required configuration: %s", self._lp, key)
                 return False
-        logger.debug(f"[{self.metadata.id}] Configuration validation passed")
+        logger.debug("%s Configuration validation passed", self._lp)
         return True
 
     # PUBLIC LIFECYCLE METHODS (override abstract methods from Plugin base class)
 
     async def start(self) -> None:
         """Start the plugin (public method overriding abstract method)."""
-        logger.debug(f"[{self.metadata.id}] Public start() called")
+        logger.debug("%s Public start() called", self._lp)
 
         try:
             # Call parent's start method to handle state transitions
             await super().start()
-            logger.debug(f"[{self.metadata.id}] Plugin start completed successfully")
+            logger.debug("%s Plugin start completed successfully", self._lp)
 
         except Exception as e:
-            logger.error(
-                f"[{self.metadata.id}] Plugin start failed: {e}", exc_info=True
-            )
+            logger.error("%s Plugin start failed: %s", self._lp, e, exc_info=True)
             raise
 
     async def stop(self) -> None:
         """Stop the plugin (public method overriding abstract method)."""
-        logger.debug(f"[{self.metadata.id}] Public stop() called")
+        logger.debug("%s Public stop() called", self._lp)
 
         try:
             # Call parent's stop method to handle state transitions
             await super().stop()
-            logger.debug(f"[{self.metadata.id}] Plugin stop completed successfully")
+            logger.debug("%s Plugin stop completed successfully", self._lp)
 
         except Exception as e:
-            logger.error(f"[{self.metadata.id}] Plugin stop failed: {e}", exc_info=True)
+            logger.error("%s Plugin stop failed: %s", self._lp, e, exc_info=True)
             raise
 
     async def destroy(self) -> None:
         """Destroy the plugin (public method overriding abstract method)."""
-        logger.debug(f"[{self.metadata.id}] Public destroy() called")
+        logger.debug("%s Public destroy() called", self._lp)
 
         try:
             # Call parent's destroy method to handle state transitions
             await super().destroy()
-            logger.debug(f"[{self.metadata.id}] Plugin destroy completed successfully")
+            logger.debug("%s Plugin destroy completed successfully", self._lp)
 
         except Exception as e:
-            logger.error(
-                f"[{self.metadata.id}] Plugin destroy failed: {e}", exc_info=True
-            )
+            logger.error("%s Plugin destroy failed: %s", self._lp, e, exc_info=True)
             raise
 
     async def reload(self, config: Optional[Dict[str, Any]] = None) -> None:
         """Hot-reload the plugin (public method overriding abstract method)."""
-        logger.info(f"[{self.metadata.id}] Public reload() called with new config")
+        logger.info("%s Public reload() called with new config", self._lp)
 
         try:
             # Call parent's reload method to handle state transitions and config updates
             await super().reload(config)
-            logger.info(f"[{self.metadata.id}] Plugin reload completed successfully")
+            logger.info("%s Plugin reload completed successfully", self._lp)
 
         except Exception as e:
-            logger.error(
-                f"[{self.metadata.id}] Plugin reload failed: {e}", exc_info=True
-            )
+            logger.error("%s Plugin reload failed: %s", self._lp, e, exc_info=True)
             raise
 
     async def save_state(self) -> Dict[str, Any]:
         """Save plugin state (public method overriding abstract method)."""
-        logger.debug(f"[{self.metadata.id}] Public save_state() called")
+        logger.debug("%s Public save_state() called", self._lp)
 
         try:
             # Call parent's save_state method which includes custom state
             state: Dict[str, Any] = await super().save_state()
-            logger.debug(f"[{self.metadata.id}] Plugin state saved successfully")
+            logger.debug("%s Plugin state saved successfully", self._lp)
             return state
 
         except Exception as e:
-            logger.error(
-                f"[{self.metadata.id}] Plugin save_state failed: {e}", exc_info=True
-            )
+            logger.error("%s Plugin save_state failed: %s", self._lp, e, exc_info=True)
             raise
 
     async def restore_state(self, state: Dict[str, Any]) -> None:
         """Restore plugin state (public method overriding abstract method)."""
-        logger.debug(f"[{self.metadata.id}] Public restore_state() called")
+        logger.debug("%s Public restore_state() called", self._lp)
 
         try:
             # Call parent's restore_state method which includes custom state
             await super().restore_state(state)
-            logger.debug(f"[{self.metadata.id}] Plugin state restored successfully")
+            logger.debug("%s Plugin state restored successfully", self._lp)
 
         except Exception as e:
             logger.error(
-                f"[{self.metadata.id}] Plugin restore_state failed: {e}", exc_info=True
+                "%s Plugin restore_state failed: %s", self._lp, e, exc_info=True
             )
             raise
 
@@ -377,32 +410,23 @@ class TerraformExecutorPlugin(Plugin):
         """Execute a Terraform plan."""
         job_id = str(uuid4())
         logger.info(
-            f"[{self.metadata.id}] Executing plan for workspace '{request.workspace}' (job: {job_id})"
+            "%s Executing plan for workspace '%s' (job: %s)",
+            self._lp,
+            request.workspace_name,
+            job_id,
         )
 
         try:
             # Submit to Celery
-            logger.debug(
-                f"[{self.metadata.id}] Submitting plan job to Celery: {job_id}"
-            )
-            execute_terraform_plan.delay(
-                job_id=job_id,
-                workspace=request.workspace,
-                variables=request.variables,
-                target=request.target,
-                destroy=request.destroy,
-            )
+            logger.debug("%s Submitting plan job to Celery: %s", self._lp, job_id)
+            self._job_signature(
+                TerraformOperationType.PLAN, job_id, request
+            ).apply_async()
 
             # Track job
-            job_info = JobInfo(
-                id=job_id,
-                operation=TerraformOperationType.PLAN,
-                status=JobStatus.PENDING,
-                workspace=request.workspace,
-                created_at=datetime.utcnow(),
-                created_by=user,
+            self._active_jobs[job_id] = self._new_job(
+                job_id, TerraformOperationType.PLAN, request.workspace_name
             )
-            self._active_jobs[job_id] = job_info
 
             # Emit event
             await self._emit_event(
@@ -411,20 +435,21 @@ class TerraformExecutorPlugin(Plugin):
                     plugin_id=self.metadata.id,
                     data={
                         "job_id": job_id,
-                        "workspace": request.workspace,
+                        "workspace": request.workspace_name,
                         "user": user,
                     },
                 )
             )
 
-            logger.info(
-                f"[{self.metadata.id}] Plan job {job_id} submitted successfully"
-            )
+            logger.info("%s Plan job %s submitted successfully", self._lp, job_id)
             return job_id
 
         except Exception as e:
             logger.error(
-                f"[{self.metadata.id}] Failed to execute plan for workspace '{request.workspace}': {e}",
+                "%s Failed to execute plan for workspace '%s': %s",
+                self._lp,
+                request.workspace_name,
+                e,
                 exc_info=True,
             )
             raise
@@ -437,32 +462,23 @@ class TerraformExecutorPlugin(Plugin):
         """Execute a Terraform apply."""
         job_id = str(uuid4())
         logger.info(
-            f"[{self.metadata.id}] Executing apply for workspace '{request.workspace}' (job: {job_id})"
+            "%s Executing apply for workspace '%s' (job: %s)",
+            self._lp,
+            request.workspace_name,
+            job_id,
         )
 
         try:
             # Submit to Celery
-            logger.debug(
-                f"[{self.metadata.id}] Submitting apply job to Celery: {job_id}"
-            )
-            execute_terraform_apply.delay(
-                job_id=job_id,
-                workspace=request.workspace,
-                plan_id=request.plan_id,
-                auto_approve=request.auto_approve,
-                target=request.target,
-            )
+            logger.debug("%s Submitting apply job to Celery: %s", self._lp, job_id)
+            self._job_signature(
+                TerraformOperationType.APPLY, job_id, request
+            ).apply_async()
 
             # Track job
-            job_info = JobInfo(
-                id=job_id,
-                operation=TerraformOperationType.APPLY,
-                status=JobStatus.PENDING,
-                workspace=request.workspace,
-                created_at=datetime.utcnow(),
-                created_by=user,
+            self._active_jobs[job_id] = self._new_job(
+                job_id, TerraformOperationType.APPLY, request.workspace_name
             )
-            self._active_jobs[job_id] = job_info
 
             # Emit event
             await self._emit_event(
@@ -471,20 +487,21 @@ class TerraformExecutorPlugin(Plugin):
                     plugin_id=self.metadata.id,
                     data={
                         "job_id": job_id,
-                        "workspace": request.workspace,
+                        "workspace": request.workspace_name,
                         "user": user,
                     },
                 )
             )
 
-            logger.info(
-                f"[{self.metadata.id}] Apply job {job_id} submitted successfully"
-            )
+            logger.info("%s Apply job %s submitted successfully", self._lp, job_id)
             return job_id
 
         except Exception as e:
             logger.error(
-                f"[{self.metadata.id}] Failed to execute apply for workspace '{request.workspace}': {e}",
+                "%s Failed to execute apply for workspace '%s': %s",
+                self._lp,
+                request.workspace_name,
+                e,
                 exc_info=True,
             )
             raise
@@ -497,31 +514,23 @@ class TerraformExecutorPlugin(Plugin):
         """Execute a Terraform destroy."""
         job_id = str(uuid4())
         logger.info(
-            f"[{self.metadata.id}] Executing destroy for workspace '{request.workspace}' (job: {job_id})"
+            "%s Executing destroy for workspace '%s' (job: %s)",
+            self._lp,
+            request.workspace_name,
+            job_id,
         )
 
         try:
             # Submit to Celery
-            logger.debug(
-                f"[{self.metadata.id}] Submitting destroy job to Celery: {job_id}"
-            )
-            execute_terraform_destroy.delay(
-                job_id=job_id,
-                workspace=request.workspace,
-                target=request.target,
-                force=request.force,
-            )
+            logger.debug("%s Submitting destroy job to Celery: %s", self._lp, job_id)
+            self._job_signature(
+                TerraformOperationType.DESTROY, job_id, request
+            ).apply_async()
 
             # Track job
-            job_info = JobInfo(
-                id=job_id,
-                operation=TerraformOperationType.DESTROY,
-                status=JobStatus.PENDING,
-                workspace=request.workspace,
-                created_at=datetime.utcnow(),
-                created_by=user,
+            self._active_jobs[job_id] = self._new_job(
+                job_id, TerraformOperationType.DESTROY, request.workspace_name
             )
-            self._active_jobs[job_id] = job_info
 
             # Emit event
             await self._emit_event(
@@ -530,47 +539,159 @@ class TerraformExecutorPlugin(Plugin):
                     plugin_id=self.metadata.id,
                     data={
                         "job_id": job_id,
-                        "workspace": request.workspace,
+                        "workspace": request.workspace_name,
                         "user": user,
                     },
                 )
             )
 
+            logger.info("%s Destroy job %s submitted successfully", self._lp, job_id)
+            return job_id
+
+        except Exception as e:
+            logger.error(
+                "%s Failed to execute destroy for workspace '%s': %s",
+                self._lp,
+                request.workspace_name,
+                e,
+                exc_info=True,
+            )
+            raise
+
+    async def execute_batch(
+        self,
+        requests: List[OperationRequest],
+        user: str = "plugin",
+    ) -> List[str]:
+        """Execute several Terraform operations with a single dispatch.
+
+        All tasks are published as one Celery group, so a burst of N jobs
+        reuses one producer connection instead of paying a broker round-trip
+        per job.
+
+        Args:
+            requests: Plan, apply and destroy requests, in submission order
+            user: User the jobs are submitted for
+
+        Returns:
+            Job IDs in the same order as ``requests``
+        """
+        submissions = [
+            (REQUEST_OPERATIONS[type(request)], str(uuid4()), request)
+            for request in requests
+        ]
+        logger.info("%s Executing batch of %s jobs", self._lp, len(submissions))
+
+        try:
+            group(
+                self._job_signature(operation, job_id, request)
+                for operation, job_id, request in submissions
+            ).apply_async()
+
+            # Track all jobs in one update, stamped with one submission time
+            created_at = datetime.utcnow()
+            self._active_jobs.update(
+                (
+                    job_id,
+                    self._new_job(
+                        job_id, operation, request.workspace_name, created_at
+                    ),
+                )
+                for operation, job_id, request in submissions
+            )
+
+            for operation, job_id, request in submissions:
+                await self._emit_event(
+                    PluginEvent(
+                        type=f"terraform.{operation.value}.started",
+                        plugin_id=self.metadata.id,
+                        data={
+                            "job_id": job_id,
+                            "workspace": request.workspace_name,
+                            "user": user,
+                        },
+                    )
+                )
+
             logger.info(
-                f"[{self.metadata.id}] Destroy job {job_id} submitted successfully"
+                "%s Batch of %s jobs submitted successfully", self._lp, len(submissions)
             )
-            return job_id
+            return [job_id for _, job_id, _ in submissions]
 
         except Exception as e:
             logger.error(
-                f"[{self.metadata.id}] Failed to execute destroy for workspace '{request.workspace}': {e}",
+                "%s Failed to execute batch of %s jobs: %s",
+                self._lp,
+                len(submissions),
+                e,
                 exc_info=True,
             )
             raise
 
+    def _job_signature(
+        self,
+        operation: TerraformOperationType,
+        job_id: str,
+        request: OperationRequest,
+    ) -> Signature:
+        """Build the Celery signature for a job, using the job ID as task ID.
+
+        Tasks are addressed by registered name, so jobs are published through
+        the plugin's own Celery app rather than the one the tasks are bound to.
+        """
+        # Same task arguments the service's own endpoints send
+        kwargs = {
+            "job_id": job_id,
+            "workspace_name": request.workspace_name,
+            "timeout": request.timeout,
+            **OPERATIONS[operation].task_kwargs(request),
+        }
+        # The monitor looks results up by job ID
+        signature = self.celery_app.signature(
+            TASK_NAMES[operation], kwargs=kwargs, task_id=job_id
+        )
+        time_limit = job_time_limit(request.timeout)
+        if time_limit:
+            signature.set(time_limit=time_limit)
+        return signature
+
+    def _new_job(
+        self,
+        job_id: str,
+        operation: TerraformOperationType,
+        workspace: str,
+        created_at: Optional[datetime] = None,
+    ) -> JobInfo:
+        """Build the tracking record for a newly submitted job."""
+        return JobInfo(
+            id=job_id,
+            operation=operation,
+            status=JobStatus.QUEUED,
+            workspace_name=workspace,
+            created_at=created_at or datetime.utcnow(),
+        )
+
     async def get_job_status(self, job_id: str) -> Optional[JobInfo]:
         """Get the status of a job."""
-        logger.debug(f"[{self.metadata.id}] Checking status for job {job_id}")
+        logger.debug("%s Checking status for job %s", self._lp, job_id)
 
         if job_id in self._active_jobs:
-            logger.debug(f"[{self.metadata.id}] Found job {job_id} in active jobs")
+            logger.debug("%s Found job %s in active jobs", self._lp, job_id)
             return self._active_jobs[job_id]
 
         # Check history
-        for job in self._execution_history:
-            if job.get("id") == job_id:
-                logger.debug(
-                    f"[{self.metadata.id}] Found job {job_id} in execution history"
-                )
-                return JobInfo(**job)
+        job = self._execution_history.get(job_id)
+        if job is not None:
+            logger.debug("%s Found job %s in execution history", self._lp, job_id)
+            return JobInfo(**job)
 
-        logger.debug(f"[{self.metadata.id}] Job {job_id} not found")
+        logger.debug("%s Job %s not found", self._lp, job_id)
         return None
 
     async def list_workspaces(self) -> List[WorkspaceInfo]:
         """List all Terraform workspaces."""
         workspace_count = len(self._workspaces)
-        logger.debug(f"[{self.metadata.id}] Listing {workspace_count} workspaces")
+        logger.debug("%s Listing %s workspaces", self._lp, workspace_count)
         return list(self._workspaces.values())
 
     async def create_workspace(
@@ -580,15 +701,11 @@ class TerraformExecutorPlugin(Plugin):
         user: str = "plugin",
     ) -> WorkspaceInfo:
         """Create a new Terraform workspace."""
-        logger.info(
-            f"[{self.metadata.id}] Creating workspace '{name}' for user '{user}'"
-        )
+        logger.info("%s Creating workspace '%s' for user '%s'", self._lp, name, user)
 
         try:
             if name in self._workspaces:
-                logger.warning(
-                    f"[{self.metadata.id}] Workspace '{name}' already exists"
-                )
+                logger.warning("%s Workspace '%s' already exists", self._lp, name)
                 return self._workspaces[name]
 
             workspace = WorkspaceInfo(
@@ -612,38 +729,42 @@ class TerraformExecutorPlugin(Plugin):
                 )
             )
 
-            logger.info(f"[{self.metadata.id}] Successfully created workspace '{name}'")
+            logger.info("%s Successfully created workspace '%s'", self._lp, name)
             return workspace
 
         except Exception as e:
             logger.error(
-                f"[{self.metadata.id}] Failed to create workspace '{name}': {e}",
+                "%s Failed to create workspace '%s': %s",
+                self._lp,
+                name,
+                e,
                 exc_info=True,
             )
             raise
 
     async def _cancel_job(self, job_id: str) -> bool:
         """Internal method to cancel a job."""
-        logger.debug(f"[{self.metadata.id}] Attempting to cancel job {job_id}")
+        logger.debug("%s Attempting to cancel job %s", self._lp, job_id)
 
         if job_id not in self._active_jobs:
-            logger.warning(
-                f"[{self.metadata.id}] Job {job_id} not found in active jobs"
-            )
+            logger.warning("%s Job %s not found in active jobs", self._lp, job_id)
             return False
 
         try:
             # Update job status
             job = self._active_jobs[job_id]
             logger.debug(
-                f"[{self.metadata.id}] Cancelling job {job_id} (operation: {job.operation.value})"
+                "%s Cancelling job %s (operation: %s)",
+                self._lp,
+                job_id,
+                job.operation.value,
             )
 
             job.status = JobStatus.CANCELLED
             job.completed_at = datetime.utcnow()
 
             # Move to history
-            self._execution_history.append(job.dict() if hasattr(job, "dict") else job)
+            self._add_to_history(job_id, job)
             del self._active_jobs[job_id]
 
             # Emit event
@@ -655,58 +776,141 @@ class TerraformExecutorPlugin(Plugin):
                 )
             )
 
-            logger.info(f"[{self.metadata.id}] Successfully cancelled job {job_id}")
+            logger.info("%s Successfully cancelled job %s", self._lp, job_id)
             return True
 
         except Exception as e:
             logger.error(
-                f"[{self.metadata.id}] Failed to cancel job {job_id}: {e}",
+                "%s Failed to cancel job %s: %s",
+                self._lp,
+                job_id,
+                e,
                 exc_info=True,
             )
             return False
 
     async def _monitor_jobs(self) -> None:
         """Monitor active jobs and update status."""
-        logger.debug(f"[{self.metadata.id}] Job monitoring task started")
+        logger.debug("%s Job monitoring task started", self._lp)
 
         while self.state == PluginState.RUNNING:
             try:
-                await self._check_active_jobs()
-                await asyncio.sleep(5)  # Check every 5 seconds
+                if self.result_client is None:
+                    # Only the Redis result backend publishes results; poll
+                    # any other backend instead
+                    await self._check_active_jobs()
+                    await asyncio.sleep(5)  # Check every 5 seconds
+                    continue
+                await self._watch_job_results()
             except Exception as e:
-                logger.error(
-                    f"[{self.metadata.id}] Error monitoring jobs: {e}", exc_info=True
-                )
+                logger.error("%s Error monitoring jobs: %s", self._lp, e, exc_info=True)
                 await asyncio.sleep(10)
 
-        logger.debug(f"[{self.metadata.id}] Job monitoring task ended")
+        logger.debug("%s Job monitoring task ended", self._lp)
+
+    async def _watch_job_results(self) -> None:
+        """Process jobs as the result backend publishes their results."""
+        loop = asyncio.get_running_loop()
+        # Results are published on their key, which honours any key prefix
+        # configured for the result backend
+        key_prefix = self.celery_app.backend.task_keyprefix
+        pubsub = self.result_client.pubsub()
+        await pubsub.psubscribe(key_prefix + b"*")
+        logger.debug("%s Watching job result channels", self._lp)
+
+        try:
+            next_sweep = loop.time()
+            while self.state == PluginState.RUNNING:
+                if loop.time() >= next_sweep:
+                    await self._check_active_jobs()
+                    next_sweep = loop.time() + RESULT_SWEEP_INTERVAL
+
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=max(next_sweep - loop.time(), 0.0),
+                )
+                if message is None:
+                    continue
+
+                # The message carries the stored result, so no read is needed
+                job_id = message["channel"][len(key_prefix) :].decode()
+                job = self._active_jobs.get(job_id)
+                if job is not None:
+                    await self._process_result(job_id, job, message["data"])
+        finally:
+            await pubsub.aclose()
 
     async def _check_active_jobs(self) -> None:
         """Check status of all active jobs."""
         active_jobs_count = len(self._active_jobs)
         if active_jobs_count > 0:
-            logger.debug(
-                f"[{self.metadata.id}] Monitoring {active_jobs_count} active jobs"
+            logger.debug("%s Monitoring %s active jobs", self._lp, active_jobs_count)
+
+        if self.result_client is not None:
+            await self._check_active_jobs_bulk()
+            return
+
+        await asyncio.gather(
+            *(
+                self._process_job(job_id, job)
+                for job_id, job in list(self._active_jobs.items())
             )
+        )
 
-        for job_id, job in list(self._active_jobs.items()):
-            await self._process_job(job_id, job)
+    async def _check_active_jobs_bulk(self) -> None:
+        """Check all active jobs with one MGET against the Redis result backend."""
+        job_ids = list(self._active_jobs)
+        if not job_ids:
+            return
+
+        # Jobs use their job ID as task ID
+        backend = self.celery_app.backend
+        payloads = await self.result_client.mget(
+            [backend.get_key_for_task(job_id) for job_id in job_ids]
+        )
+        for job_id, payload in zip(job_ids, payloads):
+            # The job may have been cancelled while waiting on Redis
+            job = self._active_jobs.get(job_id)
+            if payload is not None and job is not None:
+                await self._process_result(job_id, job, payload)
+
+    async def _process_result(self, job_id: str, job: JobInfo, payload: bytes) -> None:
+        """Complete a job from its raw result backend payload, once finished."""
+        if not self.celery_app:
+            return
+
+        meta = self.celery_app.backend.decode_result(payload)
+        if meta["status"] in states.READY_STATES:
+            await self._complete_job(
+                job_id, job, meta["status"] == states.SUCCESS, meta["result"]
+            )
 
     async def _process_job(self, job_id: str, job: JobInfo) -> None:
         """Process a single job's status check."""
         if not self.celery_app:
             return
 
+        # Backend reads block, so run them in the default executor; a ready
+        # result is cached on the AsyncResult for the calls below
         result = self.celery_app.AsyncResult(job_id)
-        if not result.ready():
+        if not await asyncio.get_running_loop().run_in_executor(None, result.ready):
             return
+        # The job may have been cancelled while the backend was read
+        if job_id not in self._active_jobs:
+            return
+
+        await self._complete_job(job_id, job, result.successful(), result.result)
 
-        logger.debug(f"[{self.metadata.id}] Job {job_id} completed, checking result")
+    async def _complete_job(
+        self, job_id: str, job: JobInfo, succeeded: bool, result: Any
+    ) -> None:
+        """Record a finished job's outcome and move it to history."""
+        logger.debug("%s Job %s completed, checking result", self._lp, job_id)
 
-        if result.successful():
+        if succeeded:
             await self._handle_successful_job(job_id, job)
         else:
-            await self._handle_failed_job(job_id, job, result.result)
+            await self._handle_failed_job(job_id, job, result)
 
         await self._finalize_job(job_id, job)
 
@@ -715,14 +919,14 @@ class TerraformExecutorPlugin(Plugin):
         job.status = JobStatus.COMPLETED
         job.completed_at = datetime.utcnow()
         self._metrics_data["jobs_succeeded"] += 1
-        logger.info(f"[{self.metadata.id}] Job {job_id} completed successfully")
+        logger.info("%s Job %s completed successfully", self._lp, job_id)
 
     async def _handle_failed_job(self, job_id: str, job: JobInfo, error: Any) -> None:
         """Handle a failed job."""
         job.status = JobStatus.FAILED
         job.completed_at = datetime.utcnow()
         self._metrics_data["jobs_failed"] += 1
-        logger.warning(f"[{self.metadata.id}] Job {job_id} failed: {error}")
+        logger.warning("%s Job %s failed: %s", self._lp, job_id, error)
 
     async def _finalize_job(self, job_id: str, job: JobInfo) -> None:
         """Finalize job processing: update metrics, history, and emit events."""
@@ -732,7 +936,7 @@ class TerraformExecutorPlugin(Plugin):
             self._metrics_data[operation_key] += 1
 
         # Move to history
-        self._execution_history.append(job.dict() if hasattr(job, "dict") else job)
+        self._add_to_history(job_id, job)
         del self._active_jobs[job_id]
 
         # Emit completion event
@@ -749,28 +953,34 @@ class TerraformExecutorPlugin(Plugin):
             )
         )
 
+    def _add_to_history(self, job_id: str, job: JobInfo) -> None:
+        """Record a finished job, dropping the oldest beyond HISTORY_LIMIT."""
+        self._execution_history[job_id] = job.model_dump()
+        self._execution_history.move_to_end(job_id)
+        if len(self._execution_history) > HISTORY_LIMIT:
+            self._execution_history.popitem(last=False)
+
     async def _register_event_handlers(self) -> None:
         """Register handlers for plugin events."""
-
-        # Handler for state lock requests
-        async def handle_state_lock(event: PluginEvent) -> None:
-            workspace = event.data.get("workspace")
-            if workspace:
-                # Implement state locking logic
-                locked = await self._lock_workspace_state(workspace)
-                await self._emit_event(
-                    PluginEvent(
-                        type="terraform.state.lock.response",
-                        plugin_id=self.metadata.id,
-                        data={"workspace": workspace, "locked": locked},
-                        correlation_id=event.correlation_id,
-                    )
-                )
-
         # Register with event bus if available
         if hasattr(self, "event_bus"):
             await self.event_bus.subscribe(
-                "terraform.state.lock.request", handle_state_lock
+                "terraform.state.lock.request", self._handle_state_lock
+            )
+
+    async def _handle_state_lock(self, event: PluginEvent) -> None:
+        """Handle a state lock request and emit the lock response."""
+        workspace = event.data.get("workspace")
+        if workspace:
+            # Implement state locking logic
+            locked = await self._lock_workspace_state(workspace)
+            await self._emit_event(
+                PluginEvent(
+                    type="terraform.state.lock.response",
+                    plugin_id=self.metadata.id,
+                    data={"workspace": workspace, "locked": locked},
+                    correlation_id=event.correlation_id,
+                )
             )
 
     async def _lock_workspace_state(self, workspace: str) -> bool:
@@ -784,41 +994,73 @@ class TerraformExecutorPlugin(Plugin):
         return False
 
     async def _init_redis(self, redis_url: str) -> Optional[Any]:
-        """Initialize Redis connection."""
+        """Initialize Redis connection over a bounded connection pool.
+
+        Once ``redis_max_connections`` connections are in use, callers wait up
+        to ``redis_pool_timeout`` seconds for one to be released instead of
+        opening more.
+        """
         try:
             import redis.asyncio as redis
 
-            return await redis.from_url(
-                redis_url, encoding="utf-8", decode_responses=True
+            pool = redis.BlockingConnectionPool.from_url(
+                redis_url,
+                max_connections=self.config.get("redis_max_connections", 32),
+                timeout=self.config.get("redis_pool_timeout", 0.5),
+                # Result payloads are msgpack, so they are read as bytes
+                decode_responses=False,
             )
+            return redis.Redis(connection_pool=pool)
         except Exception as e:
-            logger.warning(f"Could not initialize Redis: {e}")
+            logger.warning("Could not initialize Redis: %s", e)
             return None
 
+    async def _init_result_client(
+        self, redis_url: str, backend_url: str
+    ) -> Optional[Any]:
+        """Initialize the connection used to watch the Redis result backend.
+
+        Returns None when results are stored elsewhere, so jobs are polled.
+        """
+        if not isinstance(self.celery_app.backend, RedisBackend):
+            return None
+        if backend_url == redis_url:
+            return self.redis_client
+        logger.debug("%s Connecting to result backend %s", self._lp, backend_url)
+        return await self._init_redis(backend_url)
+
+    async def _close_redis(self, client: Any) -> None:
+        """Close a Redis client along with its connection pool."""
+        await client.close()
+        await client.connection_pool.disconnect()
+
     async def _emit_event(self, event: PluginEvent) -> None:
         """Emit an event to the event bus."""
-        logger.debug(f"[{self.metadata.id}] Emitting event: {event.type}")
+        logger.debug("%s Emitting event: %s", self._lp, event.type)
 
         try:
             if hasattr(self, "event_bus"):
                 await self.event_bus.emit(event)
-                logger.debug(
-                    f"[{self.metadata.id}] Event {event.type} emitted successfully"
-                )
+                logger.debug("%s Event %s emitted successfully", self._lp, event.type)
             else:
                 logger.debug(
-                    f"[{self.metadata.id}] Event bus not available, event {event.type} not emitted"
+                    "%s Event bus not available, event %s not emitted",
+                    self._lp,
+                    event.type,
                 )
 
         except Exception as e:
             logger.error(
-                f"[{self.metadata.id}] Failed to emit event {event.type}: {e}",
+                "%s Failed to emit event %s: %s",
+                self._lp,
+                event.type,
+                e,
                 exc_info=True,
             )
 
     def get_health(self) -> Dict[str, Any]:
         """Get plugin health status."""
-        logger.debug(f"[{self.metadata.id}] Getting plugin health status")
+        logger.debug("%s Getting plugin health status", self._lp)
 
         try:
             health: Dict[str, Any] = super().get_health()
@@ -832,21 +1074,24 @@ class TerraformExecutorPlugin(Plugin):
             )
 
             logger.debug(
-                f"[{self.metadata.id}] Health status: {health['status']}, "
-                f"Active jobs: {health['active_jobs']}, Workspaces: {health['workspaces']}"
+                "%s Health status: %s, Active jobs: %s, Workspaces: %s",
+                self._lp,
+                health["status"],
+                health["active_jobs"],
+                health["workspaces"],
             )
 
             return health
 
         except Exception as e:
             logger.error(
-                f"[{self.metadata.id}] Error getting health status: {e}", exc_info=True
+                "%s Error getting health status: %s", self._lp, e, exc_info=True
             )
             return {"status": "unhealthy", "error": str(e)}
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get plugin metrics."""
-        logger.debug(f"[{self.metadata.id}] Getting plugin metrics")
+        logger.debug("%s Getting plugin metrics", self._lp)
 
         try:
             metrics: Dict[str, Any] = super().get_metrics()
@@ -856,16 +1101,17 @@ class TerraformExecutorPlugin(Plugin):
             metrics["history_size"] = len(self._execution_history)
 
             logger.debug(
-                f"[{self.metadata.id}] Metrics - Jobs succeeded: {metrics.get('jobs_succeeded', 0)}, "
-                f"Jobs failed: {metrics.get('jobs_failed', 0)}, Active jobs: {metrics['active_jobs']}"
+                "%s Metrics - Jobs succeeded: %s, Jobs failed: %s, Active jobs: %s",
+                self._lp,
+                metrics.get("jobs_succeeded", 0),
+                metrics.get("jobs_failed", 0),
+                metrics["active_jobs"],
             )
 
             return metrics
 
         except Exception as e:
-            logger.error(
-                f"[{self.metadata.id}] Error getting metrics: {e}", exc_info=True
-            )
+            logger.error("%s Error getting metrics: %s", self._lp, e, exc_info=True)
             return {"error": str(e)}
 
 
@@ -1,19 +1,36 @@
 """
 Celery tasks for Terraform operations
 Async execution of Terraform commands with comprehensive error handling
+
+The tasks spend nearly all their time waiting on the Terraform CLI, so run
+workers on a green-thread pool, e.g. `celery -A tasks worker -P gevent`.
+The pool has to be given on the command line for Celery to monkey-patch the
+standard library before the tasks are imported; concurrency defaults to
+CELERY_WORKER_CONCURRENCY and can be overridden with -c.
 """
 
-from datetime import datetime
-import json
+from datetime import datetime, timezone
+import hashlib
 import os
 from pathlib import Path
+import re
+import shutil
 import subprocess  # nosec B404
-from typing import Any, Dict, List, Optional
+import tempfile
+import threading
+import time
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
 
 from celery import Celery, Task
-from models import JobStatus
+import orjson
 import structlog
 
+try:
+    from services.terraform_agent.models import JobStatus
+except ImportError:
+    # Handle running from the service directory, as `celery -A tasks` does
+    from models import JobStatus  # type: ignore[no-redef]
+
 # Configure structured logging
 structlog.configure(
     processors=[
@@ -30,22 +47,141 @@ structlog.configure(
 
 logger = structlog.get_logger(__name__)
 
-# Celery app (will be initialized by main app)
+
+def redis_url_from_env() -> str:
+    """Build the Redis URL from the REDIS_* environment variables"""
+    redis_password = os.getenv("REDIS_PASSWORD")
+    redis_host = os.getenv("REDIS_HOST", "redis")
+
+    # Handle Redis port with fallback for service env vars
+    redis_port_str = os.getenv("REDIS_PORT", "6379")
+    try:
+        # Extract just the port number if it's a full URL
+        if ":" in redis_port_str and "tcp://" in redis_port_str:
+            redis_port = int(redis_port_str.split(":")[-1])
+        else:
+            redis_port = int(redis_port_str)
+    except ValueError:
+        logger.warning(
+            f"Invalid REDIS_PORT value: {redis_port_str}, using default 6379"
+        )
+        redis_port = 6379
+
+    redis_db = int(os.getenv("REDIS_DB", "0"))
+
+    if redis_password:
+        return f"redis://:{redis_password}@{redis_host}:{redis_port}/{redis_db}"
+    return f"redis://{redis_host}:{redis_port}/{redis_db}"
+
+
+# Celery app, configured here so that the API dispatching the tasks and the
+# worker running them (`celery -A tasks worker`) share broker, serialization
+# and execution settings
 celery_app = Celery("terraform_agent")
 
+broker_url = os.getenv("CELERY_BROKER_URL") or redis_url_from_env()
+task_time_limit = int(os.getenv("CELERY_TIME_LIMIT", "3600"))  # 60 minutes
+celery_app.conf.update(
+    broker_url=broker_url,
+    result_backend=broker_url,
+    # MessagePack frames are smaller and faster to decode than JSON;
+    # JSON stays accepted for messages from older producers
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="msgpack",
+    result_accept_content=["msgpack", "json"],
+    timezone="UTC",
+    enable_utc=True,
+    task_routes={
+        "terraform_agent.tasks.*": {"queue": "terraform"},
+    },
+    # The pool itself is chosen on the worker command line (see above); green
+    # threads allow several tasks per CPU while they wait on the CLI
+    worker_concurrency=int(
+        os.getenv("CELERY_WORKER_CONCURRENCY", str(4 * (os.cpu_count() or 1)))
+    ),
+    # Long-running jobs: reserve one at a time and acknowledge only
+    # once finished, so a lost worker's job is redelivered
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    # Must outlast the hard time limit or unacked jobs are redelivered
+    # while still running
+    broker_transport_options={"visibility_timeout": task_time_limit + 100},
+    task_soft_time_limit=int(os.getenv("CELERY_SOFT_TIME_LIMIT", "1800")),  # 30 min
+    task_time_limit=task_time_limit,
+)
+
+# Digest of the configuration a workspace was last initialized with, kept in
+# the Terraform data directory so it goes away with the providers
+INIT_CHECKSUM_FILE = ".iac_checksum"
+
+# Address and version of each provider in a .terraform.lock.hcl file
+LOCKED_PROVIDER_PATTERN = re.compile(
+    r'^provider\s+"([^"]+)"\s*\{\s*version\s*=\s*"([^"]+)"', re.MULTILINE
+)
+
+# Files whose contents decide what `terraform init` installs
+INIT_INPUT_SUFFIXES = (".tf", ".tf.json", ".hcl", ".terraformrc")
+
+# Builds operation-specific task result fields from the workspace path and
+# the Terraform command result
+ResultFields = Callable[[Path, Dict[str, Any]], Dict[str, Any]]
+
+# Read size for Terraform's output pipes; plan and apply can print megabytes
+PIPE_READ_SIZE = 64 * 1024
+
+
+def drain_pipe(pipe: IO[bytes], buffer: bytearray) -> None:
+    """Read a pipe to EOF into buffer, up to PIPE_READ_SIZE bytes per read"""
+    with pipe:
+        while chunk := pipe.read1(PIPE_READ_SIZE):
+            buffer += chunk
+
 
 class TerraformTask(Task):  # type: ignore[misc]
     """Base class for Terraform tasks with common functionality"""
 
+    # Acknowledge only once finished, so a lost worker's job is redelivered
+    acks_late = True
+    reject_on_worker_lost = True
+
     def __init__(self) -> None:
         self.workspace_dir = Path("/workspace")
         self.terraform_modules_dir = Path("/terraform/modules")
+        # Environment for every Terraform run; non-interactive unless the
+        # worker's own environment says otherwise
+        self._base_env = {"TF_IN_AUTOMATION": "1", "TF_INPUT": "0", **os.environ}
+        # Shared across workspaces so a provider is downloaded once per worker
+        self.plugin_cache_dir = Path(
+            os.getenv("TF_PLUGIN_CACHE_DIR", "/var/cache/terraform/plugins")
+        )
+        self._plugin_cache_ready = False
+        # Status changes per job, keyed by job ID since one task instance
+        # runs many jobs concurrently
+        self._pending_status: Dict[str, Dict[str, Any]] = {}
 
     def update_job_status(self, job_id: str, status: JobStatus, **kwargs: Any) -> None:
-        """Update job status in the global jobs dict"""
+        """Record a job status change, written out by flush_job_status
+
+        started_at and completed_at are given as time.time_ns() values.
+        """
+        self._pending_status.setdefault(job_id, {}).update(kwargs, status=status)
+
+    def flush_job_status(self, job_id: str) -> None:
+        """Write a job's accumulated status changes as a single update"""
+        update = self._pending_status.pop(job_id, None)
+        if not update:
+            return
+        status = update.pop("status")
+        for field in ("started_at", "completed_at"):
+            if field in update:
+                update[field] = datetime.fromtimestamp(
+                    update[field] / 1e9, tz=timezone.utc
+                )
         # In a real implementation, this would update the database/redis
         # For now, we'll just log the update
-        logger.info("Job status update", job_id=job_id, status=status.value, **kwargs)
+        logger.debug("Job status update", job_id=job_id, status=status.value, **update)
 
     def setup_workspace_directory(self, workspace_name: str) -> Path:
         """Setup workspace directory for Terraform operations"""
@@ -62,46 +198,69 @@ class TerraformTask(Task):  # type: ignore[misc]
     ) -> Dict[str, Any]:
         """Execute a Terraform command with proper error handling"""
 
-        # Prepare environment
-        terraform_env = os.environ.copy()
-        if env:
-            terraform_env.update(env)
-
-        # Ensure Terraform data directory is in workspace
-        terraform_env["TF_DATA_DIR"] = str(workspace_path / ".terraform")
+        # Prepare environment; the Terraform data directory is always the
+        # workspace's own
+        terraform_env = {
+            **self._base_env,
+            **(env or {}),
+            "TF_DATA_DIR": os.path.join(workspace_path, ".terraform"),
+        }
+        if self._plugin_cache_ready:
+            terraform_env["TF_PLUGIN_CACHE_DIR"] = str(self.plugin_cache_dir)
 
         full_command = ["terraform"] + command
+        command_line = " ".join(full_command)
 
-        logger.info(
+        logger.debug(
             "Executing Terraform command",
-            command=" ".join(full_command),
+            command=command_line,
             workspace=str(workspace_path),
         )
 
         try:
             # Security: Using shell=False and explicit command list for safety
-            result = subprocess.run(  # nosec B603
+            process = subprocess.Popen(  # nosec B603
                 full_command,
                 cwd=workspace_path,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=PIPE_READ_SIZE,
                 env=terraform_env,
                 shell=False,
             )
+            # Drain both pipes concurrently so neither can fill up and stall
+            # the process; output is decoded once it is complete
+            stdout = bytearray()
+            stderr = bytearray()
+            readers = [
+                threading.Thread(target=drain_pipe, args=(process.stdout, stdout)),
+                threading.Thread(target=drain_pipe, args=(process.stderr, stderr)),
+            ]
+            for reader in readers:
+                reader.start()
+            try:
+                returncode = process.wait(timeout=timeout)
+            except BaseException:
+                # Also on a task time limit, so the readers see EOF
+                process.kill()
+                process.wait()
+                raise
+            finally:
+                for reader in readers:
+                    reader.join()
 
             return {
-                "success": result.returncode == 0,
-                "returncode": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "command": " ".join(full_command),
+                "success": returncode == 0,
+                "returncode": returncode,
+                "stdout": stdout.decode("utf-8", "replace"),
+                "stderr": stderr.decode("utf-8", "replace"),
+                "command": command_line,
             }
 
         except subprocess.TimeoutExpired:
             logger.error(
                 "Terraform command timed out",
-                command=" ".join(full_command),
+                command=command_line,
                 timeout=timeout,
             )
             return {
@@ -109,19 +268,17 @@ class TerraformTask(Task):  # type: ignore[misc]
                 "returncode": -1,
                 "stdout": "",
                 "stderr": f"Command timed out after {timeout} seconds",
-                "command": " ".join(full_command),
+                "command": command_line,
                 "error": "timeout",
             }
         except Exception as e:
-            logger.error(
-                "Terraform command failed", command=" ".join(full_command), error=str(e)
-            )
+            logger.error("Terraform command failed", command=command_line, error=str(e))
             return {
                 "success": False,
                 "returncode": -1,
                 "stdout": "",
                 "stderr": str(e),
-                "command": " ".join(full_command),
+                "command": command_line,
                 "error": "execution_failed",
             }
 
@@ -138,38 +295,163 @@ class TerraformTask(Task):  # type: ignore[misc]
             for var in variables:
                 var_data[var["name"]] = var["value"]
 
-            with open(var_file_path, "w") as f:
-                json.dump(var_data, f, indent=2)
+            content = orjson.dumps(var_data, option=orjson.OPT_INDENT_2)
+            try:
+                unchanged = var_file_path.read_bytes() == content
+            except OSError:
+                unchanged = False
+            if not unchanged:
+                # Replace atomically, so a concurrent job on the workspace
+                # never reads a partially written file
+                fd, tmp_name = tempfile.mkstemp(dir=workspace_path, prefix=".tfvars-")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(content)
+                os.replace(tmp_name, var_file_path)
 
             var_args.extend(["-var-file", str(var_file_path)])
 
         return var_args
 
+    def _sync_modules(self, src: Path, dst: Path) -> None:
+        """Mirror the src tree into dst, touching only entries that differ
+
+        Files are hard-linked where the filesystem allows it and copied
+        otherwise, so an unchanged file costs one stat instead of a copy.
+        Entries of dst that are no longer in src are removed.
+        """
+        dst.mkdir(parents=True, exist_ok=True)
+        names = set()
+        with os.scandir(src) as entries:
+            for entry in entries:
+                names.add(entry.name)
+                target = os.path.join(dst, entry.name)
+                if entry.is_dir():
+                    if os.path.lexists(target) and not os.path.isdir(target):
+                        os.unlink(target)
+                    self._sync_modules(Path(entry.path), Path(target))
+                    continue
+                src_stat = entry.stat()
+                try:
+                    dst_stat = os.stat(target)
+                except FileNotFoundError:
+                    pass
+                else:
+                    if (dst_stat.st_size, dst_stat.st_mtime_ns) == (
+                        src_stat.st_size,
+                        src_stat.st_mtime_ns,
+                    ):
+                        continue
+                    if os.path.isdir(target):
+                        shutil.rmtree(target)
+                    else:
+                        os.unlink(target)
+                try:
+                    os.link(entry.path, target)
+                except OSError:
+                    # Another filesystem, or hard links not permitted
+                    shutil.copy2(entry.path, target)
+        with os.scandir(dst) as entries:
+            for entry in entries:
+                if entry.name in names:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+
+    def _hash_tree(self, digest: Any, root: Path, skip_dirs: Tuple[str, ...]) -> None:
+        """Feed the init inputs below root into digest, in a stable order
+
+        skip_dirs names top-level directories of root to leave out.
+        """
+        for dirpath, dirnames, filenames in os.walk(root):
+            # Sort and prune in place, which is what os.walk descends into
+            if dirpath == str(root):
+                dirnames[:] = [d for d in dirnames if d not in skip_dirs]
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if not filename.endswith(INIT_INPUT_SUFFIXES):
+                    continue
+                file_path = os.path.join(dirpath, filename)
+                digest.update(os.path.relpath(file_path, root).encode())
+                with open(file_path, "rb") as f:
+                    digest.update(f.read())
+
+    def compute_workspace_checksum(self, workspace_path: Path) -> str:
+        """Digest of the configuration, lock file and modules init depends on
+
+        The workspace's modules directory is a copy of the shared modules, so
+        the shared tree is hashed instead of the copy.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        self._hash_tree(digest, workspace_path, (".terraform", "modules"))
+        if self.terraform_modules_dir.exists():
+            digest.update(b"\0modules\0")
+            self._hash_tree(digest, self.terraform_modules_dir, ())
+        return digest.hexdigest()
+
+    def is_terraform_initialized(self, workspace_path: Path) -> bool:
+        """Whether the last successful init was for the current configuration
+
+        The locked providers must also still be installed in the data
+        directory, where Terraform keeps them by address and version.
+        """
+        # Called before every operation, so plain os.path string joins
+        terraform_dir = os.path.join(workspace_path, ".terraform")
+        try:
+            with open(os.path.join(terraform_dir, INIT_CHECKSUM_FILE)) as f:
+                stored = f.read()
+        except OSError:
+            return False
+        # Every provider pinned by the lock file has to be installed
+        try:
+            with open(os.path.join(workspace_path, ".terraform.lock.hcl")) as f:
+                locked = LOCKED_PROVIDER_PATTERN.findall(f.read())
+        except FileNotFoundError:
+            locked = []
+        providers_dir = os.path.join(terraform_dir, "providers")
+        for address, version in locked:
+            if not os.path.isdir(os.path.join(providers_dir, address, version)):
+                return False
+        return stored == self.compute_workspace_checksum(workspace_path)
+
     def initialize_terraform(
         self, workspace_path: Path, timeout: int = 300
     ) -> Dict[str, Any]:
         """Initialize Terraform in the workspace"""
 
-        # Copy terraform modules if available
+        # Mirror terraform modules if available
         if self.terraform_modules_dir.exists():
-            import shutil
-
             modules_dest = workspace_path / "modules"
-            if modules_dest.exists():
-                shutil.rmtree(modules_dest)
-            shutil.copytree(self.terraform_modules_dir, modules_dest)
+            self._sync_modules(self.terraform_modules_dir, modules_dest)
             logger.info(
-                "Terraform modules copied",
+                "Terraform modules synced",
                 source=str(self.terraform_modules_dir),
                 dest=str(modules_dest),
             )
 
+        if not self._plugin_cache_ready:
+            try:
+                self.plugin_cache_dir.mkdir(parents=True, exist_ok=True)
+                self._plugin_cache_ready = True
+            except OSError as e:
+                logger.warning(
+                    "Terraform plugin cache unavailable",
+                    path=str(self.plugin_cache_dir),
+                    error=str(e),
+                )
+
         # Run terraform init
         init_result = self.run_terraform_command(
             ["init", "-no-color", "-input=false"], workspace_path, timeout=timeout
         )
 
-        if not init_result["success"]:
+        if init_result["success"]:
+            # Computed after init, which may have written the lock file
+            (workspace_path / ".terraform" / INIT_CHECKSUM_FILE).write_text(
+                self.compute_workspace_checksum(workspace_path)
+            )
+        else:
             logger.error("Terraform init failed", result=init_result)
 
         return init_result
@@ -177,22 +459,26 @@ class TerraformTask(Task):  # type: ignore[misc]
     def ensure_terraform_initialized(
         self, workspace_path: Path, job_id: str, timeout: int = 300
     ) -> Optional[Dict[str, Any]]:
-        """Ensure Terraform is initialized, return error dict if failed"""
-        terraform_dir = workspace_path / ".terraform"
-        if not terraform_dir.exists():
-            init_result = self.initialize_terraform(workspace_path, timeout)
-            if not init_result["success"]:
-                self.update_job_status(
-                    job_id,
-                    JobStatus.FAILED,
-                    error_message=f"Terraform init failed: {init_result['stderr']}",
-                    completed_at=datetime.utcnow(),
-                )
-                return {
-                    "success": False,
-                    "error": "init_failed",
-                    "details": init_result,
-                }
+        """Ensure Terraform is initialized, return error dict if failed
+
+        Init is skipped when the workspace was already initialized for the
+        same configuration.
+        """
+        if self.is_terraform_initialized(workspace_path):
+            return None
+        init_result = self.initialize_terraform(workspace_path, timeout)
+        if not init_result["success"]:
+            self.update_job_status(
+                job_id,
+                JobStatus.FAILED,
+                error_message=f"Terraform init failed: {init_result['stderr']}",
+                completed_at=time.time_ns(),
+            )
+            return {
+                "success": False,
+                "error": "init_failed",
+                "details": init_result,
+            }
         return None
 
     def prepare_apply_command(
@@ -230,8 +516,107 @@ class TerraformTask(Task):  # type: ignore[misc]
 
         return apply_command
 
+    def run_operation(
+        self,
+        job_id: str,
+        workspace_name: str,
+        operation: str,
+        build_command: Callable[[Path], List[str]],
+        timeout: int,
+        result_fields: Optional[ResultFields] = None,
+    ) -> Dict[str, Any]:
+        """Run a Terraform command as a job and record the job's outcome
+
+        Args:
+            job_id: ID of the job the command runs for
+            workspace_name: Workspace to run the command in
+            operation: Operation name used in log events and error messages
+            build_command: Builds the command arguments for the workspace path
+            timeout: Timeout in seconds for init and for the command
+            result_fields: Returns operation-specific result fields, given the
+                workspace path and the command result
+
+        Returns:
+            The task result
+        """
+        started_ns = time.time_ns()
+        self.update_job_status(job_id, JobStatus.RUNNING, started_at=started_ns)
+
+        try:
+            # Setup workspace
+            workspace_path = self.setup_workspace_directory(workspace_name)
+
+            # Ensure Terraform is initialized
+            init_error = self.ensure_terraform_initialized(
+                workspace_path, job_id, timeout
+            )
+            if init_error:
+                return init_error
+
+            command_result = self.run_terraform_command(
+                build_command(workspace_path), workspace_path, timeout
+            )
+
+            result = {
+                "success": command_result["success"],
+                "stdout": command_result["stdout"],
+                "stderr": command_result["stderr"],
+            }
+            if result_fields:
+                result.update(result_fields(workspace_path, command_result))
+
+            completed_ns = time.time_ns()
+            log_fields = {
+                "job_id": job_id,
+                "workspace": workspace_name,
+                "returncode": command_result["returncode"],
+                "duration_seconds": round((completed_ns - started_ns) / 1e9, 3),
+            }
+            if command_result["success"]:
+                self.update_job_status(
+                    job_id,
+                    JobStatus.COMPLETED,
+                    completed_at=completed_ns,
+                    result=result,
+                )
+                logger.info(
+                    f"Terraform {operation} completed successfully", **log_fields
+                )
+            else:
+                self.update_job_status(
+                    job_id,
+                    JobStatus.FAILED,
+                    error_message=(
+                        f"Terraform {operation} failed: {command_result['stderr']}"
+                    ),
+                    completed_at=completed_ns,
+                )
+                logger.error(
+                    f"Terraform {operation} failed",
+                    error=command_result["stderr"],
+                    **log_fields,
+                )
 
-@celery_app.task(bind=True, base=TerraformTask)  # type: ignore[misc]
+            return result
+
+        except Exception as e:
+            self.update_job_status(
+                job_id,
+                JobStatus.FAILED,
+                error_message=f"Unexpected error: {str(e)}",
+                completed_at=time.time_ns(),
+            )
+            logger.error(
+                f"Terraform {operation} task failed", job_id=job_id, error=str(e)
+            )
+            return {"success": False, "error": "task_failed", "details": str(e)}
+        finally:
+            self.flush_job_status(job_id)
+
+
+@celery_app.task(  # type: ignore[misc]
+    bind=True, base=TerraformTask, name="tasks.execute_terraform_plan"
+)
 def execute_terraform_plan(
     self: TerraformTask,
     job_id: str,
@@ -247,24 +632,7 @@ def execute_terraform_plan(
     target_resources = target_resources or []
     variables = variables or []
 
-    self.update_job_status(job_id, JobStatus.RUNNING, started_at=datetime.utcnow())
-
-    try:
-        # Setup workspace
-        workspace_path = self.setup_workspace_directory(workspace_name)
-
-        # Initialize Terraform
-        init_result = self.initialize_terraform(workspace_path, timeout)
-        if not init_result["success"]:
-            self.update_job_status(
-                job_id,
-                JobStatus.FAILED,
-                error_message=f"Terraform init failed: {init_result['stderr']}",
-                completed_at=datetime.utcnow(),
-            )
-            return {"success": False, "error": "init_failed", "details": init_result}
-
-        # Prepare plan command
+    def build_command(workspace_path: Path) -> List[str]:
         plan_command = ["plan", "-no-color", "-input=false"]
 
         if destroy:
@@ -282,60 +650,23 @@ def execute_terraform_plan(
         plan_command.extend(var_args)
 
         # Add plan output file
-        plan_file = workspace_path / f"plan-{job_id}.tfplan"
-        plan_command.extend(["-out", str(plan_file)])
-
-        # Execute plan
-        plan_result = self.run_terraform_command(plan_command, workspace_path, timeout)
+        plan_command.extend(["-out", str(workspace_path / f"plan-{job_id}.tfplan")])
+        return plan_command
 
-        result = {
-            "success": plan_result["success"],
-            "plan_file": str(plan_file) if plan_result["success"] else None,
-            "stdout": plan_result["stdout"],
-            "stderr": plan_result["stderr"],
-            "init_result": init_result,
-        }
-
-        if plan_result["success"]:
-            self.update_job_status(
-                job_id,
-                JobStatus.COMPLETED,
-                completed_at=datetime.utcnow(),
-                result=result,
-            )
-            logger.info(
-                "Terraform plan completed successfully",
-                job_id=job_id,
-                workspace=workspace_name,
-            )
-        else:
-            self.update_job_status(
-                job_id,
-                JobStatus.FAILED,
-                error_message=f"Terraform plan failed: {plan_result['stderr']}",
-                completed_at=datetime.utcnow(),
-            )
-            logger.error(
-                "Terraform plan failed",
-                job_id=job_id,
-                workspace=workspace_name,
-                error=plan_result["stderr"],
-            )
-
-        return result
+    def plan_fields(
+        workspace_path: Path, plan_result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        plan_file = workspace_path / f"plan-{job_id}.tfplan"
+        return {"plan_file": str(plan_file) if plan_result["success"] else None}
 
-    except Exception as e:
-        self.update_job_status(
-            job_id,
-            JobStatus.FAILED,
-            error_message=f"Unexpected error: {str(e)}",
-            completed_at=datetime.utcnow(),
-        )
-        logger.error("Terraform plan task failed", job_id=job_id, error=str(e))
-        return {"success": False, "error": "task_failed", "details": str(e)}
+    return self.run_operation(
+        job_id, workspace_name, "plan", build_command, timeout, plan_fields
+    )
 
 
-@celery_app.task(bind=True, base=TerraformTask)  # type: ignore[misc]
+@celery_app.task(  # type: ignore[misc]
+    bind=True, base=TerraformTask, name="tasks.execute_terraform_apply"
+)
 def execute_terraform_apply(
     self: TerraformTask,
     job_id: str,
@@ -351,73 +682,17 @@ def execute_terraform_apply(
     target_resources = target_resources or []
     variables = variables or []
 
-    self.update_job_status(job_id, JobStatus.RUNNING, started_at=datetime.utcnow())
-
-    try:
-        # Setup workspace
-        workspace_path = self.setup_workspace_directory(workspace_name)
-
-        # Ensure Terraform is initialized
-        init_error = self.ensure_terraform_initialized(workspace_path, job_id, timeout)
-        if init_error:
-            return init_error
-
-        # Prepare apply command
-        apply_command = self.prepare_apply_command(
+    def build_command(workspace_path: Path) -> List[str]:
+        return self.prepare_apply_command(
             auto_approve, plan_id, workspace_path, variables, target_resources
         )
 
-        # Execute apply
-        apply_result = self.run_terraform_command(
-            apply_command, workspace_path, timeout
-        )
-
-        result = {
-            "success": apply_result["success"],
-            "stdout": apply_result["stdout"],
-            "stderr": apply_result["stderr"],
-        }
-
-        if apply_result["success"]:
-            self.update_job_status(
-                job_id,
-                JobStatus.COMPLETED,
-                completed_at=datetime.utcnow(),
-                result=result,
-            )
-            logger.info(
-                "Terraform apply completed successfully",
-                job_id=job_id,
-                workspace=workspace_name,
-            )
-        else:
-            self.update_job_status(
-                job_id,
-                JobStatus.FAILED,
-                error_message=f"Terraform apply failed: {apply_result['stderr']}",
-                completed_at=datetime.utcnow(),
-            )
-            logger.error(
-                "Terraform apply failed",
-                job_id=job_id,
-                workspace=workspace_name,
-                error=apply_result["stderr"],
-            )
+    return self.run_operation(job_id, workspace_name, "apply", build_command, timeout)
 
-        return result
 
-    except Exception as e:
-        self.update_job_status(
-            job_id,
-            JobStatus.FAILED,
-            error_message=f"Unexpected error: {str(e)}",
-            completed_at=datetime.utcnow(),
-        )
-        logger.error("Terraform apply task failed", job_id=job_id, error=str(e))
-        return {"success": False, "error": "task_failed", "details": str(e)}
-
-
-@celery_app.task(bind=True, base=TerraformTask)  # type: ignore[misc]
+@celery_app.task(  # type: ignore[misc]
+    bind=True, base=TerraformTask, name="tasks.execute_terraform_destroy"
+)
 def execute_terraform_destroy(
     self: TerraformTask,
     job_id: str,
@@ -432,30 +707,7 @@ def execute_terraform_destroy(
     target_resources = target_resources or []
     variables = variables or []
 
-    self.update_job_status(job_id, JobStatus.RUNNING, started_at=datetime.utcnow())
-
-    try:
-        # Setup workspace
-        workspace_path = self.setup_workspace_directory(workspace_name)
-
-        # Initialize Terraform if needed
-        terraform_dir = workspace_path / ".terraform"
-        if not terraform_dir.exists():
-            init_result = self.initialize_terraform(workspace_path, timeout)
-            if not init_result["success"]:
-                self.update_job_status(
-                    job_id,
-                    JobStatus.FAILED,
-                    error_message=f"Terraform init failed: {init_result['stderr']}",
-                    completed_at=datetime.utcnow(),
-                )
-                return {
-                    "success": False,
-                    "error": "init_failed",
-                    "details": init_result,
-                }
-
-        # Prepare destroy command
+    def build_command(workspace_path: Path) -> List[str]:
         destroy_command = ["destroy", "-no-color", "-input=false"]
 
         if auto_approve:
@@ -469,57 +721,14 @@ def execute_terraform_destroy(
         for target in target_resources:
             destroy_command.extend(["-target", target])
 
-        # Execute destroy
-        destroy_result = self.run_terraform_command(
-            destroy_command, workspace_path, timeout
-        )
+        return destroy_command
 
-        result = {
-            "success": destroy_result["success"],
-            "stdout": destroy_result["stdout"],
-            "stderr": destroy_result["stderr"],
-        }
+    return self.run_operation(job_id, workspace_name, "destroy", build_command, timeout)
 
-        if destroy_result["success"]:
-            self.update_job_status(
-                job_id,
-                JobStatus.COMPLETED,
-                completed_at=datetime.utcnow(),
-                result=result,
-            )
-            logger.info(
-                "Terraform destroy completed successfully",
-                job_id=job_id,
-                workspace=workspace_name,
-            )
-        else:
-            self.update_job_status(
-                job_id,
-                JobStatus.FAILED,
-                error_message=f"Terraform destroy failed: {destroy_result['stderr']}",
-                completed_at=datetime.utcnow(),
-            )
-            logger.error(
-                "Terraform destroy failed",
-                job_id=job_id,
-                workspace=workspace_name,
-                error=destroy_result["stderr"],
-            )
-
-        return result
-
-    except Exception as e:
-        self.update_job_status(
-            job_id,
-            JobStatus.FAILED,
-            error_message=f"Unexpected error: {str(e)}",
-            completed_at=datetime.utcnow(),
-        )
-        logger.error("Terraform destroy task failed", job_id=job_id, error=str(e))
-        return {"success": False, "error": "task_failed", "details": str(e)}
 
-
-@celery_app.task(bind=True, base=TerraformTask)  # type: ignore[misc]
+@celery_app.task(  # type: ignore[misc]
+    bind=True, base=TerraformTask, name="tasks.execute_terraform_import"
+)
 def execute_terraform_import(
     self: TerraformTask,
     job_id: str,
@@ -533,30 +742,7 @@ def execute_terraform_import(
 
     variables = variables or []
 
-    self.update_job_status(job_id, JobStatus.RUNNING, started_at=datetime.utcnow())
-
-    try:
-        # Setup workspace
-        workspace_path = self.setup_workspace_directory(workspace_name)
-
-        # Initialize Terraform if needed
-        terraform_dir = workspace_path / ".terraform"
-        if not terraform_dir.exists():
-            init_result = self.initialize_terraform(workspace_path, timeout)
-            if not init_result["success"]:
-                self.update_job_status(
-                    job_id,
-                    JobStatus.FAILED,
-                    error_message=f"Terraform init failed: {init_result['stderr']}",
-                    completed_at=datetime.utcnow(),
-                )
-                return {
-                    "success": False,
-                    "error": "init_failed",
-                    "details": init_result,
-                }
-
-        # Prepare import command
+    def build_command(workspace_path: Path) -> List[str]:
         import_command = ["import", "-no-color", "-input=false"]
 
         # Add variables
@@ -565,61 +751,21 @@ def execute_terraform_import(
 
         # Add address and ID
         import_command.extend([address, resource_id])
+        return import_command
 
-        # Execute import
-        import_result = self.run_terraform_command(
-            import_command, workspace_path, timeout
-        )
-
-        result = {
-            "success": import_result["success"],
-            "stdout": import_result["stdout"],
-            "stderr": import_result["stderr"],
-            "imported_address": address,
-            "imported_id": resource_id,
-        }
-
-        if import_result["success"]:
-            self.update_job_status(
-                job_id,
-                JobStatus.COMPLETED,
-                completed_at=datetime.utcnow(),
-                result=result,
-            )
-            logger.info(
-                "Terraform import completed successfully",
-                job_id=job_id,
-                workspace=workspace_name,
-                address=address,
-            )
-        else:
-            self.update_job_status(
-                job_id,
-                JobStatus.FAILED,
-                error_message=f"Terraform import failed: {import_result['stderr']}",
-                completed_at=datetime.utcnow(),
-            )
-            logger.error(
-                "Terraform import failed",
-                job_id=job_id,
-                workspace=workspace_name,
-                error=import_result["stderr"],
-            )
-
-        return result
+    def import_fields(
+        workspace_path: Path, import_result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return {"imported_address": address, "imported_id": resource_id}
 
-    except Exception as e:
-        self.update_job_status(
-            job_id,
-            JobStatus.FAILED,
-            error_message=f"Unexpected error: {str(e)}",
-            completed_at=datetime.utcnow(),
-        )
-        logger.error("Terraform import task failed", job_id=job_id, error=str(e))
-        return {"success": False, "error": "task_failed", "details": str(e)}
+    return self.run_operation(
+        job_id, workspace_name, "import", build_command, timeout, import_fields
+    )
 
 
-@celery_app.task(bind=True, base=TerraformTask)  # type: ignore[misc]
+@celery_app.task(  # type: ignore[misc]
+    bind=True, base=TerraformTask, name="tasks.execute_terraform_refresh"
+)
 def execute_terraform_refresh(
     self: TerraformTask,
     job_id: str,
@@ -631,172 +777,40 @@ def execute_terraform_refresh(
 
     variables = variables or []
 
-    self.update_job_status(job_id, JobStatus.RUNNING, started_at=datetime.utcnow())
-
-    try:
-        # Setup workspace
-        workspace_path = self.setup_workspace_directory(workspace_name)
-
-        # Initialize Terraform if needed
-        terraform_dir = workspace_path / ".terraform"
-        if not terraform_dir.exists():
-            init_result = self.initialize_terraform(workspace_path, timeout)
-            if not init_result["success"]:
-                self.update_job_status(
-                    job_id,
-                    JobStatus.FAILED,
-                    error_message=f"Terraform init failed: {init_result['stderr']}",
-                    completed_at=datetime.utcnow(),
-                )
-                return {
-                    "success": False,
-                    "error": "init_failed",
-                    "details": init_result,
-                }
-
-        # Prepare refresh command
+    def build_command(workspace_path: Path) -> List[str]:
         refresh_command = ["refresh", "-no-color", "-input=false"]
 
         # Add variables
         var_args = self.prepare_variables(variables, workspace_path)
         refresh_command.extend(var_args)
+        return refresh_command
 
-        # Execute refresh
-        refresh_result = self.run_terraform_command(
-            refresh_command, workspace_path, timeout
-        )
-
-        result = {
-            "success": refresh_result["success"],
-            "stdout": refresh_result["stdout"],
-            "stderr": refresh_result["stderr"],
-        }
-
-        if refresh_result["success"]:
-            self.update_job_status(
-                job_id,
-                JobStatus.COMPLETED,
-                completed_at=datetime.utcnow(),
-                result=result,
-            )
-            logger.info(
-                "Terraform refresh completed successfully",
-                job_id=job_id,
-                workspace=workspace_name,
-            )
-        else:
-            self.update_job_status(
-                job_id,
-                JobStatus.FAILED,
-                error_message=f"Terraform refresh failed: {refresh_result['stderr']}",
-                completed_at=datetime.utcnow(),
-            )
-            logger.error(
-                "Terraform refresh failed",
-                job_id=job_id,
-                workspace=workspace_name,
-                error=refresh_result["stderr"],
-            )
-
-        return result
-
-    except Exception as e:
-        self.update_job_status(
-            job_id,
-            JobStatus.FAILED,
-            error_message=f"Unexpected error: {str(e)}",
-            completed_at=datetime.utcnow(),
-        )
-        logger.error("Terraform refresh task failed", job_id=job_id, error=str(e))
-        return {"success": False, "error": "task_failed", "details": str(e)}
+    return self.run_operation(job_id, workspace_name, "refresh", build_command, timeout)
 
 
-@celery_app.task(bind=True, base=TerraformTask)  # type: ignore[misc]
+@celery_app.task(  # type: ignore[misc]
+    bind=True, base=TerraformTask, name="tasks.execute_terraform_validate"
+)
 def execute_terraform_validate(
     self: TerraformTask, job_id: str, workspace_name: str, timeout: int = 120
 ) -> Dict[str, Any]:
     """Execute terraform validate operation"""
 
-    self.update_job_status(job_id, JobStatus.RUNNING, started_at=datetime.utcnow())
-
-    try:
-        # Setup workspace
-        workspace_path = self.setup_workspace_directory(workspace_name)
-
-        # Initialize Terraform if needed
-        terraform_dir = workspace_path / ".terraform"
-        if not terraform_dir.exists():
-            init_result = self.initialize_terraform(workspace_path, timeout)
-            if not init_result["success"]:
-                self.update_job_status(
-                    job_id,
-                    JobStatus.FAILED,
-                    error_message=f"Terraform init failed: {init_result['stderr']}",
-                    completed_at=datetime.utcnow(),
-                )
-                return {
-                    "success": False,
-                    "error": "init_failed",
-                    "details": init_result,
-                }
-
-        # Prepare validate command
-        validate_command = ["validate", "-no-color", "-json"]
-
-        # Execute validate
-        validate_result = self.run_terraform_command(
-            validate_command, workspace_path, timeout
-        )
+    def build_command(workspace_path: Path) -> List[str]:
+        return ["validate", "-no-color", "-json"]
 
+    def validation_fields(
+        workspace_path: Path, validate_result: Dict[str, Any]
+    ) -> Dict[str, Any]:
         # Parse validation results
         validation_details = {}
         if validate_result["success"] and validate_result["stdout"]:
             try:
-                validation_details = json.loads(validate_result["stdout"])
-            except json.JSONDecodeError:
+                validation_details = orjson.loads(validate_result["stdout"])
+            except orjson.JSONDecodeError:
                 logger.warning("Failed to parse validation JSON output")
+        return {"validation_details": validation_details}
 
-        result = {
-            "success": validate_result["success"],
-            "stdout": validate_result["stdout"],
-            "stderr": validate_result["stderr"],
-            "validation_details": validation_details,
-        }
-
-        if validate_result["success"]:
-            self.update_job_status(
-                job_id,
-                JobStatus.COMPLETED,
-                completed_at=datetime.utcnow(),
-                result=result,
-            )
-            logger.info(
-                "Terraform validate completed successfully",
-                job_id=job_id,
-                workspace=workspace_name,
-            )
-        else:
-            self.update_job_status(
-                job_id,
-                JobStatus.FAILED,
-                error_message=f"Terraform validate failed: {validate_result['stderr']}",
-                completed_at=datetime.utcnow(),
-            )
-            logger.error(
-                "Terraform validate failed",
-                job_id=job_id,
-                workspace=workspace_name,
-                error=validate_result["stderr"],
-            )
-
-        return result
-
-    except Exception as e:
-        self.update_job_status(
-            job_id,
-            JobStatus.FAILED,
-            error_message=f"Unexpected error: {str(e)}",
-            completed_at=datetime.utcnow(),
-        )
-        logger.error("Terraform validate task failed", job_id=job_id, error=str(e))
-        return {"success": False, "error": "task_failed", "details": str(e)}
+    return self.run_operation(
+        job_id, workspace_name, "validate", build_command, timeout, validation_fields
+    )